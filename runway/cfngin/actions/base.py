@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
 import botocore.exceptions
 
-from ..dag import ThreadedWalker, UnlimitedSemaphore, walk
+from ..dag import PooledWalker, ThreadedWalker, UnlimitedSemaphore, walk
 from ..exceptions import CfnginBucketNotFound, PlanFailed
 from ..plan import Graph, Plan, Step, merge_graphs
 from ..utils import ensure_s3_bucket, get_s3_endpoint, stack_template_key_name
@@ -35,7 +35,13 @@ LOGGER = logging.getLogger(__name__)
 STACK_POLL_TIME = int(os.environ.get("CFNGIN_STACK_POLL_TIME", 30))
 
 
-def build_walker(concurrency: int) -> Callable[..., Any]:
+def build_walker(
+    concurrency: int,
+    *,
+    critical_path: bool = False,
+    pooled: bool = False,
+    weight: Callable[[str], float] | None = None,
+) -> Callable[..., Any]:
     """Return a function for waling a graph.
 
     Passed to :class:`runway.cfngin.plan.Plan` for walking the graph.
@@ -49,8 +55,21 @@ def build_walker(concurrency: int) -> Callable[..., Any]:
     If concurrency is greater than 1, it will return a walker that will only
     execute a maximum of concurrency steps at any given time.
 
+    If pooled is True, the graph is walked by a
+    :class:`runway.cfngin.dag.PooledWalker` that dispatches steps to a bounded
+    pool of threads as their dependencies complete rather than starting a
+    thread for every step.
+
+    If critical_path is True, a pooled walker is used that starts the steps
+    with the longest chain of steps waiting on them first when concurrency
+    limits how many steps can run at once.
+
     Args:
         concurrency: Number of threads to use while walking.
+        critical_path: Prioritize steps on the critical path of the graph.
+        pooled: Use a pool of worker threads instead of a thread per step.
+        weight: Function returning the weight (e.g. expected duration) of a
+            step by name used to find the critical path.
 
     Returns:
         Function to walk a :class:`runway.cfngin.dag.DAG`.
@@ -59,6 +78,9 @@ def build_walker(concurrency: int) -> Callable[..., Any]:
     if concurrency == 1:
         return walk
 
+    if pooled or critical_path:
+        return PooledWalker(max(concurrency, 0), critical_path=critical_path, weight=weight).walk
+
     semaphore = UnlimitedSemaphore()
     if concurrency > 1:
         semaphore = threading.Semaphore(concurrency)
@@ -98,6 +120,8 @@ class BaseAction:
 
     """
 
+    _template_keys: set[str] | None
+
     DESCRIPTION: ClassVar[str] = "Base action"
     NAME: ClassVar[str | None] = None
 
@@ -131,6 +155,9 @@ class BaseAction:
         if not self.bucket_region and provider_builder:
             self.bucket_region = provider_builder.region
         self.s3_conn = self.context.s3_client
+        self._template_keys = None
+        self._template_keys_listed = False
+        self._template_keys_lock = threading.Lock()
 
     @property
     def _stack_action(self) -> Callable[..., Any]:
@@ -171,6 +198,9 @@ class BaseAction:
         except PlanFailed as err:
             LOGGER.error(str(err))
             sys.exit(1)
+        finally:
+            if self.provider_builder:
+                self.provider_builder.log_stack_cache_stats()
 
     def pre_run(self, *, dump: bool | str = False, outline: bool = False, **__kwargs: Any) -> None:
         """Perform steps before running the action."""
@@ -196,7 +226,9 @@ class BaseAction:
         """Push the rendered blueprint's template to S3.
 
         Verifies that the template doesn't already exist in S3 before
-        pushing.
+        pushing. The templates of the namespace are listed once, before the
+        first push, so that each push does not need to check for its template
+        individually.
 
         Returns:
             URL to the template in S3.
@@ -206,13 +238,7 @@ class BaseAction:
             raise ValueError("bucket_name required")
         key_name = stack_template_key_name(blueprint)
         template_url = self.stack_template_url(blueprint)
-        try:
-            template_exists = bool(self.s3_conn.head_object(Bucket=self.bucket_name, Key=key_name))
-        except botocore.exceptions.ClientError as err:
-            if err.response["Error"]["Code"] == "404":
-                template_exists = False
-            else:
-                raise
+        template_exists = self._stack_template_exists(key_name)
 
         if template_exists and not force:
             LOGGER.debug("CloudFormation template already exists: %s", template_url)
@@ -225,8 +251,61 @@ class BaseAction:
             ACL="bucket-owner-full-control",
         )
         LOGGER.debug("blueprint %s pushed to %s", blueprint.name, template_url)
+        if self._template_keys is not None:
+            self._template_keys.add(key_name)
         return template_url
 
+    def _list_stack_templates(self) -> set[str] | None:
+        """List the keys of the templates in S3 for the namespace.
+
+        Returns:
+            Keys of the templates or ``None`` if they could not be listed
+            (e.g. the bucket does not exist or listing it is not permitted)
+            or can't be told apart from the templates of other namespaces.
+
+        """
+        namespace = self.context.get_fqn()
+        if not self.bucket_name or not namespace:
+            return None
+        prefix = f"stack_templates/{namespace}{self.context.config.namespace_delimiter}"
+        keys: set[str] = set()
+        try:
+            for page in self.s3_conn.get_paginator("list_objects_v2").paginate(
+                Bucket=self.bucket_name, Prefix=prefix
+            ):
+                keys.update(obj["Key"] for obj in page.get("Contents", []) if "Key" in obj)
+        except botocore.exceptions.ClientError as err:
+            LOGGER.debug(
+                "unable to list templates in s3://%s/%s (%s); "
+                "each template will be checked individually",
+                self.bucket_name,
+                prefix,
+                err.response["Error"]["Code"],
+            )
+            return None
+        LOGGER.debug("found %s template(s) in s3://%s/%s", len(keys), self.bucket_name, prefix)
+        return keys
+
+    def _stack_template_exists(self, key_name: str) -> bool:
+        """Determine if a template already exists in S3.
+
+        Args:
+            key_name: Key of the template.
+
+        """
+        with self._template_keys_lock:
+            if not self._template_keys_listed:
+                self._template_keys = self._list_stack_templates()
+                self._template_keys_listed = True
+        if self._template_keys is not None:
+            return key_name in self._template_keys
+        try:
+            return bool(self.s3_conn.head_object(Bucket=self.bucket_name or "", Key=key_name))
+        except botocore.exceptions.ClientError as err:
+            if err.response["Error"]["Code"] == "404":
+                return False
+            raise
+
     def stack_template_url(self, blueprint: Blueprint) -> str:
         """S3 URL for CloudFormation template object."""
         if not self.bucket_name:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING, Any, Callable
 
 from ..exceptions import (
@@ -296,13 +297,18 @@ class Action(BaseAction):
 
         """
         wait_time = 0 if status is PENDING else STACK_POLL_TIME
+        poll_since = time.time()
         if self.cancel.wait(wait_time):
             return INTERRUPTED
 
         provider = self.build_provider()
 
         try:
-            stack_data = provider.get_stack(stack.fqn)
+            stack_data = (
+                provider.get_stack(stack.fqn)
+                if status is PENDING
+                else provider.poll_stack(stack.fqn, poll_since)
+            )
         except StackDoesNotExist:
             LOGGER.debug("%s:stack does not exist", stack.fqn)
             if status == SUBMITTED:
@@ -348,6 +354,7 @@ class Action(BaseAction):
 
         """
         wait_time = 0 if status is PENDING else STACK_POLL_TIME
+        poll_since = time.time()
         if self.cancel.wait(wait_time):
             return INTERRUPTED
 
@@ -357,7 +364,11 @@ class Action(BaseAction):
         provider = self.build_provider()
 
         try:
-            provider_stack = provider.get_stack(stack.fqn)
+            provider_stack = (
+                provider.get_stack(stack.fqn)
+                if status is PENDING
+                else provider.poll_stack(stack.fqn, poll_since)
+            )
         except StackDoesNotExist:
             provider_stack = None
 
@@ -591,7 +602,13 @@ class Action(BaseAction):
             plan.outline(logging.DEBUG)
             self.context.lock_persistent_graph(plan.lock_code)
             LOGGER.debug("launching stacks: %s", ", ".join(plan.keys()))
-            walker = build_walker(concurrency)
+            durations = plan.estimated_durations()
+            # without history there is no critical path to prioritize
+            walker = (
+                build_walker(concurrency, critical_path=True, weight=durations.__getitem__)
+                if durations and concurrency > 1
+                else build_walker(concurrency)
+            )
             try:
                 plan.execute(walker)
             finally:
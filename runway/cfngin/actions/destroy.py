@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING, Any, Callable
 
 from ..exceptions import StackDoesNotExist
@@ -51,13 +52,18 @@ class Action(BaseAction):
 
     def _destroy_stack(self, stack: Stack, *, status: Status | None, **_: Any) -> Status:
         wait_time = 0 if status is PENDING else STACK_POLL_TIME
+        poll_since = time.time()
         if self.cancel.wait(wait_time):
             return INTERRUPTED
 
         provider = self.build_provider()
 
         try:
-            stack_data = provider.get_stack(stack.fqn)
+            stack_data = (
+                provider.get_stack(stack.fqn)
+                if status is PENDING
+                else provider.poll_stack(stack.fqn, poll_since)
+            )
         except StackDoesNotExist:
             LOGGER.debug("%s:stack does not exist", stack.fqn)
             # Once the stack has been destroyed, it doesn't exist. If the
@@ -120,7 +126,13 @@ class Action(BaseAction):
             # steps to COMPLETE in order to log them
             plan.outline(logging.DEBUG)
             self.context.lock_persistent_graph(plan.lock_code)
-            walker = build_walker(concurrency)
+            durations = plan.estimated_durations()
+            # without history there is no critical path to prioritize
+            walker = (
+                build_walker(concurrency, critical_path=True, weight=durations.__getitem__)
+                if durations and concurrency > 1
+                else build_walker(concurrency)
+            )
             try:
                 plan.execute(walker)
             finally:
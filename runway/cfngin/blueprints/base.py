@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import copy
+import functools
 import hashlib
+import inspect
+import json
 import logging
 import string
+import sys
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from troposphere import Output, Parameter, Ref, Template
 
+from ... import __version__
 from ...compat import cached_property
 from ...mixins import DelCachedPropMixin
 from ...variables import Variable
@@ -86,6 +91,21 @@ class CFNParameter:
         return self.value
 
 
+@functools.cache
+def _module_source(module_name: str) -> str:
+    """Get the source code of a module that has been imported."""
+    return inspect.getsource(sys.modules[module_name])
+
+
+def _render_cache_default(value: Any) -> Any:
+    """Serialize resolved variable values that are not natively supported by JSON."""
+    if isinstance(value, CFNParameter):
+        return {"CFNParameter": [value.name, value.value]}
+    if hasattr(value, "to_dict"):  # troposphere objects
+        return {type(value).__name__: value.to_dict()}
+    raise TypeError(f"{type(value)} can't be used in a render cache key")
+
+
 def build_parameter(name: str, properties: BlueprintVariableTypeDef) -> Parameter:
     """Build a troposphere Parameter with the given properties.
 
@@ -329,6 +349,8 @@ class Blueprint(DelCachedPropMixin):
 
         """
         self._rendered = None
+        self._read_files = False
+        self._rendered_from_cache = False
         self._resolved_variables: dict[str, Any] | None = None
         self._version = None
         self.context = context
@@ -388,6 +410,8 @@ class Blueprint(DelCachedPropMixin):
             containing key/values for various output properties.
 
         """
+        if self._rendered_from_cache:
+            return json.loads(self.rendered).get("Outputs", {})
         return {k: output.to_dict() for k, output in self.template.outputs.items()}
 
     @cached_property
@@ -437,8 +461,8 @@ class Blueprint(DelCachedPropMixin):
     def rendered(self) -> str:
         """Return rendered blueprint."""
         if not self._rendered:
-            self._version, self._rendered = self.render_template()
-        return self._rendered
+            self._render()
+        return self._rendered  # pyright: ignore[reportReturnType]
 
     @cached_property
     def required_parameter_definitions(self) -> dict[str, BlueprintVariableTypeDef]:
@@ -460,6 +484,8 @@ class Blueprint(DelCachedPropMixin):
     @property
     def requires_change_set(self) -> bool:
         """Return true if the underlying template has transforms."""
+        if self._rendered_from_cache:
+            return "Transform" in json.loads(self.rendered)
         return self.template.transform is not None
 
     @property
@@ -498,8 +524,8 @@ class Blueprint(DelCachedPropMixin):
     def version(self) -> str:
         """Template version."""
         if not self._version:
-            self._version, self._rendered = self.render_template()
-        return self._version
+            self._render()
+        return self._version  # pyright: ignore[reportReturnType]
 
     def add_output(self, name: str, value: Any) -> None:
         """Add an output to the template.
@@ -641,6 +667,7 @@ class Blueprint(DelCachedPropMixin):
             user_data_path: Path to the userdata file.
 
         """
+        self._read_files = True
         raw_user_data = read_value_from_path(user_data_path)
         return parse_user_data(self.variables, raw_user_data, self.name)
 
@@ -659,8 +686,66 @@ class Blueprint(DelCachedPropMixin):
         """Reset template."""
         self.template = Template()
         self._rendered = None
+        self._rendered_from_cache = False
         self._version = None
 
+    def _render(self) -> None:
+        """Render the template, reusing a previous render from the render cache if possible."""
+        cache = self.context.render_cache
+        key = self._render_cache_key() if cache else None
+        if cache and key:
+            cached = cache.get(key)
+            if cached:
+                LOGGER.debug("%s:using cached template", self.name)
+                self._version, self._rendered = cached
+                self._rendered_from_cache = True
+                return
+        self._read_files = False
+        self._version, self._rendered = self.render_template()
+        self._rendered_from_cache = False
+        # files read while rendering are not part of the key
+        if cache and key and not self._read_files:
+            cache.set(key, self._version, self._rendered)
+
+    def _render_cache_key(self) -> str | None:
+        """Key used to store the rendered template in the render cache.
+
+        The key is derived from the source of the modules that define the
+        blueprint, the resolved variables, and everything else the rendered
+        template is expected to depend on.
+
+        Returns:
+            The key or ``None`` if the rendered template can't be cached.
+
+        """
+        if self.template.to_dict() != Template().to_dict():
+            return None  # template was modified outside of create_template
+        classes = [
+            cls for cls in type(self).__mro__ if cls is not object and cls is not DelCachedPropMixin
+        ]
+        if any("<locals>" in cls.__qualname__ for cls in classes):
+            return None  # can depend on values from the scope it was defined in
+        try:
+            data = json.dumps(
+                {
+                    "blueprint": [f"{cls.__module__}.{cls.__qualname__}" for cls in classes],
+                    "description": self.description,
+                    "mappings": self.mappings,
+                    "name": self.name,
+                    "namespace": self.context.namespace,
+                    "runway_version": __version__,
+                    "source": [_module_source(cls.__module__) for cls in classes],
+                    "template_indent": self.context.template_indent,
+                    "variables": self.variables,
+                },
+                default=_render_cache_default,
+                sort_keys=True,
+            )
+        except (KeyError, OSError, TypeError, UnresolvedBlueprintVariables) as exc:
+            LOGGER.debug("%s:template can't be cached: %s", self.name, exc)
+            return None
+        return hashlib.sha256(data.encode()).hexdigest()
+
     def resolve_variables(self, provided_variables: list[Variable]) -> None:
         """Resolve the values of the blueprint variables.
 
@@ -0,0 +1,104 @@
+"""Cache of rendered blueprints."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+# Maximum combined size (in bytes) of cached templates. When exceeded, the
+# least recently used templates are removed.
+DEFAULT_RENDER_CACHE_SIZE = 50 * 1024 * 1024
+
+
+class RenderCache:
+    """Rendered blueprint templates stored in a local directory.
+
+    Each entry is stored in its own file named after the key of the entry.
+    Reading an entry marks it as recently used so that the least recently
+    used entries are removed first when the cache exceeds its maximum size.
+
+    Attributes:
+        max_size: Maximum combined size (in bytes) of the cached templates.
+        path: Directory where the cache is stored.
+
+    """
+
+    max_size: int
+    path: Path
+
+    def __init__(self, path: Path, *, max_size: int = DEFAULT_RENDER_CACHE_SIZE) -> None:
+        """Instantiate class.
+
+        Args:
+            path: Directory where the cache is stored.
+            max_size: Maximum combined size (in bytes) of the cached templates.
+
+        """
+        self.max_size = max_size
+        self.path = path
+
+    def get(self, key: str) -> tuple[str, str] | None:
+        """Get a rendered template from the cache.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            Version and rendered template or ``None`` if not cached.
+
+        """
+        entry = self.path / f"{key}.json"
+        try:
+            data = json.loads(entry.read_text())
+            result = (data["version"], data["rendered"])
+            entry.touch()
+        except FileNotFoundError:
+            return None
+        except (KeyError, TypeError, ValueError):
+            LOGGER.debug("ignoring invalid render cache entry: %s", entry)
+            return None
+        return result
+
+    def set(self, key: str, version: str, rendered: str) -> None:
+        """Store a rendered template in the cache.
+
+        Args:
+            key: Key of the entry.
+            version: Version of the rendered template.
+            rendered: Rendered template.
+
+        """
+        content = json.dumps({"version": version, "rendered": rendered})
+        if len(content) > self.max_size:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        entry = self.path / f"{key}.json"
+        tmp_path = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(content)
+        tmp_path.replace(entry)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until within the maximum size."""
+        entries: list[tuple[float, int, Path]] = []
+        for entry in self.path.glob("*.json"):
+            with contextlib.suppress(FileNotFoundError):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda i: i[0]):
+            if total_size <= self.max_size:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                entry.unlink()
+                LOGGER.debug("evicted render cache entry: %s", entry.name)
+            total_size -= size
@@ -5,14 +5,16 @@ from __future__ import annotations
 import collections
 import collections.abc
 import contextlib
+import itertools
 import logging
+import queue
+import threading
 from collections import OrderedDict
-from copy import copy, deepcopy
+from copy import copy
 from threading import Thread
 from typing import TYPE_CHECKING, Any, Callable, cast
 
 if TYPE_CHECKING:
-    import threading
     from collections.abc import Iterable
 
 LOGGER = logging.getLogger(__name__)
@@ -23,14 +25,31 @@ class DAGValidationError(Exception):
 
 
 class DAG:
-    """Directed acyclic graph implementation."""
+    """Directed acyclic graph implementation.
 
-    graph: OrderedDict[str, set[str]]
+    The topological ordering of the graph and the set of nodes reachable from
+    each node are computed once and reused until the graph is modified. The
+    graph should be modified using the methods of this class (or by assigning
+    a new value to :attr:`graph`) so that they are recomputed.
+
+    """
 
     def __init__(self) -> None:
         """Instantiate a new DAG with no nodes or edges."""
+        self._index: tuple[list[str], dict[str, int]] | None = None
         self.graph = collections.OrderedDict()
 
+    @property
+    def graph(self) -> OrderedDict[str, set[str]]:
+        """Nodes of the graph mapped to the nodes they have edges towards."""
+        return self._graph
+
+    @graph.setter
+    def graph(self, value: OrderedDict[str, set[str]]) -> None:
+        """Set the value of graph."""
+        self._graph = value
+        self._index = None
+
     def add_node(self, node_name: str) -> None:
         """Add a node if it does not exist yet, or error out.
 
@@ -46,6 +65,7 @@ class DAG:
         if node_name in graph:
             raise KeyError(f"node {node_name} already exists")
         graph[node_name] = cast(set[str], set())
+        self._index = None
 
     def add_node_if_not_exists(self, node_name: str) -> None:
         """Add a node if it does not exist yet, ignoring duplicates.
@@ -75,6 +95,7 @@ class DAG:
         for edges in graph.values():
             if node_name in edges:
                 edges.remove(node_name)
+        self._index = None
 
     def delete_node_if_exists(self, node_name: str) -> None:
         """Delete this node and all edges referencing it.
@@ -106,15 +127,12 @@ class DAG:
             raise KeyError(f"independent node {ind_node} does not exist")
         if dep_node not in graph:
             raise KeyError(f"dependent node {dep_node} does not exist")
-        test_graph = deepcopy(graph)
-        test_graph[ind_node].add(dep_node)
-        test_dag = DAG()
-        test_dag.graph = test_graph
-        is_valid, message = test_dag.validate()
-        if is_valid:
-            graph[ind_node].add(dep_node)
-        else:
-            raise DAGValidationError(message)
+        # the graph is already acyclic so the edge only adds a cycle if
+        # ind_node can be reached from dep_node
+        if self._reaches(dep_node, ind_node):
+            raise DAGValidationError("graph is not acyclic")
+        graph[ind_node].add(dep_node)
+        self._index = None
 
     def delete_edge(self, ind_node: str, dep_node: str) -> None:
         """Delete an edge from the graph.
@@ -132,6 +150,7 @@ class DAG:
         if dep_node not in graph.get(ind_node, []):
             raise KeyError(f"No edge exists between {ind_node} and {dep_node}.")
         graph[ind_node].remove(dep_node)
+        self._index = None
 
     def transpose(self) -> DAG:
         """Build a new graph with the edges reversed."""
@@ -172,27 +191,25 @@ class DAG:
         See https://en.wikipedia.org/wiki/Transitive_reduction
 
         """
-        combinations: list[list[str]] = []
-        for node, edges in self.graph.items():
-            combinations += [[node, edge] for edge in edges]
-
-        while True:
-            new_combinations: list[list[str]] = []
-            for comb1 in combinations:
-                for comb2 in combinations:
-                    if comb1[-1] != comb2[0]:
-                        continue
-                    new_entry = comb1 + comb2[1:]
-                    if new_entry not in combinations:
-                        new_combinations.append(new_entry)
-            if not new_combinations:
-                break
-            combinations += new_combinations
-
-        constructed = {(c[0], c[-1]) for c in combinations if len(c) != 2}
-        for node, edges in self.graph.items():
-            bad_nodes = {e for n, e in constructed if node == n}
-            self.graph[node] = edges - bad_nodes
+        nodes = self.topological_sort()
+        index = {node: i for i, node in enumerate(nodes)}
+        # Bitset (keyed by topological index) of every node reachable from a node.
+        reachable: dict[str, int] = {}
+
+        # Nodes are visited after everything downstream of them so the
+        # reachability of each direct edge is known. Edges are checked closest
+        # first since only a node earlier in the ordering can reach a later one.
+        for node in reversed(nodes):
+            reach = 0
+            edges = self.graph[node]
+            for edge in sorted(edges, key=index.__getitem__):
+                bit = 1 << index[edge]
+                if reach & bit:
+                    edges.discard(edge)
+                else:
+                    reach |= bit | reachable[edge]
+            reachable[node] = reach
+        self._index = None
 
     def rename_edges(self, old_node_name: str, new_node_name: str) -> None:
         """Change references to a node in existing edges.
@@ -211,6 +228,7 @@ class DAG:
             elif old_node_name in edges:
                 edges.remove(old_node_name)
                 edges.add(new_node_name)
+        self._index = None
 
     def predecessors(self, node: str) -> list[str]:
         """Return a list of all immediate predecessors of the given node.
@@ -250,16 +268,38 @@ class DAG:
             A list of nodes that are downstream from the node.
 
         """
-        nodes = [node]
-        nodes_seen: set[str] = set()
-        nodes_iter = nodes
-        for node__ in nodes_iter:
-            downstreams = self.downstream(node__)
-            for downstream_node in downstreams:
-                if downstream_node not in nodes_seen:
-                    nodes_seen.add(downstream_node)
-                    nodes.append(downstream_node)
-        return [node_ for node_ in self.topological_sort() if node_ in nodes_seen]
+        if node not in self.graph:
+            raise KeyError(f"node {node} is not in graph")
+        nodes, reachable = self._reachability_index()
+        return self._nodes_from_bits(nodes, reachable[node])
+
+    def critical_path_lengths(
+        self, weight: Callable[[str], float] | None = None
+    ) -> dict[str, float]:
+        """Return the length of the longest chain of nodes that wait on each node.
+
+        When walking the graph, a node is only executed after everything
+        downstream of it. The length for a node is its own weight plus the
+        greatest length of the nodes that depend on it so the nodes with the
+        greatest lengths are those on the critical path of the walk.
+
+        Args:
+            weight: Function returning the weight (e.g. expected duration) of a
+                node. If not provided, each node has a weight of ``1``.
+
+        """
+        predecessors: dict[str, list[str]] = {node: [] for node in self.graph}
+        for node, edges in self.graph.items():
+            for edge in edges:
+                predecessors[edge].append(node)
+
+        lengths: dict[str, float] = {}
+        # nodes are sorted such that predecessors of a node are before it
+        for node in self.topological_sort():
+            lengths[node] = (weight(node) if weight else 1) + max(
+                (lengths[predecessor] for predecessor in predecessors[node]), default=0
+            )
+        return lengths
 
     def filter(self, nodes: list[str]) -> DAG:
         """Return a new DAG with only the given nodes and their dependencies.
@@ -268,19 +308,21 @@ class DAG:
             nodes: The nodes you are interested in.
 
         """
-        filtered_dag = DAG()
+        graph: OrderedDict[str, set[str]] = collections.OrderedDict()
 
         # Add only the nodes we need.
         for node in nodes:
-            filtered_dag.add_node_if_not_exists(node)
+            graph.setdefault(node, set())
             for edge in self.all_downstreams(node):
-                filtered_dag.add_node_if_not_exists(edge)
+                graph.setdefault(edge, set())
 
         # Now, rebuild the graph for each node that's present.
         for node, edges in self.graph.items():
-            if node in filtered_dag.graph:
-                filtered_dag.graph[node] = edges
+            if node in graph:
+                graph[node] = set(edges)
 
+        filtered_dag = DAG()
+        filtered_dag.graph = graph
         return filtered_dag
 
     def all_leaves(self) -> list[str]:
@@ -326,7 +368,7 @@ class DAG:
         if not self.ind_nodes():
             return (False, "no independent nodes detected")
         try:
-            self.topological_sort()
+            self._topological_sort()
         except ValueError as err:
             return False, str(err)
         return True, "valid"
@@ -334,6 +376,64 @@ class DAG:
     def topological_sort(self) -> list[str]:
         """Return a topological ordering of the DAG.
 
+        Raises:
+            ValueError: Raised if the graph is not acyclic.
+
+        """
+        return list(self._reachability_index()[0])
+
+    def _reachability_index(self) -> tuple[list[str], dict[str, int]]:
+        """Return the topological ordering of the DAG and what each node reaches.
+
+        Nodes reachable from a node are stored as a bitset keyed by the index
+        of the nodes in the topological ordering. The result is cached until
+        the graph is modified.
+
+        Raises:
+            ValueError: Raised if the graph is not acyclic.
+
+        """
+        if self._index is None:
+            nodes = self._topological_sort()
+            index = {node: i for i, node in enumerate(nodes)}
+            reachable: dict[str, int] = {}
+            # every node reachable from a node comes after it in the ordering
+            for node in reversed(nodes):
+                reach = 0
+                for edge in self.graph[node]:
+                    reach |= (1 << index[edge]) | reachable[edge]
+                reachable[node] = reach
+            self._index = (nodes, reachable)
+        return self._index
+
+    def _reaches(self, start: str, target: str) -> bool:
+        """Determine if there is a path from one node to another (or they are the same)."""
+        graph = self.graph
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node == target:
+                return True
+            for edge in graph[node]:
+                if edge not in seen:
+                    seen.add(edge)
+                    stack.append(edge)
+        return False
+
+    @staticmethod
+    def _nodes_from_bits(nodes: list[str], bits: int) -> list[str]:
+        """Return the nodes included in a bitset, in the order of ``nodes``."""
+        result: list[str] = []
+        while bits:
+            lowest = bits & -bits
+            result.append(nodes[lowest.bit_length() - 1])
+            bits ^= lowest
+        return result
+
+    def _topological_sort(self) -> list[str]:
+        """Compute a topological ordering of the DAG.
+
         Raises:
             ValueError: Raised if the graph is not acyclic.
 
@@ -457,3 +557,184 @@ class ThreadedWalker:
 
         # Wait for all threads to complete executing.
         wait_for(nodes)
+
+
+class PooledWalker:
+    """Walk a DAG as quickly as the graph topology allows, using a pool of threads.
+
+    Unlike :class:`ThreadedWalker`, a thread is not allocated to each node of
+    the graph. Nodes are placed in a ready queue as soon as all of their
+    dependencies have completed and are consumed by a bounded pool of worker
+    threads. Worker threads are only started when there is more work ready
+    than there are threads to handle it.
+
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        *,
+        critical_path: bool = False,
+        weight: Callable[[str], float] | None = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            max_workers: Maximum number of nodes that will be executed in
+                parallel. If ``0``, the number of workers is constrained only
+                by the graph topology.
+            critical_path: When more nodes are ready than there are workers
+                to execute them, execute the nodes with the longest chain of
+                nodes waiting on them first instead of the order they became
+                ready in.
+            weight: Function returning the weight (e.g. expected duration) of
+                a node used when ranking nodes by their critical path.
+
+        """
+        if max_workers < 0:
+            raise ValueError("max_workers must be greater than or equal to 0")
+        self.critical_path = critical_path
+        self.max_workers = max_workers
+        self.weight = weight
+
+    def walk(self, dag: DAG, walk_func: Callable[[str], Any]) -> None:
+        """Walk each node of the graph, in parallel if it can.
+
+        The walk_func is only called when the nodes dependencies have been
+        satisfied.
+
+        """
+        # Nodes with no dependencies first, matching the order that
+        # ThreadedWalker would start them in.
+        nodes = dag.topological_sort()
+        nodes.reverse()
+        if not nodes:
+            return
+        for node in nodes:
+            if dag.graph[node]:
+                LOGGER.debug(
+                    "%s waiting for %s to complete", node, ", ".join(sorted(dag.graph[node]))
+                )
+        priorities = (
+            {node: -length for node, length in dag.critical_path_lengths(self.weight).items()}
+            if self.critical_path
+            else dict.fromkeys(nodes, 0.0)
+        )
+        _PooledWalk(
+            dag,
+            nodes,
+            walk_func,
+            max_workers=min(self.max_workers or len(nodes), len(nodes)),
+            priorities=priorities,
+            thread_prefix=type(self).__name__,
+        ).run()
+
+
+class _PooledWalk:
+    """State of a single walk of a DAG by :class:`PooledWalker`."""
+
+    def __init__(
+        self,
+        dag: DAG,
+        nodes: list[str],
+        walk_func: Callable[[str], Any],
+        *,
+        max_workers: int,
+        priorities: dict[str, float],
+        thread_prefix: str,
+    ) -> None:
+        self.lock = threading.Lock()
+        self.max_workers = max_workers
+        self.priorities = priorities
+        self.remaining = len(nodes)
+        self.thread_prefix = thread_prefix
+        self.walk_func = walk_func
+        self.workers: list[Thread] = []
+        self.done = threading.Event()
+        # Entries are (priority, sequence, node). The sequence keeps nodes of
+        # equal priority in the order they became ready.
+        self.ready: queue.PriorityQueue[tuple[float, int, str | None]] = queue.PriorityQueue()
+        self.sequence = itertools.count()
+        self.in_flight = 0
+        # Number of dependencies that have not yet completed for each node and
+        # the reverse mapping used to find what can run once a node completes.
+        self.pending = {node: len(dag.graph[node]) for node in nodes}
+        self.dependents: dict[str, list[str]] = {node: [] for node in nodes}
+        for node in nodes:
+            for dep in dag.graph[node]:
+                self.dependents[dep].append(node)
+        self.initial = [node for node in nodes if not self.pending[node]]
+
+    def run(self) -> None:
+        """Execute every node and wait for them to complete."""
+        try:
+            with self.lock:
+                self._dispatch(self.initial)
+            self.done.wait()
+        finally:
+            self._stop_workers()
+
+    def _dispatch(self, ready_nodes: list[str]) -> None:
+        """Queue nodes that are ready to be executed.
+
+        Must be called while holding the lock. Nodes are queued highest
+        priority first so an idle worker can't start a lower priority node
+        before the rest of the nodes are queued.
+
+        """
+        for node in sorted(ready_nodes, key=self.priorities.__getitem__):
+            self.in_flight += 1
+            self.ready.put((self.priorities[node], next(self.sequence), node))
+        while len(self.workers) < min(self.max_workers, self.in_flight):
+            worker = Thread(target=self._worker, name=f"{self.thread_prefix}-{len(self.workers)}")
+            self.workers.append(worker)
+            worker.start()
+
+    def _complete(self, node: str) -> None:
+        """Queue the nodes that can be executed now that a node has completed."""
+        with self.lock:
+            self.in_flight -= 1
+            self.remaining -= 1
+            ready_nodes: list[str] = []
+            for dependent in self.dependents[node]:
+                self.pending[dependent] -= 1
+                if not self.pending[dependent]:
+                    ready_nodes.append(dependent)
+            self._dispatch(ready_nodes)
+            if not self.remaining:
+                self.done.set()
+
+    def _worker(self) -> None:
+        """Execute nodes from the ready queue until told to stop."""
+        while True:
+            _, _, node = self.ready.get()
+            if node is None:
+                return
+            LOGGER.debug("%s starting", node)
+            try:
+                self.walk_func(node)
+            except Exception:
+                LOGGER.exception("unhandled exception while walking %s", node)
+            finally:
+                self._complete(node)
+
+    def _stop_workers(self) -> None:
+        """Stop all workers after they finish their current node.
+
+        If the walk was interrupted, anything that has not been started is
+        discarded.
+
+        """
+        with self.lock:
+            # no more nodes are queued once remaining is 0 so this also stops
+            # completing nodes from queuing their dependents
+            self.remaining = 0
+            self.dependents = {node: [] for node in self.dependents}
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    self.ready.get_nowait()
+            workers = list(self.workers)
+            for _ in workers:
+                self.ready.put((0, next(self.sequence), None))
+        for worker in workers:
+            worker.join()
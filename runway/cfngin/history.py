@@ -0,0 +1,114 @@
+"""CFNgin step duration history."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import statistics
+import threading
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+
+def format_duration(seconds: float) -> str:
+    """Format a number of seconds for display (e.g. ``1h 2m 3s``).
+
+    Args:
+        seconds: Number of seconds.
+
+    """
+    minutes, secs = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes}m {secs}s"
+    if minutes:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
+
+
+class StepHistory:
+    """Durations of previous executions of steps, stored in a local file.
+
+    Durations are stored per action (name of the function run by a step) and
+    stack. Only the most recent durations of each are kept.
+
+    Attributes:
+        MAX_SAMPLES: Maximum number of durations stored per action and stack.
+        path: Path to the file where history is stored.
+
+    """
+
+    MAX_SAMPLES: ClassVar[int] = 10
+
+    path: Path
+
+    def __init__(self, path: Path) -> None:
+        """Instantiate class.
+
+        Args:
+            path: Path to the file where history is stored.
+
+        """
+        self.path = path
+        self._changed = False
+        self._data: dict[str, dict[str, list[float]]] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def data(self) -> dict[str, dict[str, list[float]]]:
+        """Durations of each stack, by action, loaded from the file."""
+        if self._data is None:
+            self._data = {}
+            if self.path.is_file():
+                try:
+                    self._data = json.loads(self.path.read_text())["durations"]
+                except (KeyError, TypeError, ValueError):
+                    LOGGER.debug("ignoring invalid step history file: %s", self.path)
+        return self._data
+
+    def add(self, action: str, stack_name: str, duration: float) -> None:
+        """Add the duration of a step.
+
+        Args:
+            action: Name of the action the step executed.
+            stack_name: Fully qualified name of the stack.
+            duration: Number of seconds the step took to complete.
+
+        """
+        with self._lock:
+            durations = self.data.setdefault(action, {}).setdefault(stack_name, [])
+            durations.append(round(duration, 3))
+            del durations[: -self.MAX_SAMPLES]
+            self._changed = True
+
+    def estimate(self, action: str, stack_name: str) -> float | None:
+        """Estimate the duration of a step from its history.
+
+        Args:
+            action: Name of the action the step executes.
+            stack_name: Fully qualified name of the stack.
+
+        Returns:
+            Median of the stored durations or ``None`` if there are none.
+
+        """
+        with self._lock:
+            durations = self.data.get(action, {}).get(stack_name)
+            return statistics.median(durations) if durations else None
+
+    def save(self) -> None:
+        """Write history to the file if it has changed."""
+        with self._lock:
+            if not self._changed:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({"durations": self.data}, indent=2, sort_keys=True))
+            tmp_path.replace(self.path)
+            self._changed = False
+            LOGGER.debug("saved step history to %s", self.path)
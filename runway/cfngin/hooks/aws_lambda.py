@@ -1081,8 +1081,7 @@ def upload_lambda_functions(  # noqa: D417
     payload_acl = cast("ObjectCannedACLType", kwargs.get("payload_acl", "private"))
 
     # Always use the global client for s3
-    session = context.get_session(region=bucket_region)
-    s3_client = session.client("s3")
+    s3_client = context.get_client("s3", region=bucket_region)
 
     ensure_s3_bucket(s3_client, bucket_name, bucket_region)
 
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 from botocore.exceptions import ClientError
 
+from ...core.providers.aws.s3 import BatchDeleter
 from ...utils import BaseModel
 
 if TYPE_CHECKING:
@@ -25,16 +26,24 @@ class PurgeBucketHookArgs(BaseModel):
 def purge_bucket(context: CfnginContext, *__args: Any, **kwargs: Any) -> bool:
     """Delete objects in bucket."""
     args = PurgeBucketHookArgs.model_validate(kwargs)
-    session = context.get_session()
-    s3_resource = session.resource("s3")
+    client = context.get_client("s3")
     try:
-        s3_resource.meta.client.head_bucket(Bucket=args.bucket_name)
+        client.head_bucket(Bucket=args.bucket_name)
     except ClientError as exc:
         if exc.response["Error"]["Code"] == "404":
             LOGGER.info('bucket "%s" does not exist; unable to complete purge', args.bucket_name)
             return True
         raise
 
-    bucket = s3_resource.Bucket(args.bucket_name)
-    bucket.object_versions.delete()
+    with BatchDeleter(client) as deleter:
+        deleter.add_all_versions(args.bucket_name)
+    for failure in deleter.failures:
+        LOGGER.warning("failed to delete %s: %s", failure.src, failure.exception)
+    if deleter.failures:
+        LOGGER.error(
+            'unable to purge bucket "%s"; %s object(s) could not be deleted',
+            args.bucket_name,
+            len(deleter.failures),
+        )
+        return False
     return True
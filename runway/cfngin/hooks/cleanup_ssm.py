@@ -24,8 +24,7 @@ def delete_param(context: CfnginContext, *__args: Any, **kwargs: Any) -> bool:
     """Delete SSM parameter."""
     args = DeleteParamHookArgs.model_validate(kwargs)
 
-    session = context.get_session()
-    ssm_client = session.client("ssm")
+    ssm_client = context.get_client("ssm")
 
     try:
         ssm_client.delete_parameter(Name=args.parameter_name)
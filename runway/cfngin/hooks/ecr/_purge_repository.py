@@ -73,7 +73,7 @@ def purge_repository(context: CfnginContext, *_args: Any, **kwargs: Any) -> dict
 
     """
     args = HookArgs.model_validate(kwargs)
-    client = context.get_session().client("ecr")
+    client: ECRClient = context.get_client("ecr")
     image_ids = list_ecr_images(client, repository_name=args.repository_name)
     if not image_ids:
         LOGGER.info("no images found in repository %s", args.repository_name)
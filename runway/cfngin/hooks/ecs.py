@@ -11,6 +11,7 @@ from typing_extensions import TypedDict
 from ...utils import BaseModel
 
 if TYPE_CHECKING:
+    from mypy_boto3_ecs.client import ECSClient
     from mypy_boto3_ecs.type_defs import CreateClusterResponseTypeDef
 
     from ...context import CfnginContext
@@ -50,7 +51,7 @@ def create_clusters(
 
     """
     args = CreateClustersHookArgs.model_validate(kwargs)
-    ecs_client = context.get_session().client("ecs")
+    ecs_client: ECSClient = context.get_client("ecs")
 
     cluster_info: dict[str, Any] = {}
     for cluster in args.clusters:
@@ -15,6 +15,7 @@ from ...utils import BaseModel
 from . import utils
 
 if TYPE_CHECKING:
+    from mypy_boto3_iam.client import IAMClient
     from mypy_boto3_iam.type_defs import (
         GetServerCertificateResponseTypeDef,
         UploadServerCertificateResponseTypeDef,
@@ -80,7 +81,7 @@ def create_ecs_service_role(context: CfnginContext, *_args: Any, **kwargs: Any)
 
     """
     args = CreateEcsServiceRoleHookArgs.model_validate(kwargs)
-    client = context.get_session().client("iam")
+    client: IAMClient = context.get_client("iam")
 
     try:
         client.create_role(
@@ -180,7 +181,7 @@ def ensure_server_cert_exists(context: CfnginContext, *_args: Any, **kwargs: Any
 
     """
     args = EnsureServerCertExistsHookArgs.model_validate(kwargs)
-    client = context.get_session().client("iam")
+    client: IAMClient = context.get_client("iam")
     status = "unknown"
     try:
         response = client.get_server_certificate(ServerCertificateName=args.cert_name)
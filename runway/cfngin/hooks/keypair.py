@@ -256,8 +256,7 @@ def ensure_keypair_exists(context: CfnginContext, *__args: Any, **kwargs: Any) -
         LOGGER.error("public_key_path and ssm_parameter_name cannot be specified at the same time")
         return {}
 
-    session = context.get_session()
-    ec2 = session.client("ec2")
+    ec2 = context.get_client("ec2")
 
     keypair_info = get_existing_key_pair(ec2, args.keypair)
     if keypair_info:
@@ -268,7 +267,7 @@ def ensure_keypair_exists(context: CfnginContext, *__args: Any, **kwargs: Any) -
             ec2, args.keypair, Path(args.public_key_path)
         )
     elif args.ssm_parameter_name:
-        ssm = session.client("ssm")
+        ssm = context.get_client("ssm")
         keypair_info = create_key_pair_in_ssm(
             ec2, ssm, args.keypair, args.ssm_parameter_name, args.ssm_key_id
         )
@@ -9,6 +9,8 @@ from ...utils import BaseModel
 from ..utils import create_route53_zone
 
 if TYPE_CHECKING:
+    from mypy_boto3_route53.client import Route53Client
+
     from ...context import CfnginContext
 
 LOGGER = logging.getLogger(__name__)
@@ -33,6 +35,6 @@ def create_domain(context: CfnginContext, *_args: Any, **kwargs: Any) -> dict[st
 
     """
     args = CreateDomainHookArgs.model_validate(kwargs)
-    client = context.get_session().client("route53")
+    client: Route53Client = context.get_client("route53")
     zone_id = create_route53_zone(client, args.domain)
     return {"domain": args.domain, "zone_id": zone_id}
@@ -151,7 +151,7 @@ class _Parameter(CfnginHookProtocol):
     @cached_property
     def client(self) -> SSMClient:
         """AWS SSM client."""
-        return self.ctx.get_session().client("ssm")
+        return self.ctx.get_client("ssm")
 
     def delete(self) -> bool:
         """Delete parameter."""
@@ -46,9 +46,8 @@ def get(context: CfnginContext, *_args: Any, **kwargs: Any) -> dict[str, Any]:
 
     """
     args = HookArgs.model_validate(kwargs)
-    session = context.get_session()
-    cloudformation_client = session.client("cloudformation")
-    cognito_client = session.client("cognito-idp")
+    cloudformation_client = context.get_client("cloudformation")
+    cognito_client = context.get_client("cognito-idp")
 
     context_dict = {"callback_urls": ["https://example.org"]}
     try:
@@ -71,8 +71,7 @@ def update(context: CfnginContext, *_args: Any, **kwargs: Any) -> bool:
 
     """
     args = HookArgs.model_validate(kwargs)
-    session = context.get_session()
-    cognito_client = session.client("cognito-idp")
+    cognito_client = context.get_client("cognito-idp")
 
     # Combine alternate domains with main distribution
     redirect_domains = [*args.alternate_domains, "https://" + args.distribution_domain]
@@ -36,8 +36,7 @@ def update(context: CfnginContext, *_args: Any, **kwargs: Any) -> dict[str, Any]
 
     """
     args = HookArgs.model_validate(kwargs)
-    session = context.get_session()
-    cognito_client = session.client("cognito-idp")
+    cognito_client = context.get_client("cognito-idp")
 
     context_dict: dict[str, Any] = {}
 
@@ -80,8 +79,7 @@ def delete(context: CfnginContext, *_args: Any, **kwargs: Any) -> dict[str, Any]
 
     """
     args = HookArgs.model_validate(kwargs)
-    session = context.get_session()
-    cognito_client = session.client("cognito-idp")
+    cognito_client = context.get_client("cognito-idp")
 
     user_pool_id = context.hook_data["aae_user_pool_id_retriever"]["id"]
     _, user_pool_hash = user_pool_id.split("_")
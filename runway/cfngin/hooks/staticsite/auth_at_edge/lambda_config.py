@@ -173,8 +173,7 @@ def write(
 
 def get_nonce_signing_secret(param_name: str, context: CfnginContext) -> str:
     """Retrieve signing secret, generating & storing it first if not present."""
-    session = context.get_session()
-    ssm_client = session.client("ssm")
+    ssm_client = context.get_client("ssm")
     try:
         response = ssm_client.get_parameter(Name=param_name, WithDecryption=True)
         return response["Parameter"].get("Value", "")
@@ -21,6 +21,8 @@ from ..base import HookArgsBaseModel
 from .utils import get_hash_of_files
 
 if TYPE_CHECKING:
+    from mypy_boto3_s3.client import S3Client
+
     from ....cfngin.providers.aws.default import Provider
     from ....context import CfnginContext
 
@@ -64,12 +66,9 @@ class HookArgs(HookArgsBaseModel):
     """Hook ``options`` block."""
 
 
-def zip_and_upload(
-    app_dir: str, bucket: str, key: str, session: boto3.Session | None = None
-) -> None:
+def zip_and_upload(app_dir: str, bucket: str, key: str, s3_client: S3Client | None = None) -> None:
     """Zip built static site and upload to S3."""
-    s3_client = session.client("s3") if session else boto3.client("s3")
-    transfer = S3Transfer(s3_client)
+    transfer = S3Transfer(s3_client or boto3.client("s3"))
 
     filedes, temp_file = tempfile.mkstemp()
     os.close(filedes)
@@ -141,7 +140,7 @@ def build(
             args.options.source_hashing.parameter or f"{context_dict['artifact_key_prefix']}hash"
         )
 
-        ssm_client = session.client("ssm")
+        ssm_client = context.get_client("ssm")
 
         try:
             old_parameter_value = ssm_client.get_parameter(
@@ -185,7 +184,7 @@ def build(
             build_output,
             context_dict["artifact_bucket_name"],
             context_dict["current_archive_filename"],
-            session,
+            context.get_client("s3"),
         )
         context_dict["app_directory"] = build_output
 
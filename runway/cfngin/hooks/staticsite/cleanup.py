@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 from ..base import HookArgsBaseModel
 
 if TYPE_CHECKING:
+    from mypy_boto3_cloudformation.client import CloudFormationClient
     from mypy_boto3_cloudformation.type_defs import OutputTypeDef
 
     from ....context import CfnginContext
@@ -65,7 +66,7 @@ def warn(context: CfnginContext, *_args: Any, **kwargs: Any) -> bool:
 
     """
     args = HookArgs.model_validate(kwargs)
-    cfn_client = context.get_session().client("cloudformation")
+    cfn_client: CloudFormationClient = context.get_client("cloudformation")
     try:
         describe_response = cfn_client.describe_stacks(
             StackName=context.namespace + context.namespace_delimiter + args.stack_relative_name
@@ -18,8 +18,6 @@ from ....utils import JsonEncoder
 from ..base import HookArgsBaseModel
 
 if TYPE_CHECKING:
-    from boto3.session import Session
-
     from ....context import CfnginContext
 
 LOGGER = logging.getLogger(__name__)
@@ -81,7 +79,6 @@ def sync(context: CfnginContext, *__args: Any, **kwargs: Any) -> bool:
 
     """
     args = HookArgs.model_validate(kwargs)
-    session = context.get_session()
     build_context = context.hook_data["staticsite"]
     invalidate_cache = False
 
@@ -103,6 +100,7 @@ def sync(context: CfnginContext, *__args: Any, **kwargs: Any) -> bool:
             build_context["app_directory"],
             delete=True,
             exclude=[f.name for f in args.extra_files if f.name],
+            manifest=True,
         )
         invalidate_cache = True
 
@@ -110,7 +108,7 @@ def sync(context: CfnginContext, *__args: Any, **kwargs: Any) -> bool:
         LOGGER.info("STATIC WEBSITE URL: %s", args.website_url)
     elif invalidate_cache:
         invalidate_distribution(
-            session,
+            context,
             identifier=args.distribution_id,
             domain=args.distribution_domain,
             path=args.distribution_path,
@@ -119,19 +117,18 @@ def sync(context: CfnginContext, *__args: Any, **kwargs: Any) -> bool:
     LOGGER.info("sync complete")
 
     if not build_context["deploy_is_current"]:
-        update_ssm_hash(context, session)
+        update_ssm_hash(context)
 
-    prune_archives(context, session)
+    prune_archives(context)
 
     return True
 
 
-def update_ssm_hash(context: CfnginContext, session: Session) -> bool:
+def update_ssm_hash(context: CfnginContext) -> bool:
     """Update the SSM hash with the new tracking data.
 
     Args:
         context: Context instance.
-        session: boto3 session.
 
     """
     build_context = context.hook_data["staticsite"]
@@ -143,7 +140,7 @@ def update_ssm_hash(context: CfnginContext, session: Session) -> bool:
         LOGGER.info("updating SSM parameter %s with hash %s", hash_param, hash_value)
 
         set_ssm_value(
-            session,
+            context,
             hash_param,
             hash_value,
             "Hash of currently deployed static website source",
@@ -153,7 +150,7 @@ def update_ssm_hash(context: CfnginContext, session: Session) -> bool:
 
 
 def invalidate_distribution(
-    session: Session,
+    context: CfnginContext,
     *,
     domain: str = "undefined",
     identifier: str,
@@ -163,14 +160,14 @@ def invalidate_distribution(
     """Invalidate the current distribution.
 
     Args:
-        session: The current CFNgin session.
+        context: The context instance.
         domain: The distribution domain.
         identifier: The distribution id.
         path: The distribution path.
 
     """
     LOGGER.info("invalidating CloudFront distribution: %s (%s)", identifier, domain)
-    cf_client = session.client("cloudfront")
+    cf_client = context.get_client("cloudfront")
     cf_client.create_invalidation(
         DistributionId=identifier,
         InvalidationBatch={
@@ -183,17 +180,16 @@ def invalidate_distribution(
     return True
 
 
-def prune_archives(context: CfnginContext, session: Session) -> bool:
+def prune_archives(context: CfnginContext) -> bool:
     """Prune the archives from the bucket.
 
     Args:
         context: The context instance.
-        session: The CFNgin session.
 
     """
     LOGGER.info("cleaning up old site archives...")
     archives: list[dict[str, Any]] = []
-    s3_client = session.client("s3")
+    s3_client = context.get_client("s3")
     list_objects_v2_paginator = s3_client.get_paginator("list_objects_v2")
     response_iterator = list_objects_v2_paginator.paginate(
         Bucket=context.hook_data["staticsite"]["artifact_bucket_name"],
@@ -318,18 +314,18 @@ def calculate_hash_of_extra_files(
     return file_hash.hexdigest()
 
 
-def get_ssm_value(session: Session, name: str) -> str | None:
+def get_ssm_value(context: CfnginContext, name: str) -> str | None:
     """Get the ssm parameter value.
 
     Args:
-        session: The boto3 session.
+        context: The context instance.
         name: The parameter name.
 
     Returns:
         The parameter value.
 
     """
-    ssm_client = session.client("ssm")
+    ssm_client = context.get_client("ssm")
 
     try:
         return ssm_client.get_parameter(Name=name)["Parameter"].get("Value")
@@ -337,17 +333,17 @@ def get_ssm_value(session: Session, name: str) -> str | None:
         return None
 
 
-def set_ssm_value(session: Session, name: str, value: Any, description: str = "") -> None:
+def set_ssm_value(context: CfnginContext, name: str, value: Any, description: str = "") -> None:
     """Set the ssm parameter.
 
     Args:
-        session: The boto3 session.
+        context: The context instance.
         name: The name of the parameter.
         value: The value of the parameter.
         description: A description of the parameter.
 
     """
-    ssm_client = session.client("ssm")
+    ssm_client = context.get_client("ssm")
 
     ssm_client.put_parameter(
         Name=name, Description=description, Value=value, Type="String", Overwrite=True
@@ -374,8 +370,7 @@ def sync_extra_files(  # noqa: C901
     if not extra_files:
         return []
 
-    session = context.get_session()
-    s3_client = session.client("s3")
+    s3_client = context.get_client("s3")
     uploaded: list[str] = []
 
     hash_param = cast(str, kwargs.get("hash_tracking_parameter", ""))
@@ -390,7 +385,7 @@ def sync_extra_files(  # noqa: C901
     if hash_param:
         hash_param = f"{hash_param}extra"
 
-        hash_old = get_ssm_value(session, hash_param)
+        hash_old = get_ssm_value(context, hash_param)
 
         # calculate hash of content
         hash_new = calculate_hash_of_extra_files(extra_files)
@@ -438,6 +433,6 @@ def sync_extra_files(  # noqa: C901
 
     if hash_new:
         LOGGER.info("updating extra files SSM parameter %s with hash %s", hash_param, hash_new)
-        set_ssm_value(session, hash_param, hash_new)
+        set_ssm_value(context, hash_param, hash_new)
 
     return uploaded
@@ -2,20 +2,38 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import operator
+import os
 import re
+import threading
+import time
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from pydantic import field_validator
 
+from ....lookups.cache import LookupCachePolicy
 from ....lookups.handlers.base import LookupHandler
 from ....utils import BaseModel
 from ...utils import read_value_from_path
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from mypy_boto3_ec2.client import EC2Client
+    from mypy_boto3_ec2.type_defs import ImageTypeDef
 
     from ....context import CfnginContext
 
+LOGGER = logging.getLogger(__name__)
+
+# Number of seconds the images returned by EC2 are cached on disk. Can be
+# controlled via an environment variable where a value of 0 disables the cache.
+DEFAULT_AMI_CACHE_TTL = 3600
+
 
 class ArgsDataModel(BaseModel):
     """Arguments data model.
@@ -58,9 +76,103 @@ class ImageNotFound(Exception):
         super().__init__(f"Unable to find ec2 image with search string: {search_string}")
 
 
+class AmiCatalog:
+    """Images returned by EC2 for a set of filters, stored in a local directory.
+
+    Only the creation date, name, and ID of each image are stored, ordered from
+    newest to oldest, so that an image can be found by name without calling EC2.
+    Catalogs are stored in a subdirectory for each region.
+
+    Attributes:
+        path: Directory where catalogs are stored.
+        ttl: Number of seconds a catalog is used for after it was created.
+
+    """
+
+    path: Path
+    ttl: float
+
+    def __init__(self, path: Path, *, ttl: float = DEFAULT_AMI_CACHE_TTL) -> None:
+        """Instantiate class.
+
+        Args:
+            path: Directory where catalogs are stored.
+            ttl: Number of seconds a catalog is used for after it was created.
+
+        """
+        self.path = path
+        self.ttl = ttl
+
+    def get(self, region: str, key: Any) -> list[list[str]] | None:
+        """Get the images of a catalog.
+
+        Args:
+            region: AWS region of the images.
+            key: Key of the catalog (e.g. arguments passed to EC2).
+
+        Returns:
+            Creation date, name, and ID of each image or ``None`` if the
+            catalog does not exist or has expired.
+
+        """
+        entry = self._entry(region, key)
+        try:
+            data = json.loads(entry.read_text())
+            if time.time() - data["created"] >= self.ttl:
+                return None
+            return data["images"]
+        except FileNotFoundError:
+            return None
+        except (KeyError, TypeError, ValueError):
+            LOGGER.debug("ignoring invalid ami catalog: %s", entry)
+            return None
+
+    def set(self, region: str, key: Any, images: Iterable[ImageTypeDef]) -> list[list[str]]:
+        """Store a catalog.
+
+        Args:
+            region: AWS region of the images.
+            key: Key of the catalog (e.g. arguments passed to EC2).
+            images: Images returned by EC2.
+
+        Returns:
+            Creation date, name, and ID of each image that was stored.
+
+        """
+        index = self.index(images)
+        entry = self._entry(region, key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps({"created": time.time(), "images": index}))
+        tmp_path.replace(entry)
+        return index
+
+    @staticmethod
+    def index(images: Iterable[ImageTypeDef]) -> list[list[str]]:
+        """Create the creation date, name, and ID of each image, ordered from newest to oldest.
+
+        Args:
+            images: Images returned by EC2.
+
+        """
+        return [
+            [image.get("CreationDate", ""), image.get("Name", ""), image["ImageId"]]
+            for image in sorted(images, key=operator.itemgetter("CreationDate"), reverse=True)
+            # sometimes we get ARI/AKI in response - these don't have a 'Name'
+            if "ImageId" in image
+        ]
+
+    def _entry(self, region: str, key: Any) -> Path:
+        """Path to the file of a catalog."""
+        return self.path / region / f"{hashlib.sha256(repr(key).encode()).hexdigest()}.json"
+
+
 class AmiLookup(LookupHandler["CfnginContext"]):
     """AMI lookup."""
 
+    CACHE_POLICY: ClassVar[LookupCachePolicy | None] = LookupCachePolicy(scope="run")
+    """How the results of the lookup are cached."""
+
     TYPE_NAME: ClassVar[str] = "ami"
     """Name that the Lookup is registered as."""
 
@@ -114,7 +226,6 @@ class AmiLookup(LookupHandler["CfnginContext"]):
         """
         query, raw_args = cls.parse_query(value)
         args = ArgsDataModel.model_validate(raw_args)
-        ec2 = context.get_session(region=args.region).client("ec2")
 
         describe_args: dict[str, Any] = {
             "Filters": [
@@ -128,16 +239,41 @@ class AmiLookup(LookupHandler["CfnginContext"]):
         if args.executable_users:
             describe_args["ExecutableUsers"] = args.executable_users
 
-        result = ec2.describe_images(**describe_args)
-
-        images = sorted(
-            result.get("Images", []),
-            key=operator.itemgetter("CreationDate"),
-            reverse=True,
-        )
-        for image in images:
-            # sometimes we get ARI/AKI in response - these don't have a 'Name'
-            if re.match(f"^{query}$", image.get("Name", "")) and "ImageId" in image:
-                return image["ImageId"]
+        for _, name, image_id in cls._get_images(context, describe_args, region=args.region):
+            if re.match(f"^{query}$", name):
+                return image_id
 
         raise ImageNotFound(value)
+
+    @classmethod
+    def _get_images(
+        cls, context: CfnginContext, describe_args: dict[str, Any], *, region: str | None = None
+    ) -> list[list[str]]:
+        """Get the creation date, name, and ID of images, ordered from newest to oldest.
+
+        Images are retrieved from the :class:`AmiCatalog` in the working directory
+        if available. The number of seconds a catalog is used for can be set
+        with the ``CFNGIN_AMI_CACHE_TTL`` environment variable. A value of ``0``
+        disables the catalog.
+
+        Args:
+            context: Context instance.
+            describe_args: Arguments passed to ``ec2.describe_images``.
+            region: AWS region.
+
+        """
+        ttl = float(os.environ.get("CFNGIN_AMI_CACHE_TTL", DEFAULT_AMI_CACHE_TTL))
+        catalog = AmiCatalog(context.work_dir / "cache" / "ami", ttl=ttl) if ttl > 0 else None
+        region = region or context.env.aws_region
+        key = (describe_args, context.env.aws_profile, context.env.vars.get("AWS_ACCESS_KEY_ID"))
+        if catalog:
+            images = catalog.get(region, key)
+            if images is not None:
+                LOGGER.debug("using ami catalog for %s", describe_args)
+                return images
+
+        ec2: EC2Client = context.get_client("ec2", region=region)
+        result = ec2.describe_images(**describe_args).get("Images", [])
+        if catalog:
+            return catalog.set(region, key, result)
+        return AmiCatalog.index(result)
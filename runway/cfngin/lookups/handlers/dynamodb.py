@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import contextlib
+import json
+import logging
 import re
+import time
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from botocore.exceptions import ClientError
@@ -13,11 +17,15 @@ from ....utils import BaseModel
 from ...utils import read_value_from_path
 
 if TYPE_CHECKING:
-    from mypy_boto3_dynamodb.type_defs import AttributeValueTypeDef
+    from collections.abc import Iterator
+
+    from mypy_boto3_dynamodb.client import DynamoDBClient
+    from mypy_boto3_dynamodb.type_defs import AttributeValueTypeDef, KeysAndAttributesTypeDef
 
     from ....context import CfnginContext
     from ....lookups.handlers.base import ParsedArgsTypeDef
 
+LOGGER = logging.getLogger(__name__)
 
 _QUERY_PATTERN = r"""(?x)  # <table_name>@<partition_key>:<partition_key_value>.<attribute>
 ^(?P<table_name>[a-zA-Z0-9\-_\.]{3,255})  # name of the DynamoDB Table
@@ -89,6 +97,12 @@ class QueryDataModel(BaseModel):
 class DynamodbLookup(LookupHandler["CfnginContext"]):
     """DynamoDB lookup."""
 
+    BATCH_SIZE: ClassVar[int] = 100
+    """Maximum number of items ``BatchGetItem`` accepts in a single call."""
+
+    MAX_BATCH_ATTEMPTS: ClassVar[int] = 5
+    """Maximum number of ``BatchGetItem`` calls made for a batch with unprocessed keys."""
+
     TYPE_NAME: ClassVar[str] = "dynamodb"
     """Name that the Lookup is registered as."""
 
@@ -163,7 +177,13 @@ class DynamodbLookup(LookupHandler["CfnginContext"]):
 
         key_dict = _lookup_key_parse(table_keys)
 
-        dynamodb = context.get_session(region=args.region).client("dynamodb")
+        prefetched = context.lookup_prefetch.get(cls.TYPE_NAME, {}).get(
+            (args.region, query.table_name, _item_key_id(query.item_key))
+        )
+        if prefetched:
+            return _get_val_from_ddb_data(prefetched, key_dict["new_keys"])
+
+        dynamodb: DynamoDBClient = context.get_client("dynamodb", region=args.region)
         try:
             response = dynamodb.get_item(
                 TableName=query.table_name,
@@ -185,6 +205,117 @@ class DynamodbLookup(LookupHandler["CfnginContext"]):
             f"The DynamoDB record could not be found using the following: {query.item_key}"
         )
 
+    @classmethod
+    @contextlib.contextmanager
+    def prefetch(cls, values: list[str], context: CfnginContext) -> Iterator[None]:
+        """Retrieve items in bulk using ``BatchGetItem``.
+
+        Items are grouped by region and retrieved in batches of :attr:`BATCH_SIZE`.
+        Each item is retrieved once with the attributes used by every lookup of it.
+        Items that could not be retrieved are left for :meth:`handle` to retrieve
+        individually.
+
+        Args:
+            values: Values passed to each ``dynamodb`` lookup about to be resolved.
+            context: The current context object.
+
+        """
+        # region -> table name -> item key ID -> (item key, attributes)
+        requests: dict[str | None, dict[str, dict[str, tuple[Any, set[str]]]]] = {}
+        for value in values:
+            try:
+                raw_query, raw_args = cls.parse(value)
+                query = cls.parse_query(raw_query)
+                item_key = query.item_key
+                attributes = _lookup_key_parse(query.attribute.split("."))["clean_table_keys"]
+            except (OSError, ValueError):
+                continue  # will be raised when the lookup is resolved
+            region = ArgsDataModel.model_validate(raw_args).region
+            table = requests.setdefault(region, {}).setdefault(query.table_name, {})
+            table.setdefault(_item_key_id(item_key), (item_key, {query.partition_key}))[1].update(
+                attributes
+            )
+
+        cache = context.lookup_prefetch.setdefault(cls.TYPE_NAME, {})
+        keys: list[tuple[str | None, str, str]] = []
+        for region, tables in requests.items():
+            pending = [
+                (table_name, item_key, attributes)
+                for table_name, items in tables.items()
+                for item_key, attributes in items.values()
+            ]
+            if len(pending) < 2:
+                continue  # nothing to gain over GetItem
+            client: DynamoDBClient = context.get_client("dynamodb", region=region)
+            for index in range(0, len(pending), cls.BATCH_SIZE):
+                batch: dict[str, KeysAndAttributesTypeDef] = {}
+                projections: dict[str, set[str]] = {}
+                for table_name, item_key, attributes in pending[index : index + cls.BATCH_SIZE]:
+                    batch.setdefault(table_name, {"Keys": []})["Keys"].append(item_key)  # type: ignore
+                    projections.setdefault(table_name, set()).update(attributes)
+                for table_name, attributes in projections.items():
+                    # placeholders allow attribute names that are reserved words
+                    names = {f"#p{i}": name for i, name in enumerate(sorted(attributes))}
+                    batch[table_name]["ExpressionAttributeNames"] = names
+                    batch[table_name]["ProjectionExpression"] = ",".join(names)
+                keys.extend(cls._batch_get_items(client, region, batch, cache))
+        try:
+            yield
+        finally:
+            for key in keys:
+                cache.pop(key, None)
+
+    @classmethod
+    def _batch_get_items(
+        cls,
+        client: DynamoDBClient,
+        region: str | None,
+        request_items: dict[str, KeysAndAttributesTypeDef],
+        cache: dict[Any, Any],
+    ) -> list[tuple[str | None, str, str]]:
+        """Get items using ``BatchGetItem``, retrying unprocessed keys.
+
+        Args:
+            client: DynamoDB client.
+            region: Region the client is for.
+            request_items: Items to get from each table.
+            cache: Where the items are stored.
+
+        Returns:
+            Keys of the items that were stored.
+
+        """
+        stored: list[tuple[str | None, str, str]] = []
+        for attempt in range(cls.MAX_BATCH_ATTEMPTS):
+            if not request_items:
+                break
+            if attempt:
+                time.sleep(min(0.05 * 2**attempt, 1))
+            try:
+                response = client.batch_get_item(RequestItems=request_items)
+            except ClientError as exc:
+                LOGGER.debug("unable to prefetch DynamoDB items: %s", exc)
+                break
+            for table_name, items in response.get("Responses", {}).items():
+                partition_keys = {attr for key in request_items[table_name]["Keys"] for attr in key}
+                for item in items:
+                    key = (
+                        region,
+                        table_name,
+                        _item_key_id({k: v for k, v in item.items() if k in partition_keys}),
+                    )
+                    cache[key] = item
+                    stored.append(key)
+            request_items = cast(
+                "dict[str, KeysAndAttributesTypeDef]", response.get("UnprocessedKeys", {})
+            )
+        return stored
+
+
+def _item_key_id(item_key: dict[str, Any]) -> str:
+    """Convert the key of a DynamoDB item into a string that can be used as a dict key."""
+    return json.dumps(item_key, sort_keys=True)
+
 
 class ParsedLookupKey(TypedDict):
     """Return value of _lookup_key_parse."""
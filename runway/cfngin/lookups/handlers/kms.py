@@ -3,19 +3,25 @@
 from __future__ import annotations
 
 import codecs
+import hashlib
 import logging
 from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, cast
 
+from ....lookups.cache import LOOKUP_CACHE_STATS, RUN_LOOKUP_CACHE, SingleFlight
 from ....lookups.handlers.base import LookupHandler
 from ....utils import DOC_SITE
 from ...utils import read_value_from_path
 
 if TYPE_CHECKING:
+    from mypy_boto3_kms.client import KMSClient
+
     from ....context import CfnginContext
     from ....lookups.handlers.base import ParsedArgsTypeDef
 
 LOGGER = logging.getLogger(__name__)
 
+_DECRYPT_CALLS = SingleFlight()
+
 
 class KmsLookup(LookupHandler["CfnginContext"]):
     """AWS KMS lookup."""
@@ -28,6 +34,50 @@ class KmsLookup(LookupHandler["CfnginContext"]):
     TYPE_NAME: ClassVar[str] = "kms"
     """Name that the Lookup is registered as."""
 
+    @classmethod
+    def decrypt(
+        cls, ciphertext: bytes, context: CfnginContext, *, region: str | None = None
+    ) -> str:
+        """Decrypt a ciphertext blob, caching the plaintext for the rest of the run.
+
+        Plaintext is only cached in memory (never written to disk) keyed by a hash
+        of the ciphertext, the region, and the AWS credentials being used.
+        Concurrent calls to decrypt the same ciphertext result in a single API call.
+
+        Args:
+            ciphertext: Ciphertext blob to decrypt.
+            context: Context instance.
+            region: AWS region of the KMS key.
+
+        """
+        key = (
+            f"{cls.__module__}.{cls.__qualname__}.decrypt",
+            hashlib.sha256(ciphertext).hexdigest(),
+            region or context.env.aws_region,
+            context.env.aws_profile,
+            context.env.vars.get("AWS_ACCESS_KEY_ID"),
+        )
+        found, plaintext = RUN_LOOKUP_CACHE.get(key)
+        LOOKUP_CACHE_STATS.record(cls.TYPE_NAME, hit=found)
+        if found:
+            return plaintext
+
+        def _decrypt() -> str:
+            found, plaintext = RUN_LOOKUP_CACHE.get(key)
+            if found:
+                return plaintext
+            kms: KMSClient = context.get_client("kms", region=region)
+            decrypted = cast(
+                "BinaryIO | bytes", kms.decrypt(CiphertextBlob=ciphertext).get("Plaintext", b"")
+            )
+            plaintext = (
+                decrypted.decode() if isinstance(decrypted, bytes) else decrypted.read().decode()
+            )
+            RUN_LOOKUP_CACHE.set(key, plaintext)
+            return plaintext
+
+        return _DECRYPT_CALLS.do(key, _decrypt)
+
     @classmethod
     def legacy_parse(cls, value: str) -> tuple[str, ParsedArgsTypeDef]:
         """Retain support for legacy lookup syntax.
@@ -55,14 +105,9 @@ class KmsLookup(LookupHandler["CfnginContext"]):
         else:
             query, args = cls.parse(value)
 
-        kms = context.get_session(region=args.get("region")).client("kms")
-
-        decrypted = cast(
-            "BinaryIO | bytes",
-            kms.decrypt(CiphertextBlob=codecs.decode(query.encode(), "base64")).get(
-                "Plaintext", b""
+        return cls.format_results(
+            cls.decrypt(
+                codecs.decode(query.encode(), "base64"), context, region=args.get("region")
             ),
+            **args,
         )
-        if isinstance(decrypted, bytes):
-            return cls.format_results(decrypted.decode(), **args)
-        return cls.format_results(decrypted.read().decode(), **args)
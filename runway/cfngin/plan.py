@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import statistics
 import threading
 import time
 import uuid
@@ -14,6 +15,7 @@ from .._logging import LogLevels, PrefixAdaptor
 from ..utils import merge_dicts
 from .dag import DAG, DAGValidationError, walk
 from .exceptions import CancelExecution, GraphError, PersistentGraphLocked, PlanFailed
+from .history import format_duration
 from .stack import Stack
 from .status import COMPLETE, FAILED, PENDING, SKIPPED, SUBMITTED, FailedStatus, SkippedStatus
 from .ui import ui
@@ -23,6 +25,7 @@ if TYPE_CHECKING:
     from collections import OrderedDict
 
     from ..context import CfnginContext
+    from .history import StepHistory
     from .providers.aws.default import Provider
     from .status import Status
 
@@ -77,6 +80,7 @@ class Step:
         logger: Logger for logging messages about the step.
         stack: the stack associated with this step
         status: The status of step.
+        submitted_at: Time when the step was first submitted.
         watch_func: Function that will be called to "tail" the step action.
 
     """
@@ -86,6 +90,7 @@ class Step:
     logger: PrefixAdaptor
     stack: Stack
     status: Status
+    submitted_at: float | None
     watch_func: Callable[..., Any] | None
 
     def __init__(
@@ -108,6 +113,7 @@ class Step:
         self.stack = stack
         self.status = PENDING
         self.last_updated = time.time()
+        self.submitted_at = None
         self.logger = PrefixAdaptor(self.stack.name, LOGGER)
         self.fn = fn
         self.watch_func = watch_func
@@ -143,6 +149,20 @@ class Step:
         self.set_status(status)
         return status
 
+    @property
+    def action_name(self) -> str | None:
+        """Name of the function run by the step."""
+        if callable(self.fn):
+            return self.fn.__name__
+        return self.fn
+
+    @property
+    def duration(self) -> float | None:
+        """Number of seconds between the step being submitted and completed."""
+        if self.completed and self.submitted_at is not None:
+            return self.last_updated - self.submitted_at
+        return None
+
     @property
     def name(self) -> str:
         """Name of the step.
@@ -207,6 +227,8 @@ class Step:
             LOGGER.debug("setting %s state to %s...", self.stack.name, status.name)
             self.status = status
             self.last_updated = time.time()
+            if status.code == SUBMITTED.code and self.submitted_at is None:
+                self.submitted_at = self.last_updated
             if self.stack.logging:
                 self.log_step()
 
@@ -624,11 +646,57 @@ class Plan:
                 '  - step: %s: target: "%s", action: "%s"',
                 steps,
                 step.name,
-                step.fn.__name__ if callable(step.fn) else step.fn,
+                step.action_name,
             )
+        estimated_duration = self.estimated_duration
+        if estimated_duration is not None:
+            LOGGER.log(level, "estimated time to complete: %s", format_duration(estimated_duration))
         if message:
             LOGGER.log(level, message)
 
+    @property
+    def history(self) -> StepHistory | None:
+        """Durations of previous executions of steps."""
+        return self.context.step_history if self.context else None
+
+    @property
+    def estimated_duration(self) -> float | None:
+        """Estimated number of seconds to execute the plan.
+
+        Calculated from the critical path of the graph, weighted by the estimated
+        duration of each step. This assumes the concurrency of the plan is not
+        limited.
+
+        """
+        durations = self.estimated_durations()
+        if not durations:
+            return None
+        return max(self.graph.dag.critical_path_lengths(durations.__getitem__).values())
+
+    def estimated_durations(self) -> dict[str, float]:
+        """Estimate the number of seconds each step will take to complete.
+
+        Steps without history use the median estimate of those that do.
+
+        Returns:
+            Estimated duration of each step by step name. Empty if no step has
+            any history.
+
+        """
+        if not self.history:
+            return {}
+        estimates = {
+            step.name: self.history.estimate(str(step.action_name), step.stack.fqn)
+            for step in self.steps
+        }
+        known = [estimate for estimate in estimates.values() if estimate is not None]
+        if not known:
+            return {}
+        default = statistics.median(known)
+        return {
+            name: default if estimate is None else estimate for name, estimate in estimates.items()
+        }
+
     def dump(
         self,
         *,
@@ -675,7 +743,11 @@ class Plan:
         """
         if self.locked and self.require_unlocked:
             raise PersistentGraphLocked
-        self.walk(*args, **kwargs)
+        try:
+            self.walk(*args, **kwargs)
+        finally:
+            if self.history:
+                self.history.save()
 
         failed_steps = [step for step in self.steps if step.status == FAILED]
         if failed_steps:
@@ -708,6 +780,7 @@ class Plan:
                     return step.ok
 
             result = step.run()
+            self._record_duration(step)
 
             if not self.context or not self.context.persistent_graph:
                 return result
@@ -715,7 +788,7 @@ class Plan:
             if step.completed or (
                 step.skipped and step.status.reason == ("does not exist in cloudformation")
             ):
-                fn_name = step.fn.__name__ if callable(step.fn) else step.fn
+                fn_name = step.action_name
                 if fn_name == "_destroy_stack":
                     self.context.persistent_graph.pop(step)
                     LOGGER.debug("removed step '%s' from the persistent graph", step.name)
@@ -731,6 +804,25 @@ class Plan:
 
         return self.graph.walk(walker, walk_func)
 
+    def _record_duration(self, step: Step) -> None:
+        """Add the duration of a completed step to the history.
+
+        Args:
+            step: :class:`Step` that has been executed.
+
+        """
+        duration = step.duration
+        if duration is None or not self.history:
+            return
+        estimate = self.history.estimate(str(step.action_name), step.stack.fqn)
+        if estimate and duration > estimate * 2:
+            step.logger.info(
+                "took %s to complete; previously took %s",
+                format_duration(duration),
+                format_duration(estimate),
+            )
+        self.history.add(str(step.action_name), step.stack.fqn, duration)
+
     @property
     def lock_code(self) -> str:
         """Code to lock/unlock the persistent graph."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import collections
 import functools
 import json
 import logging
@@ -9,11 +10,12 @@ import operator
 import sys
 import threading
 import time
-from collections.abc import Iterable
+from collections.abc import Container, Iterable
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    ClassVar,
     cast,
 )
 from urllib.parse import urlparse, urlunparse
@@ -22,6 +24,7 @@ import botocore.exceptions
 import yaml
 from botocore.config import Config
 
+from ....lookups.cache import SingleFlight
 from ....utils import DOC_SITE, JsonEncoder
 from ... import exceptions
 from ...actions.diff import DictValue, diff_parameters
@@ -74,6 +77,12 @@ MAX_ATTEMPTS = 10
 MAX_TAIL_RETRIES = 15
 TAIL_RETRY_SLEEP = 1
 GET_EVENTS_SLEEP = 1
+# Maximum number of event IDs remembered while tailing a stack. Only the most
+# recent events are needed to find where the previously seen events start.
+TAIL_SEEN_EVENTS_LIMIT = 1000
+# Number of seconds a stack description retrieved by the provider is reused
+# for rather than calling DescribeStacks again.
+STACK_CACHE_TTL = 60
 DEFAULT_CAPABILITIES = ["CAPABILITY_NAMED_IAM", "CAPABILITY_AUTO_EXPAND"]
 
 
@@ -524,6 +533,180 @@ def generate_stack_policy_args(
     return args
 
 
+class StackStatusPoller:
+    """Share ``DescribeStacks`` calls between everything polling stack status.
+
+    Rather than each step calling ``DescribeStacks`` for its own stack, the
+    first caller that needs fresh data refreshes every stack that has been
+    polled recently while other callers wait for and reuse the result. When
+    enough stacks are being polled, they are all retrieved by paginating
+    ``DescribeStacks`` without a ``StackName`` so the number of API calls
+    scales with the number of pages rather than the number of stacks.
+
+    Attributes:
+        BATCH_THRESHOLD: Minimum number of stacks being polled before listing
+            all stacks instead of describing each individually.
+        cloudformation: CloudFormation client.
+        watch_ttl: Number of seconds a stack is included in refreshes after
+            it was last polled.
+
+    """
+
+    BATCH_THRESHOLD: ClassVar[int] = 5
+
+    cloudformation: CloudFormationClient
+    watch_ttl: float
+
+    def __init__(self, cloudformation: CloudFormationClient, *, watch_ttl: float = 120) -> None:
+        """Instantiate class.
+
+        Args:
+            cloudformation: CloudFormation client.
+            watch_ttl: Number of seconds a stack is included in refreshes after
+                it was last polled.
+
+        """
+        self.cloudformation = cloudformation
+        self.watch_ttl = watch_ttl
+        self._condition = threading.Condition()
+        self._refreshing = False
+        # stack name -> (time the refresh that retrieved it started, stack data)
+        self._stacks: dict[str, tuple[float, StackTypeDef | None]] = {}
+        self._watched: dict[str, float] = {}
+
+    def get_stack(self, stack_name: str, since: float) -> StackTypeDef:
+        """Get the description of a stack retrieved after a point in time.
+
+        Args:
+            stack_name: Name of a CloudFormation Stack.
+            since: Timestamp that the data must have been requested after.
+                Any data retrieved from a refresh that started after this
+                time is returned without making an API call.
+
+        Raises:
+            StackDoesNotExist: The stack does not exist.
+
+        """
+        with self._condition:
+            self._watched[stack_name] = time.time()
+            while True:
+                cached = self._stacks.get(stack_name)
+                if cached and cached[0] >= since:
+                    if cached[1] is None:
+                        raise exceptions.StackDoesNotExist(stack_name)
+                    return cached[1]
+                if not self._refreshing:
+                    break
+                self._condition.wait()
+            self._refreshing = True
+            now = time.time()
+            self._watched = {
+                name: last for name, last in self._watched.items() if now - last < self.watch_ttl
+            }
+            stack_names = {stack_name, *self._watched}
+        try:
+            self._refresh(stack_names)
+        finally:
+            with self._condition:
+                self._refreshing = False
+                self._condition.notify_all()
+        return self.get_stack(stack_name, since)
+
+    def _refresh(self, stack_names: set[str]) -> None:
+        """Retrieve the current description of stacks.
+
+        Args:
+            stack_names: Names of the stacks that need to be retrieved.
+
+        """
+        started = time.time()
+        stacks: dict[str, StackTypeDef | None] = dict.fromkeys(stack_names)
+        if len(stack_names) < self.BATCH_THRESHOLD:
+            for stack_name in stack_names:
+                try:
+                    stacks[stack_name] = self.cloudformation.describe_stacks(StackName=stack_name)[
+                        "Stacks"
+                    ][0]
+                except botocore.exceptions.ClientError as err:
+                    if "does not exist" not in str(err):
+                        raise
+        else:
+            LOGGER.debug("listing stacks to get the status of %s stacks", len(stack_names))
+            for page in self.cloudformation.get_paginator("describe_stacks").paginate():
+                for stack in page["Stacks"]:
+                    stacks[stack["StackName"]] = stack
+        with self._condition:
+            self._stacks.update({name: (started, stack) for name, stack in stacks.items()})
+
+
+class StackDescriptionCache:
+    """Thread-safe cache of stack descriptions.
+
+    Descriptions expire after a number of seconds and are invalidated when the
+    stack is modified.
+
+    Attributes:
+        hits: Number of times a description was found in the cache.
+        misses: Number of times a description was not found in the cache.
+        ttl: Number of seconds a description is cached for.
+
+    """
+
+    hits: int
+    misses: int
+    ttl: float
+
+    def __init__(self, *, ttl: float = STACK_CACHE_TTL) -> None:
+        """Instantiate class.
+
+        Args:
+            ttl: Number of seconds a description is cached for.
+
+        """
+        self.hits = 0
+        self.misses = 0
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # stack name -> (time the description was stored, stack data)
+        self._stacks: dict[str, tuple[float, StackTypeDef]] = {}
+
+    def get(self, stack_name: str) -> StackTypeDef | None:
+        """Get the description of a stack if it is cached and has not expired.
+
+        Args:
+            stack_name: Name of a CloudFormation Stack.
+
+        """
+        with self._lock:
+            cached = self._stacks.get(stack_name)
+            if cached and time.monotonic() - cached[0] < self.ttl:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+            return None
+
+    def invalidate(self, stack_name: str) -> None:
+        """Remove the description of a stack from the cache.
+
+        Args:
+            stack_name: Name of a CloudFormation Stack.
+
+        """
+        with self._lock:
+            self._stacks.pop(stack_name, None)
+
+    def set(self, stack_name: str, stack: StackTypeDef) -> None:
+        """Store the description of a stack.
+
+        Args:
+            stack_name: Name of a CloudFormation Stack.
+            stack: Description of the stack.
+
+        """
+        with self._lock:
+            self._stacks[stack_name] = (time.monotonic(), stack)
+
+
 class ProviderBuilder:
     """Implements a Memorized ProviderBuilder for the AWS provider."""
 
@@ -561,6 +744,13 @@ class ProviderBuilder:
 
         return provider
 
+    def log_stack_cache_stats(self) -> None:
+        """Log stack description cache statistics of each provider that was built."""
+        with self.lock:
+            providers = list(self.providers.values())
+        for provider in providers:
+            provider.log_stack_cache_stats()
+
 
 class Provider(BaseProvider):
     """AWS CloudFormation Provider."""
@@ -605,10 +795,12 @@ class Provider(BaseProvider):
 
     cloudformation: CloudFormationClient
     interactive: bool
+    poller: StackStatusPoller
     recreate_failed: bool
     region: str | None
     replacements_only: bool
     service_role: str | None
+    stack_cache: StackDescriptionCache
 
     def __init__(
         self,
@@ -622,7 +814,10 @@ class Provider(BaseProvider):
     ) -> None:
         """Instantiate class."""
         self._outputs: dict[str, dict[str, str]] = {}
+        self._outputs_calls = SingleFlight()
         self.cloudformation = get_cloudformation_client(session)
+        self.poller = StackStatusPoller(self.cloudformation)
+        self.stack_cache = StackDescriptionCache()
         self.interactive = interactive
         self.recreate_failed = interactive or recreate_failed
         self.region = region
@@ -631,13 +826,49 @@ class Provider(BaseProvider):
         self.service_role = service_role
 
     def get_stack(self, stack_name: str, *_args: Any, **_kwargs: Any) -> StackTypeDef:
-        """Get stack."""
+        """Get stack.
+
+        Descriptions are cached for :data:`STACK_CACHE_TTL` seconds or until
+        the stack is modified by this provider.
+
+        """
+        cached = self.stack_cache.get(stack_name)
+        if cached is not None:
+            return cached
         try:
-            return self.cloudformation.describe_stacks(StackName=stack_name)["Stacks"][0]
+            stack = self.cloudformation.describe_stacks(StackName=stack_name)["Stacks"][0]
         except botocore.exceptions.ClientError as err:
             if "does not exist" not in str(err):
                 raise
             raise exceptions.StackDoesNotExist(stack_name) from None
+        self.stack_cache.set(stack_name, stack)
+        return stack
+
+    def log_stack_cache_stats(self) -> None:
+        """Log the number of stack descriptions retrieved from the cache."""
+        if self.stack_cache.hits or self.stack_cache.misses:
+            LOGGER.verbose(
+                "%s:stack description cache hits: %s; misses: %s",
+                self.region or "default region",
+                self.stack_cache.hits,
+                self.stack_cache.misses,
+            )
+
+    def poll_stack(self, stack_name: str, since: float) -> StackTypeDef:
+        """Get stack, sharing the API call with other stacks being polled.
+
+        Args:
+            stack_name: Name of a CloudFormation Stack.
+            since: Timestamp that the data must have been requested after.
+
+        """
+        try:
+            stack = self.poller.get_stack(stack_name, since)
+        except exceptions.StackDoesNotExist:
+            self.stack_cache.invalidate(stack_name)
+            raise
+        self.stack_cache.set(stack_name, stack)
+        return stack
 
     @staticmethod
     def get_stack_status(stack: StackTypeDef, *_args: Any, **_kwargs: Any) -> str:
@@ -834,26 +1065,67 @@ class Provider(BaseProvider):
         sleep_time: int = 5,
         include_initial: bool = True,
     ) -> None:
-        """Show and then tail the event log."""
-        # First dump the full list of events in chronological order and keep
-        # track of the events we've seen already
-        seen: set[str] = set()
-        initial_events = self.get_events(stack_name)
+        """Show and then tail the event log.
+
+        After the initial events, only events newer than those already seen
+        are retrieved. Pagination stops as soon as an event that has already
+        been seen is reached.
+
+        """
+        # Event IDs in the order they were seen so the oldest can be discarded.
+        seen: collections.OrderedDict[str, None] = collections.OrderedDict()
+
+        def _mark_seen(event: StackEventTypeDef) -> None:
+            seen[event["EventId"]] = None
+            if len(seen) > TAIL_SEEN_EVENTS_LIMIT:
+                seen.popitem(last=False)
+
+        # Dump the full list of events in chronological order if needed. If
+        # not, the most recent page is all that is needed to know what has
+        # already happened.
+        if include_initial:
+            initial_events = self.get_events(stack_name)
+        else:
+            initial_events = reversed(
+                self.cloudformation.describe_stack_events(StackName=stack_name)["StackEvents"]
+            )
         for event in initial_events:
             if include_initial:
                 log_func(event)
-            seen.add(event["EventId"])
+            _mark_seen(event)
 
         # Now keep looping through and dump the new events
         while True:
-            events = self.get_events(stack_name)
-            for event in events:
-                if event["EventId"] not in seen:
-                    log_func(event)
-                    seen.add(event["EventId"])
+            for event in self.get_new_events(stack_name, seen):
+                log_func(event)
+                _mark_seen(event)
             if cancel.wait(sleep_time):
                 return
 
+    def get_new_events(self, stack_name: str, seen: Container[str]) -> list[StackEventTypeDef]:
+        """Get the events that are newer than any that have been seen.
+
+        Args:
+            stack_name: Name of a CloudFormation Stack.
+            seen: IDs of events that have already been seen.
+
+        Returns:
+            New events in chronological order.
+
+        """
+        new_events: list[StackEventTypeDef] = []
+        kwargs: dict[str, str] = {}
+        while True:
+            response = self.cloudformation.describe_stack_events(StackName=stack_name, **kwargs)
+            for event in response["StackEvents"]:
+                if event["EventId"] in seen:
+                    return new_events[::-1]
+                new_events.append(event)
+            if "NextToken" not in response:
+                return new_events[::-1]
+            kwargs["NextToken"] = response["NextToken"]
+            time.sleep(GET_EVENTS_SLEEP)
+
     def destroy_stack(
         self,
         stack: StackTypeDef,
@@ -880,7 +1152,10 @@ class Provider(BaseProvider):
             LOGGER.info("%s:removed from the CFNgin config file; it is being destroyed", fqn)
 
         destroy_method = self.select_destroy_method(force_interactive)
-        return destroy_method(fqn=fqn, action=action, approval=approval, **kwargs)
+        try:
+            return destroy_method(fqn=fqn, action=action, approval=approval, **kwargs)
+        finally:
+            self.stack_cache.invalidate(fqn)
 
     def create_stack(
         self,
@@ -935,6 +1210,7 @@ class Provider(BaseProvider):
 
             self.cloudformation.execute_change_set(ChangeSetName=change_set_id)
             self.update_termination_protection(fqn, termination_protection)
+            self.stack_cache.invalidate(fqn)
         else:
             args = generate_cloudformation_args(
                 fqn,
@@ -966,6 +1242,7 @@ class Provider(BaseProvider):
                     )
                 else:
                     raise
+            self.stack_cache.invalidate(fqn)
 
     def select_update_method(
         self, force_interactive: bool, force_change_set: bool
@@ -1103,15 +1380,18 @@ class Provider(BaseProvider):
         update_method = self.select_update_method(force_interactive, force_change_set)
 
         self.update_termination_protection(fqn, termination_protection)
-        return update_method(
-            fqn,
-            template,
-            old_parameters,
-            parameters,
-            stack_policy=stack_policy,
-            tags=tags,
-            **kwargs,
-        )
+        try:
+            return update_method(
+                fqn,
+                template,
+                old_parameters,
+                parameters,
+                stack_policy=stack_policy,
+                tags=tags,
+                **kwargs,
+            )
+        finally:
+            self.stack_cache.invalidate(fqn)
 
     def update_termination_protection(self, fqn: str, termination_protection: bool) -> None:
         """Update a Stack's termination protection if needed.
@@ -1134,6 +1414,7 @@ class Provider(BaseProvider):
             self.cloudformation.update_termination_protection(
                 EnableTerminationProtection=termination_protection, StackName=fqn
             )
+            self.stack_cache.invalidate(fqn)
 
     def deal_with_changeset_stack_policy(
         self, fqn: str, stack_policy: Template | None = None
@@ -1404,11 +1685,22 @@ class Provider(BaseProvider):
         return stack.get("Tags", [])
 
     def get_outputs(self, stack_name: str, *_args: Any, **_kwargs: Any) -> dict[str, str]:
-        """Get stack outputs."""
-        if not self._outputs.get(stack_name):
-            stack = self.get_stack(stack_name)
-            self._outputs[stack_name] = get_output_dict(stack)
-        return self._outputs[stack_name]
+        """Get stack outputs.
+
+        Outputs are cached once retrieved. Concurrent calls for the outputs of
+        the same stack share a single call to retrieve them.
+
+        """
+        outputs = self._outputs.get(stack_name)
+        if outputs:
+            return outputs
+
+        def _get_outputs() -> dict[str, str]:
+            if not self._outputs.get(stack_name):
+                self._outputs[stack_name] = get_output_dict(self.get_stack(stack_name))
+            return self._outputs[stack_name]
+
+        return self._outputs_calls.do(stack_name, _get_outputs)
 
     @staticmethod
     def get_output_dict(stack: StackTypeDef) -> dict[str, str]:
@@ -1477,6 +1769,8 @@ class Provider(BaseProvider):
             change_type,
             service_role=self.service_role,
         )
+        if change_type == "CREATE":  # a temporary stack was created with the changeset
+            self.stack_cache.invalidate(stack.fqn)
         new_parameters_as_dict = self.params_as_dict(
             [
                 (
@@ -0,0 +1,242 @@
+"""Client-side rate limiting of AWS API calls."""
+
+from __future__ import annotations
+
+import collections
+import functools
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import boto3
+    from botocore.model import OperationModel
+
+LOGGER = logging.getLogger(__name__)
+
+# Maximum number of requests per second sent to an API for a region and set of credentials.
+# Can be controlled via an environment variable.
+DEFAULT_MAX_RATE = 100.0
+
+THROTTLING_ERROR_CODES = frozenset(
+    {
+        "BandwidthLimitExceeded",
+        "EC2ThrottledException",
+        "LimitExceededException",
+        "PriorRequestNotComplete",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "SlowDown",
+        "ThrottledException",
+        "Throttling",
+        "ThrottlingException",
+        "TooManyRequestsException",
+    }
+)
+"""Error codes returned by AWS APIs when a request is throttled."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket with a fill rate adjusted using AIMD.
+
+    The bucket does not limit requests until the first time a request is
+    throttled. At that point, the rate is set to a fraction of the rate
+    requests were being sent. From then on, the rate is increased additively
+    for each successful request (by roughly :attr:`increase` requests per
+    second, each second) and decreased multiplicatively by :attr:`decrease`
+    when a request is throttled. Throttling responses received within
+    :attr:`cooldown` seconds of a decrease were sent before the decrease took
+    effect so they do not decrease the rate again.
+
+    Attributes:
+        cooldown: Minimum number of seconds between decreases of the rate.
+        decrease: Factor the rate is multiplied by when a request is throttled.
+        enabled: Whether the bucket is limiting requests.
+        increase: Number of requests per second the rate is increased by for
+            each second of successful requests.
+        max_rate: Maximum number of requests per second.
+        min_rate: Minimum number of requests per second.
+        rate: Current number of requests per second.
+
+    """
+
+    cooldown: float
+    decrease: float
+    enabled: bool
+    increase: float
+    max_rate: float
+    min_rate: float
+    rate: float
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        cooldown: float = 1.0,
+        decrease: float = 0.5,
+        increase: float = 1.0,
+        max_rate: float = DEFAULT_MAX_RATE,
+        min_rate: float = 0.5,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            clock: Function returning the current time in seconds.
+            cooldown: Minimum number of seconds between decreases of the rate.
+            decrease: Factor the rate is multiplied by when a request is throttled.
+            increase: Number of requests per second the rate is increased by for
+                each second of successful requests.
+            max_rate: Maximum number of requests per second.
+            min_rate: Minimum number of requests per second.
+            sleep: Function used to wait for a token.
+
+        """
+        self.cooldown = cooldown
+        self.decrease = decrease
+        self.enabled = False
+        self.increase = increase
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.rate = max_rate
+        self._clock = clock
+        self._last_decrease: float | None = None
+        self._lock = threading.Lock()
+        self._sent: collections.deque[float] = collections.deque()
+        self._sleep = sleep
+        self._tokens = 0.0
+        self._updated = clock()
+
+    def acquire(self) -> float:
+        """Wait until a request can be sent.
+
+        Returns:
+            Number of seconds waited.
+
+        """
+        with self._lock:
+            now = self._clock()
+            if not self.enabled:
+                self._sent.append(now)
+                while self._sent[0] <= now - 1:
+                    self._sent.popleft()
+                return 0.0
+            self._refill(now)
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay:
+            self._sleep(delay)
+        return delay
+
+    def on_success(self) -> None:
+        """Increase the rate after a request succeeds."""
+        with self._lock:
+            if self.enabled:
+                self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def on_throttle(self) -> None:
+        """Decrease the rate after a request is throttled."""
+        with self._lock:
+            now = self._clock()
+            if self._last_decrease is not None and now - self._last_decrease < self.cooldown:
+                return
+            if self.enabled:
+                self._refill(now)
+                rate = self.rate
+            else:
+                rate = len(self._sent)
+                self._sent.clear()
+                self._tokens = 0.0
+                self._updated = now
+                self.enabled = True
+            self.rate = min(self.max_rate, max(self.min_rate, rate * self.decrease))
+            self._tokens = min(self._tokens, 0.0)
+            self._last_decrease = now
+            LOGGER.debug("request throttled; limiting to %.2f requests per second", self.rate)
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last refill."""
+        self._tokens = min(max(1.0, self.rate), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+_RATE_LIMITERS: dict[tuple[str, str | None, str | None], TokenBucket] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(service: str, region: str | None, identity: str | None) -> TokenBucket:
+    """Get the rate limiter shared by all requests to an API.
+
+    Args:
+        service: Name of the AWS service.
+        region: AWS region.
+        identity: Profile or access key of the credentials used.
+
+    """
+    key = (service, region, identity)
+    with _RATE_LIMITERS_LOCK:
+        if key not in _RATE_LIMITERS:
+            _RATE_LIMITERS[key] = TokenBucket(
+                max_rate=float(os.environ.get("CFNGIN_API_MAX_RATE", DEFAULT_MAX_RATE))
+            )
+        return _RATE_LIMITERS[key]
+
+
+def register_rate_limiter(session: boto3.Session, identity: str | None = None) -> None:
+    """Limit the rate of requests sent by clients created from a session.
+
+    Rate limiters are shared by every session in the process that uses the same
+    credentials so concurrent stacks sending requests to the same API are limited
+    together.
+
+    Args:
+        session: boto3 session.
+        identity: Profile or access key of the credentials used by the session.
+
+    """
+    if float(os.environ.get("CFNGIN_API_MAX_RATE", DEFAULT_MAX_RATE)) <= 0:
+        return
+    session.events.register("before-call.*.*", functools.partial(_before_call, identity=identity))
+    session.events.register("needs-retry.*.*", functools.partial(_needs_retry, identity=identity))
+
+
+def _before_call(
+    *, context: dict[str, Any], identity: str | None, model: OperationModel, **_: Any
+) -> None:
+    """Wait for the rate limiter before sending a request."""
+    get_rate_limiter(
+        model.service_model.service_name, context.get("client_region"), identity
+    ).acquire()
+
+
+def _needs_retry(
+    *,
+    identity: str | None,
+    operation: OperationModel,
+    request_dict: dict[str, Any],
+    response: tuple[Any, dict[str, Any]] | None,
+    **_: Any,
+) -> None:
+    """Adjust the rate limiter based on the response to a request.
+
+    A request that is retried after being throttled also waits for the rate limiter.
+
+    """
+    if response is None:
+        return
+    limiter = get_rate_limiter(
+        operation.service_model.service_name,
+        request_dict.get("context", {}).get("client_region"),
+        identity,
+    )
+    if response[1].get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+        limiter.on_throttle()
+        limiter.acquire()
+    elif response[0].status_code < 300:
+        limiter.on_success()
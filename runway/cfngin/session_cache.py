@@ -8,6 +8,7 @@ import boto3
 
 from ..aws_sso_botocore.session import Session
 from ..constants import BOTO3_CREDENTIAL_CACHE
+from .rate_limiter import register_rate_limiter
 from .ui import ui
 
 LOGGER = logging.getLogger(__name__)
@@ -31,6 +32,9 @@ def get_session(
         secret_key: AWS secret Access Key.
         session_token: AWS session token.
 
+    Requests sent by clients created from the session are rate limited by
+    :func:`~runway.cfngin.rate_limiter.register_rate_limiter`.
+
     Returns:
         A thread-safe boto3 session.
 
@@ -60,4 +64,5 @@ def get_session(
     provider = cred_provider.get_provider("assume-role")  # type: ignore
     provider.cache = BOTO3_CREDENTIAL_CACHE
     provider._prompter = ui.getpass  # noqa: SLF001
+    register_rate_limiter(session, profile or access_key)
     return session
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 from ...._logging import PrefixAdaptor
 from ....exceptions import UnresolvedVariable
-from ....variables import Variable
+from ....variables import Variable, prefetch_lookups
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -74,16 +74,18 @@ class ConfigComponentDefinition(ABC, Generic[_ConfigPropertyTypeVar]):
 
         if pre_process:
             logger.verbose("resolving variables for pre-processing...")
-            for field in self._pre_process_vars:
-                if field in self._vars:
+            fields = [field for field in self._pre_process_vars if field in self._vars]
+            with prefetch_lookups([self._vars[field] for field in fields], context):
+                for field in fields:
                     self._vars[field].resolve(context, variables=variables)
                     self._data[field] = self._vars[field].value
             return
 
         logger.verbose("resolving variables...")
-        for field, var in self._vars.items():
-            var.resolve(context, variables=variables)
-            self._data[field] = var.value
+        with prefetch_lookups(self._vars.values(), context):
+            for field, var in self._vars.items():
+                var.resolve(context, variables=variables)
+                self._data[field] = var.value
 
     def _register_variable(self, var_name: str, var_value: Any) -> None:
         """Register a variable.
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import threading
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
@@ -12,6 +14,7 @@ import botocore.exceptions
 from ..aws_sso_botocore.session import Session
 from ..cfngin.ui import ui
 from ..constants import BOTO3_CREDENTIAL_CACHE
+from ..lookups.cache import LookupCache
 from ..mixins import DelCachedPropMixin
 from ..type_defs import Boto3CredentialsTypeDef
 from .sys_info import SystemInfo
@@ -33,6 +36,12 @@ class BaseContext(DelCachedPropMixin):
     logger: PrefixAdaptor | RunwayLogger
     """Custom logger."""
 
+    lookup_prefetch: dict[str, dict[Any, Any]]
+    """Values prefetched by lookup handlers before they are resolved, keyed by lookup name."""
+
+    lookup_results: LookupCache
+    """Resolved lookup results cached in memory for the life of this context."""
+
     sys_info: SystemInfo
     """Information about the current system being used to run Runway."""
 
@@ -57,6 +66,10 @@ class BaseContext(DelCachedPropMixin):
         """
         self.env = deploy_environment
         self.logger = logger
+        self.lookup_prefetch = {}
+        self.lookup_results = LookupCache()
+        self._clients: dict[tuple[str | None, ...], Any] = {}
+        self._clients_lock = threading.Lock()
         self.sys_info = SystemInfo()
         self.work_dir = work_dir or Path.cwd() / ".runway"
 
@@ -69,6 +82,11 @@ class BaseContext(DelCachedPropMixin):
             }  # pyright: ignore[reportArgumentType]
         )
 
+    @cached_property
+    def lookup_disk_store(self) -> LookupCache:
+        """Resolved lookup results stored in the working directory to persist between runs."""
+        return LookupCache(self.work_dir / "cache" / "lookups")
+
     @property
     def current_aws_creds(self) -> EnvVarsAwsCredentialsTypeDef:
         """AWS credentials from self.env_vars."""
@@ -93,6 +111,56 @@ class BaseContext(DelCachedPropMixin):
         """
         return self.env.ci
 
+    def get_client(
+        self,
+        service_name: str,
+        *,
+        aws_access_key_id: str | None = None,
+        aws_secret_access_key: str | None = None,
+        aws_session_token: str | None = None,
+        profile: str | None = None,
+        region: str | None = None,
+    ) -> Any:
+        """Get a boto3 client that is shared by everything using this context.
+
+        Clients are created using :meth:`get_session` the first time they are
+        requested for a combination of service, region, and credentials.
+        Subsequent calls return the same client. boto3 clients are thread-safe.
+
+        Args:
+            service_name: The name of the service (e.g. ``s3``).
+            aws_access_key_id: AWS Access Key ID.
+            aws_secret_access_key: AWS secret Access Key.
+            aws_session_token: AWS session token.
+            profile: The profile for the session.
+            region: The region for the session.
+
+        Returns:
+            A boto3 client.
+
+        """
+        if profile:
+            key: tuple[str | None, ...] = (service_name, region or self.env.aws_region, profile)
+        else:
+            key = (
+                service_name,
+                region or self.env.aws_region,
+                None,
+                aws_access_key_id or self.env.vars.get("AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key or self.env.vars.get("AWS_SECRET_ACCESS_KEY"),
+                aws_session_token or self.env.vars.get("AWS_SESSION_TOKEN"),
+            )
+        with self._clients_lock:
+            if key not in self._clients:
+                self._clients[key] = self.get_session(
+                    aws_access_key_id=aws_access_key_id,
+                    aws_secret_access_key=aws_secret_access_key,
+                    aws_session_token=aws_session_token,
+                    profile=profile,
+                    region=region,
+                ).client(service_name)
+            return self._clients[key]
+
     def get_session(
         self,
         *,
@@ -6,12 +6,14 @@ import collections.abc
 import contextlib
 import json
 import logging
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from pydantic import BaseModel
 
 from .._logging import PrefixAdaptor, RunwayLogger
+from ..cfngin.blueprints.render_cache import RenderCache
 from ..cfngin.exceptions import (
     PersistentGraphCannotLock,
     PersistentGraphCannotUnlock,
@@ -19,6 +21,7 @@ from ..cfngin.exceptions import (
     PersistentGraphLocked,
     PersistentGraphUnlocked,
 )
+from ..cfngin.history import StepHistory
 from ..cfngin.plan import Graph
 from ..cfngin.stack import Stack
 from ..cfngin.utils import ensure_s3_bucket
@@ -264,6 +267,22 @@ class CfnginContext(BaseContext):
         """Load a persistent graph dict as a :class:`runway.cfngin.plan.Graph`."""
         self._persistent_graph = graph
 
+    @cached_property
+    def render_cache(self) -> RenderCache | None:
+        """Cache of rendered blueprints stored in the CFNgin cache directory.
+
+        The cache is only used when the ``CFNGIN_RENDER_CACHE_SIZE``
+        environment variable is set to its maximum size. The cache key does not
+        include hook data, environment variables, or files read outside of
+        :meth:`~runway.cfngin.blueprints.base.Blueprint.read_user_data` so it
+        is disabled by default.
+
+        """
+        max_size = int(os.environ.get("CFNGIN_RENDER_CACHE_SIZE", "0"))
+        if max_size <= 0:
+            return None
+        return RenderCache(self.config.cfngin_cache_dir / "blueprints", max_size=max_size)
+
     @property
     def s3_bucket_verified(self) -> bool:
         """Check CFNgin bucket exists and you have access.
@@ -285,7 +304,7 @@ class CfnginContext(BaseContext):
     @cached_property
     def s3_client(self) -> S3Client:
         """AWS S3 client."""
-        return self.get_session(region=self.bucket_region).client("s3")
+        return self.get_client("s3", region=self.bucket_region)
 
     @cached_property
     def stacks_dict(self) -> dict[str, Stack]:
@@ -308,6 +327,11 @@ class CfnginContext(BaseContext):
             for stack_def in self.config.stacks
         ]
 
+    @cached_property
+    def step_history(self) -> StepHistory:
+        """Durations of previous executions of steps stored in the working directory."""
+        return StepHistory(self.work_dir / "cfngin_step_history.json")
+
     @cached_property
     def tags(self) -> dict[str, str]:
         """Return ``tags`` from config."""
@@ -12,6 +12,7 @@ import yaml as _yaml
 from .. import __version__
 from .._logging import PrefixAdaptor as _PrefixAdaptor
 from .._logging import RunwayLogger as _RunwayLogger
+from ..lookups.cache import LOOKUP_CACHE_STATS as _LOOKUP_CACHE_STATS
 from ..tests.registry import TEST_HANDLERS as _TEST_HANDLERS
 from ..utils import DOC_SITE
 from ..utils import YamlDumper as _YamlDumper
@@ -241,10 +242,13 @@ class Runway:
 
         """
         self.ctx.command = action
-        components.Deployment.run_list(
-            action=action,
-            context=self.ctx,
-            deployments=deployments or [],
-            future=self.future,
-            variables=self.variables,
-        )
+        try:
+            components.Deployment.run_list(
+                action=action,
+                context=self.ctx,
+                deployments=deployments or [],
+                future=self.future,
+                variables=self.variables,
+            )
+        finally:
+            _LOOKUP_CACHE_STATS.log()
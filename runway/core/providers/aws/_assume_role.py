@@ -12,6 +12,7 @@ from typing_extensions import TypedDict
 if TYPE_CHECKING:
     from types import TracebackType
 
+    from mypy_boto3_sts.client import STSClient
     from mypy_boto3_sts.type_defs import AssumedRoleUserTypeDef, CredentialsTypeDef
     from typing_extensions import Self
 
@@ -87,7 +88,7 @@ class AssumeRole(AbstractContextManager["AssumeRole"]):
             return
         if self.revert_on_exit:
             self.save_existing_iam_env_vars()
-        sts_client = self.ctx.get_session().client("sts")
+        sts_client: STSClient = self.ctx.get_client("sts")
         LOGGER.info("assuming role %s...", self.role_arn)
         response = sts_client.assume_role(**self._kwargs)
         LOGGER.debug("sts.assume_role response: %s", response)
@@ -2,5 +2,6 @@
 
 from . import exceptions
 from ._bucket import Bucket
+from ._helpers.batch_delete import BatchDeleter
 
-__all__ = ["Bucket", "exceptions"]
+__all__ = ["BatchDeleter", "Bucket", "exceptions"]
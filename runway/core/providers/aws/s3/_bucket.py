@@ -176,31 +176,41 @@ class Bucket(DelCachedPropMixin):
         self,
         src_directory: str,
         *,
+        content_hash: bool = False,
         delete: bool = False,
         exclude: list[str] | None = None,
         follow_symlinks: bool = False,
         include: list[str] | None = None,
+        manifest: bool = False,
         prefix: str | None = None,
     ) -> None:
         """Sync local directory to the S3 Bucket.
 
         Args:
             src_directory: Local directory to sync to S3.
+            content_hash: If true, files are uploaded when their content differs
+                from the object rather than when they are newer.
             delete: If true, files that exist in the destination but not in the
                 source are deleted.
             exclude: List of patterns for files/objects to exclude.
             follow_symlinks: If symlinks should be followed.
             include: List of patterns for files/objects to explicitly include.
+            manifest: If true, a manifest of the objects synced is stored in the
+                Runway work directory and used in place of listing the bucket on
+                the next sync. Only use this for buckets that are not modified by
+                anything else.
             prefix: Optional prefix to append to synced objects.
 
         """
         S3SyncHandler(
             context=self.__ctx,
+            content_hash=content_hash,
             delete=delete,
             dest=self.format_bucket_path_uri(prefix=prefix),
             exclude=exclude,
             follow_symlinks=follow_symlinks,
             include=include,
+            manifest=manifest,
             session=self.session,
             src=src_directory,
         ).run()
@@ -29,6 +29,7 @@ if TYPE_CHECKING:
     from mypy_boto3_s3.client import S3Client
 
     from .format_path import FormatPathResult
+    from .manifest import SyncManifest
     from .parameters import ParametersDataModel
     from .s3handler import S3TransferHandler
     from .sync_strategy.base import BaseSync
@@ -77,9 +78,22 @@ class ActionArchitecture:
         action: Literal["sync"],
         parameters: ParametersDataModel,
         runtime_config: TransferConfigDict | None = None,
+        manifest: SyncManifest | None = None,
     ) -> None:
-        """Instantiate class."""
+        """Instantiate class.
+
+        Args:
+            session: boto3 session.
+            botocore_session: botocore session.
+            action: Action being performed.
+            parameters: Parameters of the action.
+            runtime_config: Configuration of the transfer manager.
+            manifest: Manifest of the destination of an upload, used in place of
+                listing the destination when it is complete.
+
+        """
         self.botocore_session = botocore_session
+        self.manifest = manifest
         self.session = session
         self.action = action
         self.parameters = parameters
@@ -126,7 +140,9 @@ class ActionArchitecture:
         # Determine what strategies to override if any.
         responses = cast(
             "list[tuple[Any, BaseSync]] | None",
-            self.botocore_session.emit("choosing-s3-sync-strategy", params=self.parameters),
+            self.botocore_session.emit(
+                "choosing-s3-sync-strategy", params=self.parameters, client=self.client
+            ),
         )
         if responses is not None:
             for response in responses:
@@ -178,6 +194,7 @@ class ActionArchitecture:
             client=self.client,
             operation_name=operation_name,
             follow_symlinks=self.parameters.follow_symlinks,
+            list_concurrency=self.parameters.list_concurrency,
             page_size=self.parameters.page_size,
             result_queue=result_queue,
             request_parameters=self._get_file_generator_request_parameters_skeleton(),
@@ -186,11 +203,15 @@ class ActionArchitecture:
             client=self.client,
             operation_name="",
             follow_symlinks=self.parameters.follow_symlinks,
+            list_concurrency=self.parameters.list_concurrency,
+            manifest=self.manifest if paths_type == "locals3" else None,
             page_size=self.parameters.page_size,
             result_queue=result_queue,
             request_parameters=self._get_file_generator_request_parameters_skeleton(),
         )
-        file_info_builder = FileInfoBuilder(client=self.client, parameters=self.parameters)
+        file_info_builder = FileInfoBuilder(
+            client=self.client, manifest=self.manifest, parameters=self.parameters
+        )
         s3_transfer_handler = S3TransferHandlerFactory(
             config_params=self.parameters, runtime_config=self._runtime_config
         )(self.client, result_queue)
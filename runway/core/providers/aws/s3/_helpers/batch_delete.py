@@ -0,0 +1,210 @@
+"""Delete S3 objects in batches."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from botocore.exceptions import ClientError
+
+from .results import FailureResult, QueuedResult, SuccessResult
+
+if TYPE_CHECKING:
+    from queue import Queue
+    from types import TracebackType
+
+    from mypy_boto3_s3.client import S3Client
+    from mypy_boto3_s3.type_defs import ObjectIdentifierTypeDef
+    from typing_extensions import Self
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+
+class BatchDeleter:
+    """Delete objects using DeleteObjects requests that are sent concurrently.
+
+    Objects are grouped by bucket into requests of up to :attr:`BATCH_SIZE`
+    objects. The result of deleting each object is reported with the same
+    result types used for transfers so failures are reported per object.
+
+    Attributes:
+        failures: Objects that could not be deleted.
+
+    """
+
+    BATCH_SIZE: ClassVar[int] = 1000
+    """Maximum number of objects that can be deleted by a single request."""
+
+    failures: list[FailureResult]
+
+    def __init__(
+        self,
+        client: S3Client,
+        *,
+        extra_args: dict[str, Any] | None = None,
+        max_workers: int = 10,
+        result_queue: Queue[Any] | None = None,
+        transfer_type: str = "delete",
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            client: boto3 S3 client.
+            extra_args: Additional arguments to pass to each DeleteObjects request.
+            max_workers: Maximum number of requests sent concurrently.
+            result_queue: Queue the result of deleting each object is put in.
+            transfer_type: Transfer type of the results.
+
+        """
+        self.failures = []
+        self._batches: dict[
+            str, tuple[list[ObjectIdentifierTypeDef], concurrent.futures.Future[None]]
+        ] = {}
+        self._client = client
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._extra_args = extra_args or {}
+        self._futures: list[concurrent.futures.Future[None]] = []
+        self._lock = threading.Lock()
+        self._max_workers = max_workers
+        self._result_queue = result_queue
+        # limit the number of batches waiting to be sent so objects are not listed faster
+        # than they can be deleted
+        self._semaphore = threading.BoundedSemaphore(max_workers * 2)
+        self._transfer_type = transfer_type
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context manager, waiting for all objects to be deleted."""
+        self.flush()
+
+    def add(
+        self, bucket: str, key: str, version_id: str | None = None
+    ) -> concurrent.futures.Future[None]:
+        """Add an object to be deleted.
+
+        The request is sent once enough objects have been added to fill a batch
+        or when :meth:`flush` is called.
+
+        Args:
+            bucket: Name of the bucket containing the object.
+            key: Key of the object.
+            version_id: Version of the object to delete.
+
+        Returns:
+            Future of the request that will delete the object.
+
+        """
+        obj: ObjectIdentifierTypeDef = {"Key": key}
+        if version_id:
+            obj["VersionId"] = version_id
+        self._put_result(
+            QueuedResult(
+                total_transfer_size=0,
+                src=f"s3://{bucket}/{key}",
+                transfer_type=self._transfer_type,
+            )
+        )
+        with self._lock:
+            objects, future = self._batches.setdefault(bucket, ([], concurrent.futures.Future()))
+            objects.append(obj)
+            if len(objects) < self.BATCH_SIZE:
+                return future
+            del self._batches[bucket]
+        self._submit(bucket, objects, future)
+        return future
+
+    def add_all_versions(self, bucket: str) -> None:
+        """Add every version of every object and every delete marker in a bucket.
+
+        Args:
+            bucket: Name of the bucket.
+
+        """
+        paginator = self._client.get_paginator("list_object_versions")
+        for page in paginator.paginate(Bucket=bucket):
+            for version in [*page.get("Versions", []), *page.get("DeleteMarkers", [])]:
+                self.add(bucket, version.get("Key", ""), version.get("VersionId"))
+
+    def flush(self) -> None:
+        """Delete the objects that have been added and wait for all requests to finish."""
+        with self._lock:
+            batches = self._batches
+            self._batches = {}
+        for bucket, (objects, future) in batches.items():
+            self._submit(bucket, objects, future)
+        concurrent.futures.wait(self._futures)
+        self._futures = []
+        if self._executor:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _delete_objects(
+        self,
+        bucket: str,
+        objects: list[ObjectIdentifierTypeDef],
+        future: concurrent.futures.Future[None],
+    ) -> None:
+        """Delete a batch of objects, reporting the result for each object."""
+        errors: dict[tuple[str, str | None], Exception] = {}
+        try:
+            try:
+                response = self._client.delete_objects(
+                    Bucket=bucket, Delete={"Objects": objects, "Quiet": True}, **self._extra_args
+                )
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.debug("failed to delete %s objects from %s", len(objects), bucket)
+                errors = {(obj["Key"], obj.get("VersionId")): exc for obj in objects}
+            else:
+                for error in response.get("Errors", []):
+                    errors[(error.get("Key", ""), error.get("VersionId"))] = ClientError(
+                        {
+                            "Error": {
+                                "Code": error.get("Code", ""),
+                                "Message": error.get("Message", ""),
+                            }
+                        },
+                        "DeleteObjects",
+                    )
+            for obj in objects:
+                src = f"s3://{bucket}/{obj['Key']}"
+                exc = errors.get((obj["Key"], obj.get("VersionId")))
+                if exc:
+                    result = FailureResult(
+                        exception=exc, src=src, transfer_type=self._transfer_type
+                    )
+                    with self._lock:
+                        self.failures.append(result)
+                    self._put_result(result)
+                else:
+                    self._put_result(SuccessResult(src=src, transfer_type=self._transfer_type))
+        finally:
+            self._semaphore.release()
+            future.set_result(None)
+
+    def _put_result(self, result: Any) -> None:
+        """Put a result in the result queue."""
+        if self._result_queue is not None:
+            self._result_queue.put(result)
+
+    def _submit(
+        self,
+        bucket: str,
+        objects: list[ObjectIdentifierTypeDef],
+        future: concurrent.futures.Future[None],
+    ) -> None:
+        """Submit a batch of objects to be deleted."""
+        self._semaphore.acquire()
+        if not self._executor:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers)
+        self._executor.submit(self._delete_objects, bucket, objects, future)
+        self._futures.append(future)
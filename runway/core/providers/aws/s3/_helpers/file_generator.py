@@ -27,6 +27,7 @@ from typing_extensions import TypedDict
 from .utils import (
     EPOCH_TIME,
     BucketLister,
+    ShardedBucketLister,
     create_warning,
     find_bucket_key,
     find_dest_path_comp_key,
@@ -42,6 +43,7 @@ if TYPE_CHECKING:
 
     from ......type_defs import AnyPath
     from .format_path import FormatPathResult, SupportedPathType
+    from .manifest import SyncManifest
 
 
 def is_readable(path: Path) -> bool:
@@ -155,6 +157,8 @@ class FileGenerator:
         page_size: int | None = None,
         result_queue: Queue[Any] | None = None,
         request_parameters: Any = None,
+        list_concurrency: int = 1,
+        manifest: SyncManifest | None = None,
     ) -> None:
         """Instantiate class.
 
@@ -165,11 +169,17 @@ class FileGenerator:
             page_size: Number of items per page.
             result_queue: Queue used for outputting results.
             request_parameters: Parameters provided with the request.
+            list_concurrency: Number of list calls made concurrently when
+                listing objects.
+            manifest: Manifest of the objects in the bucket used in place of
+                listing the bucket when it is complete.
 
         """
         self._client = client
         self.operation_name = operation_name
         self.follow_symlinks = follow_symlinks
+        self.list_concurrency = list_concurrency
+        self.manifest = manifest
         self.page_size = page_size
         self.result_queue = result_queue or Queue()
         self.request_parameters = {}
@@ -210,32 +220,53 @@ class FileGenerator:
         outputs. It yields the file's source path, size, and last
         update.
 
+        Directories are read with :func:`os.scandir` so the type and stat
+        results of each entry are reused rather than retrieved from the
+        filesystem multiple times.
+
         """
         if isinstance(path, str):
             path = Path(path)
-        if not self.should_ignore_file(path):
-            if not dir_op:
-                stats = self.safely_get_file_stats(path)
+        if self.should_ignore_file(path):
+            return
+        if not dir_op:
+            stats = self.safely_get_file_stats(path)
+            if stats:
+                yield stats
+            return
+        # iterators over the sorted entries of each directory being walked
+        stack = [iter(self._scan_dir(path))]
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                continue
+            entry_path = Path(entry.path)
+            if entry.is_dir():
+                if not self.should_ignore_file(entry_path):
+                    stack.append(iter(self._scan_dir(entry_path)))
+            else:
+                stats = self.safely_get_file_stats(entry_path, entry)
                 if stats:
                     yield stats
-            else:
-                # using os.listdir instead of Path.iterdir so we can sort the list
-                # but not load the entire tree into memory
-                listdir_names = os.listdir(path)
-                names: list[str] = []
-                for name in listdir_names:
-                    if (path / name).is_dir():
-                        name = name + os.path.sep  # noqa: PLW2901
-                    names.append(name)
-                self.normalize_sort(names, os.sep, "/")
-                for name in names:
-                    file_path = path / name
-                    if file_path.is_dir():
-                        yield from self.list_files(file_path, dir_op)
-                    else:
-                        stats = self.safely_get_file_stats(file_path)
-                        if stats:
-                            yield stats
+
+    @staticmethod
+    def _scan_dir(path: Path) -> list[os.DirEntry[str]]:
+        """List the entries of a directory in the order S3 lists keys.
+
+        Directory names are sorted as if they end with a forward slash, the
+        delimiter of S3 keys, regardless of the OS path separator.
+
+        Args:
+            path: Path to a directory.
+
+        """
+        with os.scandir(path) as scandir_it:
+            entries = [
+                (f"{entry.name}/" if entry.is_dir() else entry.name, entry) for entry in scandir_it
+            ]
+        entries.sort(key=lambda item: item[0])
+        return [entry for _, entry in entries]
 
     @staticmethod
     def normalize_sort(names: list[str], os_sep: str, character: str) -> None:
@@ -252,15 +283,18 @@ class FileGenerator:
         """
         names.sort(key=lambda item: item.replace(os_sep, character))
 
-    def safely_get_file_stats(self, path: Path) -> tuple[Path, _LastModifiedAndSize] | None:
+    def safely_get_file_stats(
+        self, path: Path, entry: os.DirEntry[str] | None = None
+    ) -> tuple[Path, _LastModifiedAndSize] | None:
         """Get file stats with handling for some common errors.
 
         Args:
             path: Path to a file.
+            entry: Directory entry of the file. If provided, its stat result is used.
 
         """
         try:
-            size, last_update = get_file_stat(path)
+            size, last_update = get_file_stat(entry or path)
         except (OSError, ValueError):
             self.triggers_warning(path)
         else:
@@ -342,14 +376,29 @@ class FileGenerator:
         if not dir_op and prefix:
             yield self._list_single_object(s3_path)
         else:
-            lister = BucketLister(self._client)
+            lister = (
+                ShardedBucketLister(self._client, max_workers=self.list_concurrency)
+                if self.list_concurrency > 1
+                else BucketLister(self._client)
+            )
             extra_args: Any = self.request_parameters.get("ListObjectsV2", {})
-            for obj in lister.list_objects(
-                bucket=bucket,
-                prefix=prefix,
-                page_size=self.page_size,
-                extra_args=extra_args,
-            ):
+            objects = (
+                self.manifest.list_objects(
+                    lister,
+                    bucket=bucket,
+                    prefix=prefix,
+                    page_size=self.page_size,
+                    extra_args=extra_args,
+                )
+                if self.manifest
+                else lister.list_objects(
+                    bucket=bucket,
+                    prefix=prefix,
+                    page_size=self.page_size,
+                    extra_args=extra_args,
+                )
+            )
+            for obj in objects:
                 source_path, response_data = obj
                 if response_data.get("Size", 0) == 0 and source_path.endswith("/"):
                     if self.operation_name == "delete":
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from mypy_boto3_s3.client import S3Client
 
     from .file_generator import FileStats
+    from .manifest import SyncManifest
     from .parameters import ParametersDataModel
 
 
@@ -28,6 +29,7 @@ class FileInfoBuilder:
         *,
         client: S3Client,
         is_stream: bool = False,
+        manifest: SyncManifest | None = None,
         parameters: ParametersDataModel | None = None,
         source_client: Any | None = None,
     ) -> None:
@@ -36,6 +38,7 @@ class FileInfoBuilder:
         Args:
             client: boto3 S3 client.
             is_stream: If the file is a stream.
+            manifest: Manifest of the destination updated with each file.
             parameters: A dictionary of important values this is assigned in
                 the ``BasicTask`` object.
             source_client: Client to handle the source.
@@ -47,11 +50,14 @@ class FileInfoBuilder:
             self._source_client = source_client
         self._parameters = parameters
         self._is_stream = is_stream
+        self._manifest = manifest
 
     def call(self, files: Iterable[FileStats]) -> Generator[FileInfo, None, None]:
         """Iterate generator of ``FileStats`` to generate ``FileInfo`` objects."""
         for file_base in files:
             file_info = self._inject_info(file_base)
+            if self._manifest:
+                self._manifest.record(file_info)
             yield file_info
 
     def _inject_info(self, file_base: FileStats) -> FileInfo:
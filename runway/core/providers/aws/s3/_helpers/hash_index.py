@@ -0,0 +1,129 @@
+"""Index of the content hash of local files."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:
+    from ......type_defs import AnyPath
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+CONTENT_HASH_METADATA_KEY = "runway-content-md5"
+"""Key of the S3 object metadata containing the MD5 of the object's content."""
+
+
+class LocalHashIndex:
+    """Thread-safe index of the MD5 of local files.
+
+    The MD5 of a file is only calculated when the file is not in the index
+    or its size, modification time, or inode have changed since it was indexed.
+
+    Attributes:
+        path: File the index is stored in.
+
+    """
+
+    CHUNK_SIZE: ClassVar[int] = 1024 * 1024
+    """Number of bytes read from a file at a time while hashing it."""
+
+    path: Path | None
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Instantiate class.
+
+        Args:
+            path: File the index is stored in.
+                If not provided, the index is only stored in memory.
+
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # absolute path of file -> [size, mtime in nanoseconds, inode, md5]
+        self._entries: dict[str, list[int | str]] | None = None
+        self._used: set[str] = set()
+
+    def md5(self, file_path: AnyPath, stats: os.stat_result | None = None) -> str:
+        """Get the MD5 of a local file.
+
+        Args:
+            file_path: Path to the file.
+            stats: Stat result of the file if it has already been retrieved.
+
+        Returns:
+            Hex digest of the MD5 of the file's content.
+
+        """
+        key = str(Path(file_path).absolute())
+        stats = stats or Path(key).stat()
+        signature: list[int | str] = [stats.st_size, stats.st_mtime_ns, stats.st_ino]
+        with self._lock:
+            entry = self._load().get(key)
+            if entry and entry[:3] == signature:
+                self._used.add(key)
+                return str(entry[3])
+        digest = hashlib.md5()  # noqa: S324
+        with open(key, "rb") as stream:  # noqa: PTH123
+            while chunk := stream.read(self.CHUNK_SIZE):
+                digest.update(chunk)
+        with self._lock:
+            self._load()[key] = [*signature, digest.hexdigest()]
+            self._used.add(key)
+        return digest.hexdigest()
+
+    def save(self) -> None:
+        """Write the index to :attr:`path`.
+
+        Only files that have been hashed or looked up since the index was
+        loaded are written so the index does not grow indefinitely.
+
+        """
+        if not self.path:
+            return
+        with self._lock:
+            entries = {key: value for key, value in self._load().items() if key in self._used}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entries))
+        tmp_path.replace(self.path)
+
+    def _load(self) -> dict[str, list[int | str]]:
+        """Load the index from :attr:`path` the first time it is needed.
+
+        Must be called while holding the lock.
+
+        """
+        if self._entries is None:
+            self._entries = {}
+            if self.path and self.path.is_file():
+                try:
+                    data = json.loads(self.path.read_text())
+                except ValueError:
+                    LOGGER.debug("ignoring invalid hash index: %s", self.path)
+                else:
+                    if isinstance(data, dict):
+                        self._entries = data
+        return self._entries
+
+
+_HASH_INDEXES: dict[Path | None, LocalHashIndex] = {}
+_HASH_INDEXES_LOCK = threading.Lock()
+
+
+def get_hash_index(path: Path | None = None) -> LocalHashIndex:
+    """Get the index stored in a file, shared by everything using the same file.
+
+    Args:
+        path: File the index is stored in.
+
+    """
+    with _HASH_INDEXES_LOCK:
+        if path not in _HASH_INDEXES:
+            _HASH_INDEXES[path] = LocalHashIndex(path)
+        return _HASH_INDEXES[path]
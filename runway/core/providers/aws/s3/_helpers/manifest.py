@@ -0,0 +1,298 @@
+"""Manifest of the objects in the destination of a sync."""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import logging
+import uuid
+from typing import TYPE_CHECKING, Any, ClassVar
+from urllib.parse import urlencode
+
+from botocore.exceptions import ClientError
+
+from .utils import find_bucket_key
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from mypy_boto3_s3.client import S3Client
+    from mypy_boto3_s3.type_defs import ObjectTypeDef
+
+    from .file_info import FileInfo
+    from .hash_index import LocalHashIndex
+    from .utils import BucketLister
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+MANIFEST_GENERATION_TAG_KEY = "runway-manifest-generation"
+"""Key of the S3 object tag containing the generation of a manifest."""
+
+
+class SyncManifest:
+    """Manifest of the objects under a prefix of a bucket.
+
+    When the manifest was stored by a previous sync, it is used in place of
+    listing the bucket. Otherwise, it is filled in as the bucket is listed.
+    Either way, it is updated with each object uploaded or deleted so that
+    it can be stored for the next sync.
+
+    Attributes:
+        bucket: Name of the bucket.
+        complete: Whether the manifest contains every object under the prefix.
+        generation: Unique ID of the manifest. Changes each time it is stored.
+        prefix: Prefix of the objects in the manifest.
+
+    """
+
+    MARKER_NAME: ClassVar[str] = ".runway-sync-manifest"
+    """Name of the object marking the generation of the manifest, relative to the prefix."""
+
+    VERSION: ClassVar[int] = 1
+    """Version of the manifest format."""
+
+    bucket: str
+    complete: bool
+    generation: str | None
+    prefix: str
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        *,
+        generation: str | None = None,
+        hash_index: LocalHashIndex | None = None,
+        objects: dict[str, ObjectTypeDef] | None = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            bucket: Name of the bucket.
+            prefix: Prefix of the objects in the manifest.
+            generation: Unique ID of the manifest.
+            hash_index: Index used to get the ETag of uploaded files.
+                If not provided, the ETag of uploaded files is not recorded.
+            objects: Objects under the prefix, by key, from a previous sync.
+
+        """
+        self.bucket = bucket
+        self.complete = objects is not None
+        self.generation = generation
+        self.prefix = prefix
+        self._hash_index = hash_index
+        self._objects = objects or {}
+        # S3 sets the last modified time of an object after the upload starts
+        # so recording an earlier time errs on the side of syncing again
+        self._started = datetime.datetime.now(datetime.timezone.utc)
+
+    @property
+    def key(self) -> str:
+        """Key of the object marking the generation of the manifest."""
+        return self.prefix + self.MARKER_NAME
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict[str, Any],
+        bucket: str,
+        prefix: str = "",
+        *,
+        generation: str | None = None,
+        hash_index: LocalHashIndex | None = None,
+    ) -> SyncManifest | None:
+        """Create a manifest from the output of :meth:`to_dict`.
+
+        Returns:
+            The manifest or ``None`` if the data is not a valid manifest.
+
+        """
+        try:
+            if data["version"] != cls.VERSION:
+                return None
+            objects: dict[str, ObjectTypeDef] = {
+                key: {
+                    "ETag": etag,
+                    "Key": key,
+                    "LastModified": datetime.datetime.fromisoformat(last_modified),
+                    "Size": size,
+                }
+                for key, size, etag, last_modified in data["objects"]
+            }
+        except (KeyError, TypeError, ValueError):
+            return None
+        return cls(bucket, prefix, generation=generation, hash_index=hash_index, objects=objects)
+
+    def list_objects(
+        self,
+        lister: BucketLister,
+        *,
+        bucket: str,
+        prefix: str | None = None,
+        page_size: int | None = None,
+        extra_args: Any = None,
+    ) -> Generator[tuple[str, ObjectTypeDef], None, None]:
+        """List the objects in the destination of a sync.
+
+        Args:
+            lister: Used to list the bucket if the manifest is not complete.
+            bucket: Bucket name.
+            prefix: Object prefix.
+            page_size: Number of items per page
+            extra_args: Additional arguments to pass to list call.
+
+        """
+        if self.complete and bucket == self.bucket and (prefix or "") == self.prefix:
+            LOGGER.debug("listing s3://%s/%s from sync manifest", bucket, self.prefix)
+            for key, obj in sorted(self._objects.items()):
+                yield f"{bucket}/{key}", obj.copy()
+            return
+        self._objects = {}
+        for source_path, obj in lister.list_objects(
+            bucket=bucket, prefix=prefix, page_size=page_size, extra_args=extra_args
+        ):
+            if obj.get("Key") == self.key:
+                continue
+            self._objects[obj.get("Key", "")] = obj
+            yield source_path, obj
+        self.complete = bucket == self.bucket and (prefix or "") == self.prefix
+
+    def record(self, file_info: FileInfo) -> None:
+        """Record an object that is being uploaded or deleted."""
+        if file_info.operation_name == "upload" and file_info.dest:
+            _, key = find_bucket_key(str(file_info.dest))
+            self._objects[key] = {
+                "ETag": f'"{self._hash_index.md5(file_info.src)}"' if self._hash_index else "",
+                "Key": key,
+                "LastModified": self._started,
+                "Size": file_info.size or 0,
+            }
+        elif file_info.operation_name == "delete" and file_info.src_type == "s3":
+            _, key = find_bucket_key(str(file_info.src))
+            self._objects.pop(key, None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the manifest to a JSON serializable dictionary."""
+        return {
+            "objects": [
+                [key, obj.get("Size", 0), obj.get("ETag", ""), obj["LastModified"].isoformat()]
+                for key, obj in sorted(self._objects.items())
+            ],
+            "version": self.VERSION,
+        }
+
+
+class SyncManifestStore:
+    """Store the manifest of a sync destination in a local cache.
+
+    The manifest itself never leaves the Runway work directory. The bucket
+    only holds an empty marker object with the generation of the manifest
+    in its tags, which are not returned when the object is served. The
+    marker is deleted before a sync begins and written after it succeeds so
+    a sync that fails part way, or a sync from another machine, results in
+    a full listing next time.
+
+    Attributes:
+        bucket: Name of the bucket.
+        cache_path: Path of the local copy of the manifest.
+        prefix: Prefix of the sync destination.
+
+    """
+
+    def __init__(
+        self,
+        client: S3Client,
+        bucket: str,
+        prefix: str,
+        cache_dir: Path,
+        *,
+        hash_index: LocalHashIndex | None = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            client: boto3 S3 client.
+            bucket: Name of the bucket.
+            prefix: Prefix of the sync destination.
+            cache_dir: Directory local copies of manifests are stored in.
+            hash_index: Index used to get the ETag of uploaded files.
+
+        """
+        self.bucket = bucket
+        self.cache_path = (
+            cache_dir / f"{hashlib.sha256(f'{bucket}/{prefix}'.encode()).hexdigest()}.json"
+        )
+        self.prefix = prefix
+        self._client = client
+        self._hash_index = hash_index
+
+    def invalidate(self, manifest: SyncManifest) -> None:
+        """Delete the marker object so the manifest is not used if the sync is interrupted."""
+        if manifest.generation:
+            self._client.delete_object(Bucket=self.bucket, Key=manifest.key)
+
+    def load(self) -> SyncManifest:
+        """Load the manifest stored by the last successful sync.
+
+        Returns:
+            The stored manifest or, if there is no valid manifest, an empty
+            manifest that is filled in by listing the bucket.
+
+        """
+        manifest = SyncManifest(self.bucket, self.prefix, hash_index=self._hash_index)
+        try:
+            tag_set = self._client.get_object_tagging(Bucket=self.bucket, Key=manifest.key)[
+                "TagSet"
+            ]
+        except ClientError:
+            LOGGER.debug("sync manifest marker not found: s3://%s/%s", self.bucket, manifest.key)
+            return manifest
+        generation = next(
+            (tag["Value"] for tag in tag_set if tag["Key"] == MANIFEST_GENERATION_TAG_KEY), None
+        )
+        cached = self._read_cache(generation) if generation else None
+        if not cached:
+            LOGGER.debug("sync manifest of s3://%s/%s is not cached", self.bucket, self.prefix)
+            return manifest
+        return cached
+
+    def save(self, manifest: SyncManifest) -> None:
+        """Store a manifest in the local cache and mark its generation in the bucket."""
+        manifest.generation = uuid.uuid4().hex
+        self._write_cache(manifest)
+        try:
+            self._client.put_object(
+                Body=b"",
+                Bucket=self.bucket,
+                Key=manifest.key,
+                Tagging=urlencode({MANIFEST_GENERATION_TAG_KEY: manifest.generation}),
+            )
+        except ClientError as exc:
+            # the sync itself succeeded; the bucket is listed again next time
+            LOGGER.warning(
+                "unable to write sync manifest marker s3://%s/%s: %s",
+                self.bucket,
+                manifest.key,
+                exc,
+            )
+
+    def _read_cache(self, generation: str) -> SyncManifest | None:
+        """Read the local copy of a manifest if it is the expected generation."""
+        try:
+            content = json.loads(self.cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(content, dict) or content.get("generation") != generation:
+            return None
+        return SyncManifest.from_dict(
+            content, self.bucket, self.prefix, generation=generation, hash_index=self._hash_index
+        )
+
+    def _write_cache(self, manifest: SyncManifest) -> None:
+        """Write a local copy of a manifest."""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"generation": manifest.generation, **manifest.to_dict()}))
+        tmp_path.replace(self.cache_path)
@@ -23,6 +23,10 @@ class ParametersDataModel(BaseModel):
     Attributes:
         dest: File/object destination.
         src: File/object source.
+        content_hash: When uploading, compare the content of local files with
+            objects rather than their last modified time.
+        content_hash_index: File used to store the content hash of local files
+            between syncs.
         content_type: Explicitly provided content type.
         delete: Whether or not to delete files at the destination that are
             missing from the source location.
@@ -39,6 +43,9 @@ class ParametersDataModel(BaseModel):
         include: List of patterns for files/objects to explicitly include.
         is_move: Whether or not the action is move.
         is_stream: Source or destination is a stream.
+        list_concurrency: Number of list calls made concurrently when listing
+            the objects under a prefix. If greater than 1, the prefixes under
+            it are discovered and listed in parallel.
         no_progress: Whether to not show progress.
         only_show_errors: Whether or not to only show errors while running.
         page_size: Number of objects to list per call.
@@ -52,6 +59,8 @@ class ParametersDataModel(BaseModel):
     dest: str
     src: str
     # these need to be set after dest & src so their validators can access the value if needed
+    content_hash: bool = False
+    content_hash_index: Path | None = None
     content_type: str | None = None
     delete: bool = False
     dir_op: bool = False
@@ -66,6 +75,7 @@ class ParametersDataModel(BaseModel):
     include: list[str] = []
     is_move: bool = False
     is_stream: bool = False
+    list_concurrency: int = 1
     no_progress: bool = False
     only_show_errors: bool = False
     page_size: int | None = None
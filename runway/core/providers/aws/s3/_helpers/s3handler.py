@@ -21,6 +21,8 @@ from typing import (
 
 from s3transfer.manager import TransferManager
 
+from .batch_delete import BatchDeleter
+from .hash_index import CONTENT_HASH_METADATA_KEY, get_hash_index
 from .results import (
     CommandResultRecorder,
     CopyResultSubscriber,
@@ -60,6 +62,7 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
+    import concurrent.futures
     from collections.abc import Iterator
     from queue import Queue
 
@@ -193,7 +196,7 @@ class S3TransferHandler:
             UploadRequestSubmitter(*submitter_args),
             DownloadRequestSubmitter(*submitter_args),
             CopyRequestSubmitter(*submitter_args),
-            DeleteRequestSubmitter(*submitter_args),
+            BatchDeleteRequestSubmitter(*submitter_args),
             LocalDeleteRequestSubmitter(*submitter_args),
         ]
 
@@ -217,6 +220,8 @@ class S3TransferHandler:
                         if submitter.submit(fileinfo):
                             total_submissions += 1
                         break
+            for submitter in self._submitters:
+                submitter.flush()
             self._result_command_recorder.notify_total_submissions(total_submissions)
         return self._result_command_recorder.get_command_result()
 
@@ -288,6 +293,9 @@ class BaseTransferRequestSubmitter:
         """
         raise NotImplementedError("can_submit()")
 
+    def flush(self) -> None:
+        """Submit and wait for any transfer requests buffered by the submitter."""
+
     def _do_submit(self, fileinfo: FileInfo) -> TransferFuture | None:
         """Do submit."""
         extra_args: dict[Any, Any] = {}
@@ -446,6 +454,11 @@ class UploadRequestSubmitter(BaseTransferRequestSubmitter):
         """Submit transfer request."""
         bucket, key = find_bucket_key(str(fileinfo.dest))
         filein = self._get_filein(fileinfo)
+        if self._config_params.content_hash:
+            # stored so the content of multipart objects can be compared on the next sync
+            extra_args.setdefault("Metadata", {})[CONTENT_HASH_METADATA_KEY] = get_hash_index(
+                self._config_params.content_hash_index
+            ).md5(filein)
         return self._transfer_manager.upload(
             fileobj=filein,
             bucket=bucket,
@@ -723,6 +736,55 @@ class DeleteRequestSubmitter(BaseTransferRequestSubmitter):
         return self._format_s3_path(fileinfo.src), None
 
 
+class BatchDeleteRequestSubmitter(DeleteRequestSubmitter):
+    """Delete request submitter that deletes objects in batches.
+
+    Objects are deleted with DeleteObjects requests of up to 1000 objects
+    that are sent concurrently instead of a DeleteObject request per object.
+
+    """
+
+    def __init__(
+        self,
+        transfer_manager: TransferManager,
+        result_queue: Queue[Any],
+        config_params: ParametersDataModel,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            transfer_manager: The underlying transfer manager.
+            result_queue: The result queue to use.
+            config_params: The associated CLI parameters passed in to the
+                command as a dictionary.
+
+        """
+        super().__init__(transfer_manager, result_queue, config_params)
+        extra_args: dict[str, Any] = {}
+        RequestParamsMapper.map_delete_object_params(extra_args, config_params.dict())
+        self._deleter = BatchDeleter(
+            transfer_manager.client,
+            extra_args=extra_args,
+            max_workers=transfer_manager.config.max_request_concurrency,
+            result_queue=result_queue,
+            transfer_type="move" if config_params.is_move else "delete",
+        )
+
+    def flush(self) -> None:
+        """Delete objects that are waiting for a batch to fill and wait for all requests."""
+        self._deleter.flush()
+
+    def _submit_transfer_request(  # type: ignore
+        self,
+        fileinfo: FileInfo,
+        extra_args: dict[str, Any],  # noqa: ARG002
+        subscribers: list[BaseSubscriber],  # noqa: ARG002
+    ) -> concurrent.futures.Future[None]:
+        """Submit transfer request."""
+        bucket, key = find_bucket_key(str(fileinfo.src))
+        return self._deleter.add(bucket, key)
+
+
 class LocalDeleteRequestSubmitter(BaseTransferRequestSubmitter):
     """Local delete request submitter."""
 
@@ -6,6 +6,7 @@
 """
 
 from .base import BaseSync, MissingFileSync, NeverSync, SizeAndLastModifiedSync
+from .content_hash import ContentHashSync
 from .delete import DeleteSync
 from .exact_timestamps import ExactTimestampsSync
 from .register import register_sync_strategies
@@ -13,6 +14,7 @@ from .size_only import SizeOnlySync
 
 __all__ = [
     "BaseSync",
+    "ContentHashSync",
     "DeleteSync",
     "ExactTimestampsSync",
     "MissingFileSync",
@@ -0,0 +1,111 @@
+"""Content hash sync strategy."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from botocore.exceptions import ClientError
+
+from ..hash_index import CONTENT_HASH_METADATA_KEY, get_hash_index
+from ..utils import find_bucket_key
+from .base import SizeAndLastModifiedSync
+
+if TYPE_CHECKING:
+    from mypy_boto3_s3.client import S3Client
+    from typing_extensions import Literal, Self
+
+    from ..file_generator import FileStats
+    from ..hash_index import LocalHashIndex
+    from ..parameters import ParametersDataModel
+    from .base import ValidSyncType
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+
+class ContentHashSync(SizeAndLastModifiedSync):
+    """Compare the content of local files with S3 objects when uploading.
+
+    The MD5 of a local file is compared with the ETag of the object or, when
+    they differ, the content hash stored in its metadata when it was uploaded
+    (the ETag of multipart and SSE-KMS encrypted objects is not an MD5).
+    Other operations compare size and last modified time.
+
+    """
+
+    NAME: ClassVar[Literal["content_hash"]] = "content_hash"
+
+    def __init__(self, sync_type: ValidSyncType = "file_at_src_and_dest") -> None:
+        """Instantiate class.
+
+        Args:
+            sync_type: This determines where the sync strategy will be
+                used. There are three strings to choose from.
+
+        """
+        super().__init__(sync_type)
+        self._client: S3Client | None = None
+        self._index: LocalHashIndex | None = None
+
+    def compare_content_hash(self, src_file: FileStats, dest_file: FileStats) -> bool:
+        """Compare the content of a local file with an S3 object.
+
+        Returns:
+            True if the content of the local file and the object are the same.
+
+        """
+        if not self._index:
+            return False
+        try:
+            local_md5 = self._index.md5(src_file.src)
+        except OSError:
+            return False
+        etag = str((dest_file.response_data or {}).get("ETag", "")).strip('"')
+        if etag == local_md5:
+            return True
+        if not self._client:
+            return False
+        # the ETag of multipart and SSE-KMS encrypted objects is not the MD5 of their content
+        bucket, key = find_bucket_key(str(dest_file.src))
+        try:
+            metadata = self._client.head_object(Bucket=bucket, Key=key).get("Metadata", {})
+        except ClientError:
+            return False
+        return metadata.get(CONTENT_HASH_METADATA_KEY) == local_md5
+
+    def determine_should_sync(
+        self, src_file: FileStats | None, dest_file: FileStats | None
+    ) -> bool:
+        """Determine if file should sync."""
+        if not (src_file and dest_file):
+            raise ValueError("src_file and dest_file must not be None")
+        if src_file.operation_name != "upload":
+            return super().determine_should_sync(src_file, dest_file)
+        same_size = self.compare_size(src_file, dest_file)
+        same_content = same_size and self.compare_content_hash(src_file, dest_file)
+        if not same_content:
+            LOGGER.debug(
+                "syncing: %s -> %s, size_changed: %s, content_changed: %s",
+                src_file.src,
+                src_file.dest,
+                not same_size,
+                not same_content,
+            )
+        return not same_content
+
+    def use_sync_strategy(
+        self, params: ParametersDataModel, client: S3Client | None = None, **kwargs: Any
+    ) -> Self | None:
+        """Determine which sync strategy to use.
+
+        Args:
+            params: All arguments that a sync strategy is able to process.
+            client: S3 client used to retrieve the metadata of multipart objects.
+            **kwargs: Arbitrary keyword arguments.
+
+        """
+        strategy = super().use_sync_strategy(params, **kwargs)
+        if strategy:
+            self._client = client
+            self._index = get_hash_index(params.content_hash_index)
+        return strategy
@@ -8,7 +8,10 @@
 
 from __future__ import annotations
 
+import collections
 import errno
+import heapq
+import itertools
 import logging
 import mimetypes
 import os
@@ -16,6 +19,7 @@ import os.path
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import (
@@ -23,6 +27,7 @@ from typing import (
     Any,
     BinaryIO,
     Callable,
+    ClassVar,
     NamedTuple,
     TextIO,
     overload,
@@ -34,10 +39,15 @@ from s3transfer.subscribers import BaseSubscriber
 
 if TYPE_CHECKING:
     from collections.abc import Generator
+    from concurrent.futures import Future
     from queue import Queue
 
     from mypy_boto3_s3.client import S3Client
-    from mypy_boto3_s3.type_defs import DeleteObjectRequestRequestTypeDef, ObjectTypeDef
+    from mypy_boto3_s3.type_defs import (
+        DeleteObjectRequestRequestTypeDef,
+        ListObjectsV2OutputTypeDef,
+        ObjectTypeDef,
+    )
     from s3transfer.futures import TransferFuture
     from s3transfer.utils import CallArgs
 
@@ -146,6 +156,195 @@ class BucketLister:
                 yield source_path, content
 
 
+class ShardedBucketLister(BucketLister):
+    """List keys in a bucket, listing the prefixes of the bucket concurrently.
+
+    Prefixes are discovered by listing with a delimiter. Each prefix is then
+    listed concurrently, prefetching one page ahead, and the results are merged
+    back into the order they are returned by S3 (UTF-8 binary order of the key)
+    so the result is the same as :class:`BucketLister`.
+
+    The prefixes found at the deepest level cover separate ranges of keys so they
+    are listed one after another, starting to list at most ``max_workers`` of
+    them ahead of the one being consumed. This bounds the number of pages held
+    in memory regardless of the number of prefixes.
+
+    """
+
+    DELIMITER: ClassVar[str] = "/"
+
+    MAX_DEPTH: ClassVar[int] = 3
+    """Maximum number of levels of prefixes used to discover shards."""
+
+    def __init__(
+        self,
+        client: S3Client,
+        date_parser: Callable[[datetime | str], datetime] = _date_parser,
+        max_workers: int = 10,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            client: boto3 S3 client.
+            date_parser: Parser for date string.
+            max_workers: Maximum number of concurrent list calls.
+
+        """
+        super().__init__(client, date_parser)
+        self.max_workers = max_workers
+
+    def list_objects(
+        self,
+        bucket: str,
+        prefix: str | None = None,
+        page_size: int | None = None,
+        extra_args: Any = None,
+    ) -> Generator[tuple[str, ObjectTypeDef], None, None]:
+        """List objects in S3 bucket.
+
+        Args:
+            bucket: Bucket name.
+            prefix: Object prefix.
+            page_size: Number of items per page
+            extra_args: Additional arguments to pass to list call.
+
+        """
+        kwargs: dict[str, Any] = {"Bucket": bucket, **(extra_args or {})}
+        if page_size:
+            kwargs["MaxKeys"] = page_size
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            shards = self._discover_shards(executor, kwargs, prefix or "")
+            yield from heapq.merge(
+                *(
+                    self._list_shard(bucket, executor, kwargs, shard_prefix, delimited=True)
+                    for shard_prefix, delimited in shards
+                    if delimited
+                ),
+                self._list_shards_in_order(
+                    bucket,
+                    executor,
+                    kwargs,
+                    [shard_prefix for shard_prefix, delimited in shards if not delimited],
+                ),
+                key=lambda obj: obj[0],
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _discover_shards(
+        self, executor: ThreadPoolExecutor, kwargs: dict[str, Any], prefix: str
+    ) -> list[tuple[str, bool]]:
+        """Split a prefix into shards that can be listed independently.
+
+        Prefixes are split one level at a time until there are enough shards
+        to keep every worker busy.
+
+        Returns:
+            List of prefixes and whether only the objects directly under the prefix
+            (``True``) or every object under the prefix (``False``) are in the shard.
+
+        """
+        shards: list[tuple[str, bool]] = []
+        pending = [prefix]
+        for _ in range(self.MAX_DEPTH):
+            if not pending or len(shards) + len(pending) >= self.max_workers:
+                break
+            shards.extend((i, True) for i in pending)
+            pending = [
+                common_prefix
+                for common_prefixes in executor.map(
+                    lambda i: self._list_common_prefixes(kwargs, i), pending
+                )
+                for common_prefix in common_prefixes
+            ]
+        return shards + [(i, False) for i in pending]
+
+    def _list_common_prefixes(self, kwargs: dict[str, Any], prefix: str) -> list[str]:
+        """List the prefixes directly under a prefix."""
+        paginator = self._client.get_paginator("list_objects_v2")
+        return [
+            common_prefix["Prefix"]
+            for page in paginator.paginate(  # type: ignore
+                **kwargs, Delimiter=self.DELIMITER, Prefix=prefix
+            )
+            for common_prefix in page.get("CommonPrefixes", [])
+            if "Prefix" in common_prefix
+        ]
+
+    def _list_shard(
+        self,
+        bucket: str,
+        executor: ThreadPoolExecutor,
+        kwargs: dict[str, Any],
+        prefix: str,
+        *,
+        delimited: bool,
+    ) -> Generator[tuple[str, ObjectTypeDef], None, None]:
+        """List the objects in a shard.
+
+        The first page is requested before the generator is iterated so all
+        shards are listed concurrently. Each page after that is requested
+        while the previous page is being consumed.
+
+        """
+        kwargs = {**kwargs, "Prefix": prefix}
+        if delimited:
+            kwargs["Delimiter"] = self.DELIMITER
+        future: Future[ListObjectsV2OutputTypeDef] | None = executor.submit(
+            self._client.list_objects_v2, **kwargs
+        )
+
+        def _iter_pages() -> Generator[tuple[str, ObjectTypeDef], None, None]:
+            nonlocal future
+            while future:
+                page = future.result()
+                future = (
+                    executor.submit(
+                        self._client.list_objects_v2,
+                        **kwargs,
+                        ContinuationToken=page["NextContinuationToken"],
+                    )
+                    if page.get("IsTruncated")
+                    else None
+                )
+                for content in page.get("Contents", []):
+                    if "LastModified" in content:
+                        content["LastModified"] = self._date_parser(content["LastModified"])
+                    yield bucket + "/" + content.get("Key", ""), content
+
+        return _iter_pages()
+
+    def _list_shards_in_order(
+        self,
+        bucket: str,
+        executor: ThreadPoolExecutor,
+        kwargs: dict[str, Any],
+        prefixes: list[str],
+    ) -> Generator[tuple[str, ObjectTypeDef], None, None]:
+        """List every object under each prefix, one prefix after another.
+
+        The prefixes must be sorted and none can start with another so the
+        keys under each prefix come after the keys under the previous one.
+        Listing of the next ``max_workers`` prefixes is started while a prefix
+        is being consumed.
+
+        """
+        remaining = iter(prefixes)
+        window = collections.deque(
+            self._list_shard(bucket, executor, kwargs, shard_prefix, delimited=False)
+            for shard_prefix in itertools.islice(remaining, self.max_workers)
+        )
+        while window:
+            shard = window.popleft()
+            next_prefix = next(remaining, None)
+            if next_prefix is not None:
+                window.append(
+                    self._list_shard(bucket, executor, kwargs, next_prefix, delimited=False)
+                )
+            yield from shard
+
+
 class OnDoneFilteredSubscriber(BaseSubscriber):
     """Subscriber that differentiates between successes and failures.
 
@@ -740,12 +939,18 @@ def find_dest_path_comp_key(
     return dest_path, compare_key
 
 
-def get_file_stat(path: Path) -> tuple[int, datetime | None]:
-    """Get size of file in bytes and last modified time stamp."""
+def get_file_stat(path: Path | os.DirEntry[str]) -> tuple[int, datetime | None]:
+    """Get size of file in bytes and last modified time stamp.
+
+    Args:
+        path: Path to a file. When provided an :class:`os.DirEntry`, its cached
+            stat result is used if available.
+
+    """
     try:
         stats = path.stat()
     except OSError as exc:
-        raise ValueError(f"Could not retrieve file stat of {path}: {exc}") from exc
+        raise ValueError(f"Could not retrieve file stat of {os.fspath(path)}: {exc}") from exc
 
     try:
         update_time = datetime.fromtimestamp(stats.st_mtime, tzlocal())
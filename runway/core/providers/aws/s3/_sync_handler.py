@@ -6,15 +6,20 @@ from typing import TYPE_CHECKING
 
 from .....compat import cached_property
 from ._helpers.action_architecture import ActionArchitecture
+from ._helpers.format_path import FormatPath
+from ._helpers.hash_index import get_hash_index
+from ._helpers.manifest import SyncManifestStore
 from ._helpers.parameters import Parameters, ParametersDataModel
 from ._helpers.sync_strategy.register import register_sync_strategies
 from ._helpers.transfer_config import RuntimeConfig
+from ._helpers.utils import find_bucket_key
 
 if TYPE_CHECKING:
     import boto3
     from mypy_boto3_s3.client import S3Client
 
     from .....context import CfnginContext, RunwayContext
+    from ._helpers.manifest import SyncManifest
     from ._helpers.transfer_config import TransferConfigDict
 
 
@@ -25,11 +30,14 @@ class S3SyncHandler:
         self,
         context: CfnginContext | RunwayContext,
         *,
+        content_hash: bool = False,
         delete: bool = False,
         dest: str,
         exclude: list[str] | None = None,
         follow_symlinks: bool = False,
         include: list[str] | None = None,
+        list_concurrency: int = 1,
+        manifest: bool = False,
         page_size: int | None = None,
         session: boto3.Session | None = None,
         src: str,
@@ -38,12 +46,23 @@ class S3SyncHandler:
 
         Args:
             context: Runway or CFNgin context object.
+            content_hash: If true, local files are uploaded when their content
+                differs from the object rather than when they are newer. The
+                content hash of local files is stored in the Runway work directory
+                so unchanged files are not hashed again.
             delete: If true, files that exist in the destination but not in the
                 source are deleted.
             dest: Destination path.
             exclude: List of patterns for files/objects to exclude.
             follow_symlinks: If symlinks should be followed.
             include: List of patterns for files/objects to explicitly include.
+            list_concurrency: Number of list calls made concurrently when listing
+                the objects in a bucket. Speeds up listing buckets containing
+                many objects spread across prefixes.
+            manifest: If true, a manifest of the objects in the destination is
+                stored in the Runway work directory after each upload and used in
+                place of listing the destination on the next upload. Only use this
+                for destinations that are not modified by anything else.
             page_size: Number of items per page.
             session: boto3 Session.
             src: Source path.
@@ -52,6 +71,7 @@ class S3SyncHandler:
         self._session = session or context.get_session(region=context.env.aws_region)
         self._botocore_session = self._session._session
         self.ctx = context
+        self.manifest = manifest
         self.instructions = [
             "file_generator",
             "comparator",
@@ -61,11 +81,18 @@ class S3SyncHandler:
         self.parameters = Parameters(
             "sync",
             ParametersDataModel(
+                content_hash=content_hash,
+                content_hash_index=(
+                    context.work_dir / "cache" / "s3_sync" / "content_hash_index.json"
+                    if content_hash
+                    else None
+                ),
                 delete=delete,
                 dest=dest,
                 exclude=exclude or [],
                 follow_symlinks=follow_symlinks,
                 include=include or [],
+                list_concurrency=list_concurrency,
                 page_size=page_size,
                 src=src,
             ),
@@ -85,13 +112,44 @@ class S3SyncHandler:
             )
         )
 
+    @cached_property
+    def manifest_store(self) -> SyncManifestStore | None:
+        """Store of the manifest of the destination if one is used."""
+        if not self.manifest or self.parameters.data.paths_type != "locals3":
+            return None
+        bucket, prefix = find_bucket_key(
+            FormatPath.format(self.parameters.data.src, self.parameters.data.dest)["dest"]["path"]
+        )
+        return SyncManifestStore(
+            self.client,
+            bucket,
+            prefix,
+            self.ctx.work_dir / "cache" / "s3_sync" / "manifests",
+            hash_index=(
+                get_hash_index(self.parameters.data.content_hash_index)
+                if self.parameters.data.content_hash
+                else None
+            ),
+        )
+
     def run(self) -> None:
         """Run sync."""
         register_sync_strategies(self._botocore_session)
-        ActionArchitecture(
-            session=self._session,
-            botocore_session=self._botocore_session,
-            action="sync",
-            parameters=self.parameters.data,
-            runtime_config=self.transfer_config,
-        ).run()
+        manifest: SyncManifest | None = None
+        if self.manifest_store:
+            manifest = self.manifest_store.load()
+            self.manifest_store.invalidate(manifest)
+        try:
+            return_code = ActionArchitecture(
+                session=self._session,
+                botocore_session=self._botocore_session,
+                action="sync",
+                parameters=self.parameters.data,
+                runtime_config=self.transfer_config,
+                manifest=manifest,
+            ).run()
+            if self.manifest_store and manifest and manifest.complete and return_code == 0:
+                self.manifest_store.save(manifest)
+        finally:
+            if self.parameters.data.content_hash:
+                get_hash_index(self.parameters.data.content_hash_index).save()
@@ -0,0 +1,248 @@
+"""Cache of lookup results."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from pydantic import ConfigDict
+
+from ..utils import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+LookupCacheScopeTypeDef = Literal["context", "disk", "run"]
+
+
+class LookupCachePolicy(BaseModel):
+    """How the results of a lookup handler are cached.
+
+    Attributes:
+        scope: Where results are cached.
+            ``context`` caches results for the life of a context object.
+            ``run`` caches results for the life of the process.
+            ``disk`` caches results in the Runway work directory so they
+            persist between runs. Only use ``disk`` for results that are
+            not sensitive and can be serialized to JSON.
+        ttl: Number of seconds a result is cached for.
+            If not provided, results do not expire.
+
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    scope: LookupCacheScopeTypeDef = "context"
+    ttl: float | None = None
+
+
+class LookupCacheStats:
+    """Thread-safe count of cache hits and misses for each lookup."""
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        self._lock = threading.Lock()
+        # lookup name -> [hits, misses]
+        self._counts: dict[str, list[int]] = {}
+
+    def get(self, lookup_name: str) -> tuple[int, int]:
+        """Get the number of hits and misses of a lookup.
+
+        Args:
+            lookup_name: Name of the lookup.
+
+        """
+        with self._lock:
+            hits, misses = self._counts.get(lookup_name, [0, 0])
+            return hits, misses
+
+    def log(self) -> None:
+        """Log the hit ratio of each lookup that has used the cache."""
+        with self._lock:
+            counts = sorted(self._counts.items())
+        for lookup_name, (hits, misses) in counts:
+            LOGGER.debug(
+                "%s lookup cache: %s hits, %s misses (%.0f%% hit ratio)",
+                lookup_name,
+                hits,
+                misses,
+                hits / (hits + misses) * 100,
+            )
+
+    def record(self, lookup_name: str, *, hit: bool) -> None:
+        """Record a cache hit or miss.
+
+        Args:
+            lookup_name: Name of the lookup.
+            hit: Whether the result was found in the cache.
+
+        """
+        with self._lock:
+            self._counts.setdefault(lookup_name, [0, 0])[0 if hit else 1] += 1
+
+
+class LookupCache:
+    """Thread-safe cache of lookup results.
+
+    Results are stored in memory and, if a path is provided, in a directory
+    where each result is stored in its own file named after the hash of its key.
+
+    Attributes:
+        path: Directory where results are stored.
+
+    """
+
+    path: Path | None
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Instantiate class.
+
+        Args:
+            path: Directory where results are stored.
+                If not provided, results are only stored in memory.
+
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # hash of key -> (time the result expires, result)
+        self._results: dict[str, tuple[float | None, Any]] = {}
+
+    def clear(self) -> None:
+        """Remove all results stored in memory."""
+        with self._lock:
+            self._results.clear()
+
+    def get(self, key: tuple[Any, ...]) -> tuple[bool, Any]:
+        """Get a result from the cache.
+
+        Args:
+            key: Key of the result.
+
+        Returns:
+            Whether the result was found and the result.
+
+        """
+        digest = self._digest(key)
+        with self._lock:
+            cached = self._results.get(digest)
+        if cached is None and self.path:
+            cached = self._read(digest)
+        if cached is None or (cached[0] is not None and cached[0] <= time.time()):
+            return False, None
+        return True, cached[1]
+
+    def set(self, key: tuple[Any, ...], value: Any, *, ttl: float | None = None) -> None:
+        """Store a result in the cache.
+
+        Args:
+            key: Key of the result.
+            value: The result.
+            ttl: Number of seconds the result is cached for.
+
+        """
+        digest = self._digest(key)
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._results[digest] = (expires, value)
+        if self.path:
+            self._write(digest, expires, value)
+
+    @staticmethod
+    def _digest(key: tuple[Any, ...]) -> str:
+        """Hash the key of a result."""
+        return hashlib.sha256(repr(key).encode()).hexdigest()
+
+    def _read(self, digest: str) -> tuple[float | None, Any] | None:
+        """Read a result stored on disk."""
+        if not self.path:
+            return None
+        entry = self.path / f"{digest}.json"
+        try:
+            data = json.loads(entry.read_text())
+            cached = (data["expires"], data["value"])
+        except FileNotFoundError:
+            return None
+        except (KeyError, TypeError, ValueError):
+            LOGGER.debug("ignoring invalid lookup cache entry: %s", entry)
+            return None
+        with self._lock:
+            self._results[digest] = cached
+        return cached
+
+    def _write(self, digest: str, expires: float | None, value: Any) -> None:
+        """Write a result to disk."""
+        if not self.path:
+            return
+        try:
+            content = json.dumps({"expires": expires, "value": value})
+        except (TypeError, ValueError):
+            LOGGER.debug("lookup result can't be stored on disk; only caching in memory")
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        entry = self.path / f"{digest}.json"
+        tmp_path = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(content)
+        tmp_path.replace(entry)
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key.
+
+    While a call is in flight, other threads calling with the same key wait
+    for it to finish and receive its result (or exception) instead of making
+    the call again.
+
+    """
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, concurrent.futures.Future[Any]] = {}
+
+    def do(self, key: Hashable, func: Callable[[], _T]) -> _T:
+        """Call a function unless a call with the same key is already in flight.
+
+        Args:
+            key: Key identifying the call.
+            func: Function to call.
+
+        Returns:
+            The result of the call.
+
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = concurrent.futures.Future()
+        if not leader:
+            return future.result()
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+RUN_LOOKUP_CACHE = LookupCache()
+"""Lookup results cached for the life of the process."""
+
+LOOKUP_CACHE_STATS = LookupCacheStats()
+"""Cache hits and misses of each lookup for the life of the process."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -14,11 +15,15 @@ from typing_extensions import Literal
 
 from ...cfngin.utils import read_value_from_path
 from ...utils import MutableMap
+from ..cache import LOOKUP_CACHE_STATS, RUN_LOOKUP_CACHE
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
     from ...cfngin.providers.aws.default import Provider
     from ...context import CfnginContext, RunwayContext
     from ...variables import VariableValue
+    from ..cache import LookupCache, LookupCachePolicy
 
 LOGGER = logging.getLogger(__name__)
 
@@ -54,6 +59,17 @@ class ParsedArgsTypeDef(TypedDict, total=False):
 class LookupHandler(ABC, Generic[ContextTypeVar]):
     """Base class for lookup handlers."""
 
+    CACHE_POLICY: ClassVar[LookupCachePolicy | None] = None
+    """How the results of the lookup are cached. Results are not cached if not provided."""
+
+    IDEMPOTENT: ClassVar[bool] = True
+    """Whether the same query always results in the same value.
+
+    Identical lookups of idempotent handlers are only resolved once when
+    resolving multiple variables together.
+
+    """
+
     TYPE_NAME: ClassVar[str]
     """Name that the Lookup is registered as."""
 
@@ -147,6 +163,60 @@ class LookupHandler(ABC, Generic[ContextTypeVar]):
         """
         raise NotImplementedError
 
+    @classmethod
+    def cache_invalidation_key(cls, value: Any, context: ContextTypeVar) -> Any:  # noqa: ARG003
+        """Value included in the key of cached results.
+
+        When it changes, results cached with the previous value are no longer used.
+        By default, this is the region and AWS credentials being used so that
+        results are not shared between accounts.
+
+        Args:
+            value: Parameter(s) given to the lookup.
+            context: The current context object.
+
+        """
+        return (
+            context.env.aws_region,
+            context.env.aws_profile,
+            context.env.vars.get("AWS_ACCESS_KEY_ID"),
+        )
+
+    @classmethod
+    def handle_cached(cls, value: Any, context: ContextTypeVar, **kwargs: Any) -> Any:
+        """Perform the lookup, using the result cached by :attr:`CACHE_POLICY` if available.
+
+        Args:
+            value: Parameter(s) given to the lookup.
+            context: The current context object.
+            **kwargs: Arbitrary keyword arguments passed to :meth:`handle`.
+
+        """
+        if not cls.CACHE_POLICY:
+            return cls.handle(value, context=context, **kwargs)
+        cache = cls._get_cache(context)
+        key = (
+            f"{cls.__module__}.{cls.__qualname__}",
+            value,
+            cls.cache_invalidation_key(value, context),
+        )
+        found, result = cache.get(key)
+        LOOKUP_CACHE_STATS.record(cls.TYPE_NAME, hit=found)
+        if not found:
+            result = cls.handle(value, context=context, **kwargs)
+            cache.set(key, result, ttl=cls.CACHE_POLICY.ttl)
+        return result
+
+    @classmethod
+    def _get_cache(cls, context: ContextTypeVar) -> LookupCache:
+        """Get the cache used for the scope of :attr:`CACHE_POLICY`."""
+        scope = cls.CACHE_POLICY.scope if cls.CACHE_POLICY else "context"
+        if scope == "disk":
+            return context.lookup_disk_store
+        if scope == "run":
+            return RUN_LOOKUP_CACHE
+        return context.lookup_results
+
     @classmethod
     def parse(cls, value: str) -> tuple[str, ParsedArgsTypeDef]:
         """Parse the value passed to a lookup in a standardized way.
@@ -187,6 +257,29 @@ class LookupHandler(ABC, Generic[ContextTypeVar]):
             key.strip(): value.strip() for key, value in [arg.split("=", 1) for arg in split_args]
         }
 
+    @classmethod
+    def prefetch(
+        cls, __values: list[str], __context: ContextTypeVar
+    ) -> AbstractContextManager[None]:
+        """Retrieve the values of many lookups at once before they are resolved.
+
+        Lookups that can retrieve many values with fewer API calls than it
+        would take to retrieve them one at a time can override this to store
+        the values in :attr:`runway.context.CfnginContext.lookup_prefetch` where
+        :meth:`handle` can use them.
+
+        Args:
+            __values: Values passed to each lookup of this type that is about
+                to be resolved. Lookups nested within them have been resolved.
+            __context: The current context object.
+
+        Returns:
+            Context manager that is active while the lookups are resolved.
+            Prefetched values should be removed when it exits.
+
+        """
+        return contextlib.nullcontext()
+
     @classmethod
     def load(cls, value: Any, parser: str | None = None, **kwargs: Any) -> Any:
         """Load a formatted string or object into a python data type.
@@ -118,7 +118,9 @@ class CfnLookup(LookupHandler["CfnginContext | RunwayContext"]):
                 # this will only happen when used from cfngin
                 result = cast("Provider", provider).get_output(query.stack_name, query.output_name)
             else:
-                cfn_client = context.get_session(region=args.get("region")).client("cloudformation")
+                cfn_client: CloudFormationClient = context.get_client(
+                    "cloudformation", region=args.get("region")
+                )
                 result = cls.get_stack_output(cfn_client, query)
         except (ClientError, KeyError, StackDoesNotExist) as exc:
             # StackDoesNotExist is only raised by provider
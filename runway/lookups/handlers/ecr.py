@@ -6,7 +6,8 @@ import base64
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from ...lookups.handlers.base import LookupHandler
+from ..cache import LookupCachePolicy
+from .base import LookupHandler
 
 if TYPE_CHECKING:
     from mypy_boto3_ecr.client import ECRClient
@@ -19,6 +20,9 @@ LOGGER = logging.getLogger(__name__)
 class EcrLookup(LookupHandler["CfnginContext | RunwayContext"]):
     """ECR Lookup."""
 
+    CACHE_POLICY: ClassVar[LookupCachePolicy | None] = LookupCachePolicy(ttl=3600)
+    """How the results of the lookup are cached. Login passwords are valid for 12 hours."""
+
     TYPE_NAME: ClassVar[str] = "ecr"
     """Name that the Lookup is registered as."""
 
@@ -43,8 +47,7 @@ class EcrLookup(LookupHandler["CfnginContext | RunwayContext"]):
         """
         query, args = cls.parse(value)
 
-        session = context.get_session(region=args.get("region"))
-        client = session.client("ecr")
+        client: ECRClient = context.get_client("ecr", region=args.get("region"))
 
         if query == "login-password":
             result = cls.get_login_password(client)
@@ -29,6 +29,9 @@ class ArgsDataModel(BaseModel):
 class RandomStringLookup(LookupHandler[Any]):
     """Random string lookup."""
 
+    IDEMPOTENT: ClassVar[bool] = False
+    """Whether the same query always results in the same value."""
+
     TYPE_NAME: ClassVar[str] = "random.string"
     """Name that the Lookup is registered as."""
 
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar
 
+import botocore.exceptions
+
 from ...lookups.handlers.base import LookupHandler
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from mypy_boto3_ssm.client import SSMClient
     from mypy_boto3_ssm.type_defs import ParameterTypeDef
 
     from ...context import CfnginContext, RunwayContext
@@ -18,6 +25,12 @@ LOGGER = logging.getLogger(__name__)
 class SsmLookup(LookupHandler["CfnginContext | RunwayContext"]):
     """SSM Parameter Store Lookup."""
 
+    MAX_PREFETCH_WORKERS: ClassVar[int] = 4
+    """Maximum number of concurrent ``GetParameters`` calls made when prefetching."""
+
+    PREFETCH_BATCH_SIZE: ClassVar[int] = 10
+    """Maximum number of parameters ``GetParameters`` accepts in a single call."""
+
     TYPE_NAME: ClassVar[str] = "ssm"
     """Name that the Lookup is registered as."""
 
@@ -36,8 +49,11 @@ class SsmLookup(LookupHandler["CfnginContext | RunwayContext"]):
         """
         query, args = cls.parse(value)
 
-        session = context.get_session(region=args.get("region"))
-        client = session.client("ssm")
+        prefetched = context.lookup_prefetch.get(cls.TYPE_NAME, {}).get((args.get("region"), query))
+        if prefetched:
+            return cls.format_results(cls._handle_get_parameter(prefetched), **args)
+
+        client: SSMClient = context.get_client("ssm", region=args.get("region"))
 
         try:
             return cls.format_results(
@@ -52,6 +68,81 @@ class SsmLookup(LookupHandler["CfnginContext | RunwayContext"]):
                 return cls.format_results(args.pop("default"), **args)
             raise
 
+    @classmethod
+    @contextlib.contextmanager
+    def prefetch(cls, values: list[str], context: CfnginContext | RunwayContext) -> Iterator[None]:
+        """Retrieve parameters in bulk using ``GetParameters``.
+
+        Parameters are grouped by region and retrieved in batches of
+        :attr:`PREFETCH_BATCH_SIZE`, concurrently. Parameters that could not
+        be retrieved are left for :meth:`handle` to retrieve individually.
+
+        Args:
+            values: Values passed to each ``ssm`` lookup about to be resolved.
+            context: The current context object.
+
+        """
+        names_by_region: dict[str | None, set[str]] = {}
+        for value in values:
+            try:
+                query, args = cls.parse(value)
+            except (OSError, ValueError):
+                continue  # will be raised when the lookup is resolved
+            names_by_region.setdefault(args.get("region"), set()).add(query)
+
+        jobs: list[tuple[str | None, SSMClient, list[str]]] = []
+        for region, names in names_by_region.items():
+            if len(names) < 2:
+                continue  # nothing to gain over GetParameter
+            client: SSMClient = context.get_client("ssm", region=region)
+            sorted_names = sorted(names)
+            jobs.extend(
+                (region, client, sorted_names[i : i + cls.PREFETCH_BATCH_SIZE])
+                for i in range(0, len(sorted_names), cls.PREFETCH_BATCH_SIZE)
+            )
+
+        cache = context.lookup_prefetch.setdefault(cls.TYPE_NAME, {})
+        keys: list[tuple[str | None, str]] = []
+        if jobs:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(cls.MAX_PREFETCH_WORKERS, len(jobs))
+            ) as executor:
+                for region, parameters in executor.map(lambda job: cls._get_parameters(*job), jobs):
+                    for name, parameter in parameters.items():
+                        cache[(region, name)] = parameter
+                        keys.append((region, name))
+        try:
+            yield
+        finally:
+            for key in keys:
+                cache.pop(key, None)
+
+    @staticmethod
+    def _get_parameters(
+        region: str | None, client: SSMClient, names: list[str]
+    ) -> tuple[str | None, dict[str, ParameterTypeDef]]:
+        """Get parameters using ``GetParameters``.
+
+        Args:
+            region: Region the client is for.
+            client: SSM client.
+            names: Names of the parameters to get.
+
+        Returns:
+            The region and the parameters that were found keyed by the name
+            used to request them.
+
+        """
+        try:
+            response = client.get_parameters(Names=names, WithDecryption=True)
+        except botocore.exceptions.ClientError as exc:
+            LOGGER.debug("unable to prefetch SSM parameters: %s", exc)
+            return region, {}
+        return region, {
+            f"{parameter.get('Name', '')}{parameter.get('Selector', '')}": parameter
+            for parameter in response.get("Parameters", [])
+        }
+
     @staticmethod
     def _handle_get_parameter(parameter: ParameterTypeDef) -> list[str] | str | None:
         """Handle the return value of ``get_parameter``."""
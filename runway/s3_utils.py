@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING, Any, cast
 import boto3
 from botocore.exceptions import ClientError
 
+from .core.providers.aws.s3 import BatchDeleter
+
 if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
 
@@ -50,11 +52,19 @@ def purge_and_delete_bucket(
 def purge_bucket(
     bucket_name: str, region: str = "us-east-1", session: boto3.Session | None = None
 ) -> None:
-    """Delete all objects and versions in bucket."""
+    """Delete all objects and versions in bucket.
+
+    Raises:
+        Exception: The error of the first object that could not be deleted.
+
+    """
     if does_bucket_exist(bucket_name, region, session):
-        s3_resource = _get_resource(session, region)
-        bucket = s3_resource.Bucket(bucket_name)
-        bucket.object_versions.delete()
+        with BatchDeleter(_get_client(session, region)) as deleter:
+            deleter.add_all_versions(bucket_name)
+        for failure in deleter.failures:
+            LOGGER.warning("failed to delete %s: %s", failure.src, failure.exception)
+        if deleter.failures:
+            raise deleter.failures[0].exception
     else:
         LOGGER.warning('bucket "%s" does not exist in region "%s"', bucket_name, region)
 
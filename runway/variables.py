@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import functools
 import logging
+import os
 import re
 from collections.abc import Iterable, Iterator, MutableMapping, MutableSequence
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, overload
@@ -29,6 +33,13 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum number of lookups resolved concurrently by resolve_variables.
+# Can be controlled via an environment variable.
+MAX_CONCURRENT_LOOKUPS = 10
+
+# Maximum number of parsed strings kept by VariableValue.parse_obj.
+PARSE_CACHE_SIZE = 4096
+
 _LiteralValue = TypeVar("_LiteralValue", int, str)
 _PydanticModelTypeVar = TypeVar("_PydanticModelTypeVar", bound=BaseModel)
 VariableTypeLiteralTypeDef = Literal["cfngin", "runway"]
@@ -143,8 +154,141 @@ def resolve_variables(
         provider: Subclass of the base provider.
 
     """
+    with prefetch_lookups(variables, context):
+        resolve_lookups(variables, context, provider=provider)
+
+
+def resolve_lookups(
+    variables: list[Variable],
+    context: CfnginContext | RunwayContext,
+    provider: Provider | None = None,
+    *,
+    max_workers: int | None = None,
+) -> None:
+    """Resolve the lookups of many variables concurrently.
+
+    Lookups are resolved in passes. Each pass resolves the lookups whose query
+    no longer contains an unresolved lookup, using a pool of threads. Identical
+    lookups of idempotent handlers are only resolved once per pass.
+
+    Args:
+        variables: List of variables.
+        context: The current context object.
+        provider: Subclass of the base provider.
+        max_workers: Maximum number of lookups to resolve concurrently.
+            If not provided, ``CFNGIN_MAX_CONCURRENT_LOOKUPS`` is used from
+            the environment or it defaults to :data:`MAX_CONCURRENT_LOOKUPS`.
+
+    Raises:
+        FailedVariableLookup: A lookup failed. When lookups of more than one
+            variable fail, the error is raised for the first variable.
+
+    """
+    if max_workers is None:
+        max_workers = int(os.getenv("CFNGIN_MAX_CONCURRENT_LOOKUPS", str(MAX_CONCURRENT_LOOKUPS)))
+    # lookups of each variable, grouped by depth (lookups nested in a query are resolved first)
+    passes: list[list[tuple[int, VariableValueLookup]]] = []
+    for index, variable in enumerate(variables):
+        for lookup, depth in _iter_lookups_by_depth(variable._value):  # noqa: SLF001
+            passes.extend([] for _ in range(depth + 1 - len(passes)))
+            passes[depth].append((index, lookup))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        for lookups in passes:
+            groups: dict[Any, list[tuple[int, VariableValueLookup]]] = {}
+            for index, lookup in lookups:
+                groups.setdefault(_lookup_key(lookup), []).append((index, lookup))
+            futures = {
+                key: executor.submit(_handle_lookup, group[0][1], context, provider)
+                for key, group in groups.items()
+            }
+            errors: list[tuple[int, VariableValueLookup, Exception]] = []
+            for key, future in futures.items():
+                try:
+                    result = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    errors.extend((index, lookup, exc) for index, lookup in groups[key])
+                    continue
+                for _, lookup in groups[key]:
+                    lookup._resolve(result)  # noqa: SLF001
+            if errors:
+                index, lookup, exc = min(errors, key=lambda error: error[0])
+                raise FailedVariableLookup(variables[index], FailedLookup(lookup, exc)) from exc
+
+
+def _iter_lookups_by_depth(value: VariableValue) -> Iterator[tuple[VariableValueLookup, int]]:
+    """Iterate over the lookups in a variable value with how deeply lookups are nested in them.
+
+    The depth of a lookup is ``0`` if its query does not contain a lookup.
+    Otherwise, it is one more than the deepest lookup contained in its query.
+
+    """
+    if isinstance(value, VariableValueLookup):
+        depth = -1
+        for nested, nested_depth in _iter_lookups_by_depth(value.lookup_query):
+            depth = max(depth, nested_depth)
+            yield nested, nested_depth
+        yield value, depth + 1
+    elif isinstance(value, (VariableValueDict, VariableValuePydanticModel)):
+        for key in value:
+            yield from _iter_lookups_by_depth(value[key])
+    elif isinstance(value, (VariableValueList, VariableValueConcatenation)):
+        for item in value:
+            yield from _iter_lookups_by_depth(item)
+
+
+def _handle_lookup(
+    lookup: VariableValueLookup,
+    context: CfnginContext | RunwayContext,
+    provider: Provider | None,
+) -> Any:
+    """Get the result of a lookup without storing it."""
+    return lookup.handler.handle_cached(
+        lookup.lookup_query.value, context=context, provider=provider
+    )
+
+
+def _lookup_key(lookup: VariableValueLookup) -> Any:
+    """Key used to find identical lookups.
+
+    Lookups of handlers that are not idempotent or with a query that can't be
+    hashed are never considered identical to another lookup.
+
+    """
+    if not lookup.handler.IDEMPOTENT:
+        return lookup
+    try:
+        key = (lookup.handler, lookup.lookup_query.value)
+        hash(key)
+    except Exception:  # noqa: BLE001
+        return lookup  # any error is raised when the lookup is resolved
+    return key
+
+
+@contextlib.contextmanager
+def prefetch_lookups(
+    variables: Iterable[Variable], context: CfnginContext | RunwayContext
+) -> Iterator[None]:
+    """Prefetch the values of the lookups used by variables that are about to be resolved.
+
+    Lookups are grouped by handler and passed to
+    :meth:`~runway.lookups.handlers.base.LookupHandler.prefetch`.
+    Lookups whose query contains another lookup are not prefetched.
+
+    Args:
+        variables: Variables that are about to be resolved.
+        context: The current context object.
+
+    """
+    queries: dict[type[LookupHandler[Any]], list[Any]] = {}
     for variable in variables:
-        variable.resolve(context=context, provider=provider)
+        for lookup, _ in _iter_lookups_by_depth(variable._value):  # noqa: SLF001
+            if not lookup.resolved and lookup.lookup_query.resolved:
+                queries.setdefault(lookup.handler, []).append(lookup.lookup_query.value)
+    with contextlib.ExitStack() as stack:
+        for handler, values in queries.items():
+            stack.enter_context(handler.prefetch(values, context))
+        yield
 
 
 _VariableValue = TypeVar("_VariableValue", bound="VariableValue")
@@ -252,7 +396,7 @@ class VariableValue:
     ) -> VariableValueConcatenation[VariableValueLiteral[str] | VariableValueLookup]: ...
 
     @classmethod
-    def parse_obj(  # noqa: C901
+    def parse_obj(
         cls, obj: Any, variable_type: VariableTypeLiteralTypeDef = "cfngin"
     ) -> VariableValue:
         """Parse complex variable structures using type appropriate subclasses.
@@ -271,46 +415,16 @@ class VariableValue:
         if not isinstance(obj, str):
             return VariableValueLiteral(obj, variable_type=variable_type)
 
-        tokens: VariableValueConcatenation[VariableValueLiteral[str] | VariableValueLookup] = (
-            VariableValueConcatenation(
-                # pyright 1.1.138 is having issues properly inferring the type from comprehension
-                [
-                    VariableValueLiteral(cast(str, t), variable_type=variable_type)
-                    for t in re.split(r"(\$\{|\}|\s+)", obj)  # ${ or space or }
-                ]
-            )
-        )
+        return _parse_str(obj, variable_type)._clone()  # noqa: SLF001
 
-        opener = "${"
-        closer = "}"
+    def _clone(self) -> VariableValue:
+        """Copy the object so it can be resolved independently of the original.
 
-        while True:
-            last_open = None
-            next_close = None
-            for i, tok in enumerate(tokens):
-                if not isinstance(tok, VariableValueLiteral):
-                    continue
-                if tok.value == opener:
-                    last_open = i
-                    next_close = None
-                if last_open is not None and tok.value == closer and next_close is None:
-                    next_close = i
-
-            if next_close is not None:
-                lookup_query = VariableValueConcatenation(
-                    tokens[(cast(int, last_open) + len(opener) + 1) : next_close],
-                    variable_type=variable_type,
-                )
-                lookup = VariableValueLookup(
-                    lookup_name=tokens[cast(int, last_open) + 1],  # type: ignore
-                    lookup_query=lookup_query,
-                    variable_type=variable_type,
-                )
-                tokens[last_open : (next_close + 1)] = [lookup]  # type: ignore
-            else:
-                break  # cov: ignore
+        Values that are never modified once created can be shared so, by default,
+        the object itself is returned.
 
-        return tokens.simplified
+        """
+        return self
 
     def __iter__(self) -> Iterator[Any]:
         """How the object is iterated.
@@ -688,6 +802,13 @@ class VariableValueConcatenation(Generic[_VariableValue], VariableValue):
         for value in self:
             value.resolve(context, provider=provider, variables=variables, **kwargs)
 
+    def _clone(self) -> VariableValueConcatenation[_VariableValue]:
+        """Copy the object so it can be resolved independently of the original."""
+        return VariableValueConcatenation(
+            [cast("_VariableValue", i._clone()) for i in self],  # noqa: SLF001
+            variable_type=self.variable_type,
+        )
+
     def __delitem__(self, __index: int) -> None:
         """Delete item by index."""
         del self._data[__index]
@@ -836,7 +957,7 @@ class VariableValueLookup(VariableValue):
         """
         self.lookup_query.resolve(context=context, provider=provider, variables=variables, **kwargs)
         try:
-            result = self.handler.handle(
+            result = self.handler.handle_cached(
                 self.lookup_query.value,
                 context=context,
                 provider=provider,
@@ -847,6 +968,18 @@ class VariableValueLookup(VariableValue):
         except Exception as err:
             raise FailedLookup(self, err) from err
 
+    def _clone(self) -> VariableValueLookup:
+        """Copy the object so it can be resolved independently of the original.
+
+        The handler is retrieved from the registry again in case it has changed.
+
+        """
+        return VariableValueLookup(
+            self.lookup_name,
+            self.lookup_query._clone(),  # noqa: SLF001
+            variable_type=self.variable_type,
+        )
+
     def __iter__(self) -> Iterator[VariableValueLookup]:
         """How the object is iterated."""
         yield self
@@ -965,3 +1098,57 @@ class VariableValuePydanticModel(Generic[_PydanticModelTypeVar], VariableValue):
     def __setitem__(self, __key: str, __value: VariableValue) -> None:
         """Set item by index."""
         self._data[__key] = __value
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_str(obj: str, variable_type: VariableTypeLiteralTypeDef) -> VariableValue:
+    """Parse a string into a syntax tree.
+
+    Results are cached so each string is only tokenized once.
+    The returned object must not be modified or resolved; use a clone.
+
+    Args:
+        obj: The string to parse.
+        variable_type: Type of variable (cfngin|runway).
+
+    """
+    tokens: VariableValueConcatenation[VariableValueLiteral[str] | VariableValueLookup] = (
+        VariableValueConcatenation(
+            # pyright 1.1.138 is having issues properly inferring the type from comprehension
+            [
+                VariableValueLiteral(cast(str, t), variable_type=variable_type)
+                for t in re.split(r"(\$\{|\}|\s+)", obj)  # ${ or space or }
+            ]
+        )
+    )
+
+    opener = "${"
+    closer = "}"
+
+    while True:
+        last_open = None
+        next_close = None
+        for i, tok in enumerate(tokens):
+            if not isinstance(tok, VariableValueLiteral):
+                continue
+            if tok.value == opener:
+                last_open = i
+                next_close = None
+            if last_open is not None and tok.value == closer and next_close is None:
+                next_close = i
+
+        if next_close is not None:
+            lookup_query = VariableValueConcatenation(
+                tokens[(cast(int, last_open) + len(opener) + 1) : next_close],
+                variable_type=variable_type,
+            )
+            lookup = VariableValueLookup(
+                lookup_name=tokens[cast(int, last_open) + 1],  # type: ignore
+                lookup_query=lookup_query,
+                variable_type=variable_type,
+            )
+            tokens[last_open : (next_close + 1)] = [lookup]  # type: ignore
+        else:
+            break  # cov: ignore
+
+    return tokens.simplified
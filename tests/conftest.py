@@ -92,6 +92,10 @@ def sanitize_environment() -> None:
         "CI",
         "DEBUG",
         "DEPLOY_ENVIRONMENT",
+        "CFNGIN_AMI_CACHE_TTL",
+        "CFNGIN_API_MAX_RATE",
+        "CFNGIN_MAX_CONCURRENT_LOOKUPS",
+        "CFNGIN_RENDER_CACHE_SIZE",
         "CFNGIN_STACK_POLL_TIME",
         "RUNWAY_MAX_CONCURRENT_MODULES",
         "RUNWAY_MAX_CONCURRENT_REGIONS",
@@ -1,13 +1,18 @@
 """Tests for runway.cfngin.actions.base."""
 
+from __future__ import annotations
+
 import unittest
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import botocore.exceptions
 import pytest
+from botocore.stub import Stubber
 
-from runway.cfngin.actions.base import BaseAction
+from runway.cfngin.actions.base import BaseAction, build_walker
 from runway.cfngin.blueprints.base import Blueprint
+from runway.cfngin.dag import PooledWalker, ThreadedWalker, walk
 from runway.cfngin.exceptions import CfnginBucketNotFound
 from runway.cfngin.plan import Graph, Plan, Step
 from runway.cfngin.providers.aws.default import Provider
@@ -15,6 +20,9 @@ from runway.cfngin.session_cache import get_session
 
 from ..factories import MockProviderBuilder, mock_context
 
+if TYPE_CHECKING:
+    from ...factories import MockCfnginContext
+
 MOCK_VERSION = "01234abcdef"
 
 
@@ -34,6 +42,38 @@ class MockBlueprint(Blueprint):
         """Create template."""
 
 
+@pytest.mark.parametrize(
+    "concurrency, pooled, expected",
+    [
+        (1, False, None),
+        (1, True, None),
+        (0, False, ThreadedWalker),
+        (2, False, ThreadedWalker),
+        (0, True, PooledWalker),
+        (2, True, PooledWalker),
+    ],
+)
+def test_build_walker(concurrency: int, pooled: bool, expected: type | None) -> None:
+    """Test build_walker."""
+    result = build_walker(concurrency, pooled=pooled)
+    if expected is None:
+        assert result is walk
+    else:
+        assert isinstance(result.__self__, expected)  # type: ignore
+
+
+def test_build_walker_critical_path() -> None:
+    """Test build_walker critical_path."""
+    weight = MagicMock()
+    result = build_walker(2, critical_path=True, weight=weight)
+    walker = result.__self__  # type: ignore
+    assert isinstance(walker, PooledWalker)
+    assert walker.critical_path
+    assert walker.max_workers == 2
+    assert walker.weight is weight
+    assert build_walker(1, critical_path=True) is walk
+
+
 class TestBaseAction(unittest.TestCase):
     """Tests for runway.cfngin.actions.base.BaseAction."""
 
@@ -263,3 +303,95 @@ class TestBaseAction(unittest.TestCase):
                 == f"{endpoint}/cfngin-{context.namespace}-{region}/stack_templates/"
                 f"{context.namespace}-{blueprint.name}/{blueprint.name}-{MOCK_VERSION}.json"
             )
+
+
+class TestBaseActionS3StackPush:
+    """Tests for BaseAction.s3_stack_push."""
+
+    @staticmethod
+    def _blueprints(context: MockCfnginContext) -> tuple[MockBlueprint, MockBlueprint]:
+        """Return blueprints with rendered templates."""
+        result = (
+            MockBlueprint(name="stack1", context=context),
+            MockBlueprint(name="stack2", context=context),
+        )
+        for blueprint in result:
+            blueprint._rendered = "{}"
+        return result
+
+    def test_s3_stack_push(self, cfngin_context: MockCfnginContext) -> None:
+        """Test s3_stack_push lists templates once."""
+        action = BaseAction(context=cfngin_context)
+        assert action.bucket_name
+        stubber = Stubber(action.s3_conn)
+        blueprint1, blueprint2 = self._blueprints(cfngin_context)
+        key1 = f"stack_templates/{cfngin_context.get_fqn('stack1')}/stack1-{MOCK_VERSION}.json"
+        key2 = f"stack_templates/{cfngin_context.get_fqn('stack2')}/stack2-{MOCK_VERSION}.json"
+        stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": key1}], "IsTruncated": True, "NextContinuationToken": "n"},
+            {
+                "Bucket": action.bucket_name,
+                "Prefix": f"stack_templates/{cfngin_context.namespace}-",
+            },
+        )
+        stubber.add_response(
+            "list_objects_v2",
+            {"IsTruncated": False},
+            {
+                "Bucket": action.bucket_name,
+                "ContinuationToken": "n",
+                "Prefix": f"stack_templates/{cfngin_context.namespace}-",
+            },
+        )
+        stubber.add_response("put_object", {})
+
+        with stubber:
+            assert action.s3_stack_push(blueprint1).endswith(key1)
+            assert action.s3_stack_push(blueprint2).endswith(key2)
+            assert action.s3_stack_push(blueprint2).endswith(key2)
+        stubber.assert_no_pending_responses()
+
+    def test_s3_stack_push_force(self, cfngin_context: MockCfnginContext) -> None:
+        """Test s3_stack_push force."""
+        action = BaseAction(context=cfngin_context)
+        stubber = Stubber(action.s3_conn)
+        blueprint, _ = self._blueprints(cfngin_context)
+        key = f"stack_templates/{cfngin_context.get_fqn('stack1')}/stack1-{MOCK_VERSION}.json"
+        stubber.add_response("list_objects_v2", {"Contents": [{"Key": key}]})
+        stubber.add_response("put_object", {})
+
+        with stubber:
+            assert action.s3_stack_push(blueprint, force=True).endswith(key)
+        stubber.assert_no_pending_responses()
+
+    def test_s3_stack_push_no_namespace(self, cfngin_context: MockCfnginContext) -> None:
+        """Test s3_stack_push does not list every template when there is no namespace."""
+        cfngin_context.config.cfngin_bucket = "test-bucket"
+        cfngin_context.config.namespace = ""
+        action = BaseAction(context=cfngin_context)
+        stubber = Stubber(action.s3_conn)
+        blueprint, _ = self._blueprints(cfngin_context)
+        stubber.add_response("head_object", {"ContentLength": 2})
+
+        with stubber:
+            action.s3_stack_push(blueprint)
+        stubber.assert_no_pending_responses()
+
+    def test_s3_stack_push_list_denied(self, cfngin_context: MockCfnginContext) -> None:
+        """Test s3_stack_push falls back to head_object if templates can't be listed."""
+        action = BaseAction(context=cfngin_context)
+        stubber = Stubber(action.s3_conn)
+        blueprint1, blueprint2 = self._blueprints(cfngin_context)
+        stubber.add_client_error("list_objects_v2", service_error_code="AccessDenied")
+        stubber.add_response("head_object", {"ContentLength": 2})
+        stubber.add_client_error("head_object", service_error_code="404")
+        stubber.add_response("put_object", {})
+        stubber.add_client_error("head_object", service_error_code="403")
+
+        with stubber:
+            action.s3_stack_push(blueprint1)
+            action.s3_stack_push(blueprint2)
+            with pytest.raises(botocore.exceptions.ClientError):
+                action.s3_stack_push(blueprint2)
+        stubber.assert_no_pending_responses()
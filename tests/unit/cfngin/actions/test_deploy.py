@@ -309,6 +309,31 @@ class TestBuildAction(unittest.TestCase):  # TODO (kyle): refactor tests into th
             deploy_action.run(outline=False)
             assert mock_generate_plan().execute.call_count == 1
 
+    @patch("runway.cfngin.actions.deploy.build_walker")
+    def test_run_walker(self, mock_build_walker: MagicMock) -> None:
+        """Test run uses the critical path only when there is history."""
+        context = self._get_context()
+        deploy_action = deploy.Action(context, cancel=MockThreadingEvent())  # type: ignore
+        with patch.object(deploy_action, "_generate_plan") as mock_generate_plan:
+            mock_generate_plan.return_value.estimated_durations.return_value = {}
+            deploy_action.run(concurrency=2)
+            mock_build_walker.assert_called_once_with(2)
+            mock_generate_plan.return_value.execute.assert_called_once_with(
+                mock_build_walker.return_value
+            )
+
+            mock_build_walker.reset_mock()
+            durations = {"vpc": 1.0}
+            mock_generate_plan.return_value.estimated_durations.return_value = durations
+            deploy_action.run(concurrency=1)
+            mock_build_walker.assert_called_once_with(1)
+
+            mock_build_walker.reset_mock()
+            deploy_action.run(concurrency=2)
+            mock_build_walker.assert_called_once_with(
+                2, critical_path=True, weight=durations.__getitem__
+            )
+
     @patch("runway.context.CfnginContext.persistent_graph_tags", new_callable=PropertyMock)
     @patch("runway.context.CfnginContext.lock_persistent_graph", new_callable=MagicMock)
     @patch("runway.context.CfnginContext.unlock_persistent_graph", new_callable=MagicMock)
@@ -436,6 +461,7 @@ class TestLaunchStack(TestBuildAction):  # TODO (kyle): refactor tests to be pyt
             ]
 
         patch_object(self.provider, "get_stack", side_effect=get_stack)
+        patch_object(self.provider, "poll_stack", side_effect=get_stack)
         patch_object(self.provider, "update_stack")
         patch_object(self.provider, "create_stack")
         patch_object(self.provider, "destroy_stack")
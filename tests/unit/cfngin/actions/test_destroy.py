@@ -85,12 +85,29 @@ class TestDestroyAction(unittest.TestCase):
             self.action.run(force=True)
             assert mock_generate_plan().execute.call_count == 1
 
+    @patch("runway.cfngin.actions.destroy.build_walker")
+    def test_run_walker(self, mock_build_walker: MagicMock) -> None:
+        """Test run uses the critical path only when there is history."""
+        with patch.object(self.action, "_generate_plan") as mock_generate_plan:
+            mock_generate_plan.return_value.estimated_durations.return_value = {}
+            self.action.run(concurrency=2, force=True)
+            mock_build_walker.assert_called_once_with(2)
+
+            mock_build_walker.reset_mock()
+            durations = {"vpc": 1.0}
+            mock_generate_plan.return_value.estimated_durations.return_value = durations
+            self.action.run(concurrency=2, force=True)
+            mock_build_walker.assert_called_once_with(
+                2, critical_path=True, weight=durations.__getitem__
+            )
+
     def test_destroy_stack_complete_if_state_submitted(self) -> None:
         """Test destroy stack complete if state submitted."""
         # Simulate the provider not being able to find the stack (a result of
         # it being successfully deleted)
         provider = MagicMock()
         provider.get_stack.side_effect = StackDoesNotExist("mock")
+        provider.poll_stack.side_effect = StackDoesNotExist("mock")
         self.action.provider_builder = MockProviderBuilder(provider=provider)
         status = self.action._destroy_stack(MockStack("vpc"), status=PENDING)  # type: ignore
         # if we haven't processed the step (ie. has never been SUBMITTED,
@@ -140,12 +157,14 @@ class TestDestroyAction(unittest.TestCase):
         # simulate stack doesn't exist and we haven't submitted anything for
         # deletion
         mock_provider.get_stack.side_effect = StackDoesNotExist("mock")
+        mock_provider.poll_stack.side_effect = StackDoesNotExist("mock")
 
         step.run()
         assert step.status == SKIPPED
 
         # simulate stack getting successfully deleted
         mock_provider.get_stack.side_effect = get_stack
+        mock_provider.poll_stack.side_effect = lambda stack_name, _since: get_stack(stack_name)
         mock_provider.is_stack_destroyed.return_value = False
         mock_provider.is_stack_in_progress.return_value = False
 
@@ -18,6 +18,7 @@ from runway.cfngin.blueprints.base import (
     validate_allowed_values,
     validate_variable_type,
 )
+from runway.cfngin.blueprints.render_cache import RenderCache
 from runway.cfngin.blueprints.variables.types import (
     CFNCommaDelimitedList,
     CFNNumber,
@@ -35,6 +36,8 @@ from runway.cfngin.exceptions import (
 from runway.variables import Variable
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest_mock import MockerFixture
 
     from runway.cfngin.blueprints.type_defs import BlueprintVariableTypeDef
@@ -56,6 +59,23 @@ class SampleBlueprint(Blueprint):
         return
 
 
+class CachedBlueprint(SampleBlueprint):
+    """Sample Blueprint with outputs and a transform to use for testing the render cache."""
+
+    def create_template(self) -> None:
+        """Create template."""
+        self.template.set_transform("AWS::Serverless-2016-10-31")
+        self.add_output("Var1", self.variables["Var1"])
+
+
+class UserDataBlueprint(SampleBlueprint):
+    """Sample Blueprint that reads user data to use for testing the render cache."""
+
+    def create_template(self) -> None:
+        """Create template."""
+        self.add_output("UserData", self.read_user_data("path"))
+
+
 def resolve_troposphere_var(tpe: Any, value: Any, **kwargs: Any) -> Any:
     """Resolve troposphere var."""
     return resolve_variable(
@@ -222,6 +242,70 @@ class TestBlueprint:
         assert obj.rendered == "render"
         mock_render_template.assert_called_once_with()
 
+    def test_rendered_cache(
+        self, cfngin_context: CfnginContext, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test rendered using the render cache."""
+        cfngin_context.render_cache = RenderCache(tmp_path)
+        obj = CachedBlueprint(name="test", context=cfngin_context)
+        obj.resolve_variables([Variable("Var1", "foo")])
+        assert obj.version
+        assert len(list(tmp_path.iterdir())) == 1
+
+        spy_create_template = mocker.spy(CachedBlueprint, "create_template")
+        cached = CachedBlueprint(name="test", context=cfngin_context)
+        cached.resolve_variables([Variable("Var1", "foo")])
+        assert cached.rendered == obj.rendered
+        assert cached.version == obj.version
+        assert cached.output_definitions == obj.output_definitions == {"Var1": {"Value": "foo"}}
+        assert cached.requires_change_set
+        spy_create_template.assert_not_called()
+
+        changed = CachedBlueprint(name="test", context=cfngin_context)
+        changed.resolve_variables([Variable("Var1", "bar")])
+        assert changed.rendered != obj.rendered
+        spy_create_template.assert_called_once_with(changed)
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_rendered_cache_read_files(
+        self, cfngin_context: CfnginContext, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test rendered is not cached when files are read while rendering."""
+        mocker.patch(f"{MODULE}.read_value_from_path", return_value="something")
+        cfngin_context.render_cache = RenderCache(tmp_path)
+        obj = UserDataBlueprint(name="test", context=cfngin_context)
+        obj.resolve_variables([])
+        assert obj.rendered
+        assert not list(tmp_path.iterdir())
+
+    def test_render_cache_key(self, cfngin_context: CfnginContext) -> None:
+        """Test _render_cache_key."""
+        obj = SampleBlueprint(name="test", context=cfngin_context)
+        obj.resolve_variables([])
+        key = obj._render_cache_key()
+        assert key
+        obj.description = "something"
+        assert obj._render_cache_key() not in (key, None)
+        obj.variables = {"Var0": CFNParameter("Var0", "test"), "Var1": s3.Bucket("Bucket")}
+        assert obj._render_cache_key()
+        obj.variables = {"Var1": object()}
+        assert obj._render_cache_key() is None
+
+    def test_render_cache_key_none(self, cfngin_context: CfnginContext) -> None:
+        """Test _render_cache_key for blueprints that can't be cached."""
+
+        class _Blueprint(SampleBlueprint):
+            pass
+
+        obj = _Blueprint(name="test", context=cfngin_context)
+        obj.resolve_variables([])
+        assert obj._render_cache_key() is None
+        obj = SampleBlueprint(name="test", context=cfngin_context)
+        assert obj._render_cache_key() is None  # variables not resolved
+        obj.resolve_variables([])
+        obj.add_output("key", "val")
+        assert obj._render_cache_key() is None
+
     def test_required_parameter_definitions(self, cfngin_context: CfnginContext) -> None:
         """Test required_parameter_definitions."""
 
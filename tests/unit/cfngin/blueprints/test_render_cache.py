@@ -0,0 +1,49 @@
+"""Tests for runway.cfngin.blueprints.render_cache."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from runway.cfngin.blueprints.render_cache import RenderCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestRenderCache:
+    """Test RenderCache."""
+
+    def test_evict(self, tmp_path: Path) -> None:
+        """Test evict."""
+        obj = RenderCache(tmp_path, max_size=150)
+        obj.set("key0", "v0", "a" * 20)
+        obj.set("key1", "v1", "b" * 20)
+        os.utime(tmp_path / "key0.json", (0, 0))
+        os.utime(tmp_path / "key1.json", (1, 1))
+        assert obj.get("key0")  # marked as recently used
+        obj.set("key2", "v2", "c" * 20)
+        assert sorted(i.name for i in tmp_path.iterdir()) == ["key0.json", "key2.json"]
+        assert obj.get("key1") is None
+
+    def test_get(self, tmp_path: Path) -> None:
+        """Test get."""
+        obj = RenderCache(tmp_path)
+        assert obj.get("key") is None
+        obj.set("key", "version", "rendered")
+        assert obj.get("key") == ("version", "rendered")
+        assert RenderCache(tmp_path).get("key") == ("version", "rendered")
+
+    def test_get_invalid(self, tmp_path: Path) -> None:
+        """Test get invalid entry."""
+        (tmp_path / "key.json").write_text("invalid")
+        (tmp_path / "other.json").write_text("{}")
+        obj = RenderCache(tmp_path)
+        assert obj.get("key") is None
+        assert obj.get("other") is None
+
+    def test_set_too_large(self, tmp_path: Path) -> None:
+        """Test set entry larger than the maximum size."""
+        obj = RenderCache(tmp_path / "cache", max_size=10)
+        obj.set("key", "version", "rendered")
+        assert not (tmp_path / "cache").exists()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, Any, NamedTuple
 from unittest.mock import MagicMock
 
@@ -34,7 +35,9 @@ class MockProviderBuilder(ProviderBuilder):
 
     def __init__(self, *, provider: Provider, region: str | None = None, **_: Any) -> None:
         """Instantiate class."""
+        self.lock = threading.Lock()
         self.provider = provider
+        self.providers = {f"None-{region}": provider}
         self.region = region
 
     def build(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 import pytest
@@ -24,6 +25,59 @@ def test_purge_bucket(cfngin_context: MockCfnginContext) -> None:
     stub.assert_no_pending_responses()
 
 
+def test_purge_bucket_versions(
+    caplog: pytest.LogCaptureFixture, cfngin_context: MockCfnginContext
+) -> None:
+    """Test purge_bucket deletes every version in batches."""
+    caplog.set_level(logging.WARNING, logger="runway.cfngin.hooks.cleanup_s3")
+    stub = cfngin_context.add_stubber("s3")
+
+    stub.add_response("head_bucket", {}, {"Bucket": "foo"})
+    stub.add_response(
+        "list_object_versions",
+        {
+            "DeleteMarkers": [{"Key": "key0", "VersionId": "2"}],
+            "Versions": [{"Key": "key0", "VersionId": "1"}, {"Key": "key1", "VersionId": "1"}],
+        },
+    )
+    stub.add_response(
+        "delete_objects",
+        {"Errors": [{"Key": "key1", "VersionId": "1", "Code": "AccessDenied"}]},
+        {
+            "Bucket": "foo",
+            "Delete": {
+                "Objects": [
+                    {"Key": "key0", "VersionId": "1"},
+                    {"Key": "key1", "VersionId": "1"},
+                    {"Key": "key0", "VersionId": "2"},
+                ],
+                "Quiet": True,
+            },
+        },
+    )
+    with stub:
+        assert not purge_bucket(cfngin_context, bucket_name="foo")
+    stub.assert_no_pending_responses()
+    assert len(caplog.messages) == 2
+    assert caplog.messages[0].startswith("failed to delete s3://foo/key1")
+    assert caplog.messages[1] == 'unable to purge bucket "foo"; 1 object(s) could not be deleted'
+
+
+def test_purge_bucket_request_failed(cfngin_context: MockCfnginContext) -> None:
+    """Test purge_bucket when a whole DeleteObjects request fails."""
+    stub = cfngin_context.add_stubber("s3")
+
+    stub.add_response("head_bucket", {}, {"Bucket": "foo"})
+    stub.add_response(
+        "list_object_versions",
+        {"DeleteMarkers": [], "Versions": [{"Key": "key0", "VersionId": "1"}]},
+    )
+    stub.add_client_error("delete_objects", service_error_code="AccessDenied")
+    with stub:
+        assert not purge_bucket(cfngin_context, bucket_name="foo")
+    stub.assert_no_pending_responses()
+
+
 def test_purge_bucket_does_not_exist(cfngin_context: MockCfnginContext) -> None:
     """Test purge_bucket Bucket doesn't exist."""
     stub = cfngin_context.add_stubber("s3")
@@ -6,17 +6,95 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from runway.cfngin.lookups.handlers.ami import AmiLookup, ImageNotFound
+from runway.cfngin.lookups.handlers.ami import AmiCatalog, AmiLookup, ImageNotFound
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
     from ....factories import MockCfnginContext
 
+MODULE = "runway.cfngin.lookups.handlers.ami"
 REGION = "us-east-1"
 
 
+class TestAmiCatalog:
+    """Tests for runway.cfngin.lookups.handlers.ami.AmiCatalog."""
+
+    def test_get_expired(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test get expired catalog."""
+        mock_time = mocker.patch(f"{MODULE}.time.time", return_value=100.0)
+        obj = AmiCatalog(tmp_path, ttl=10)
+        obj.set(REGION, "key", [{"CreationDate": "2011", "ImageId": "ami-1", "Name": "a"}])
+        mock_time.return_value = 109.0
+        assert obj.get(REGION, "key") == [["2011", "a", "ami-1"]]
+        mock_time.return_value = 110.0
+        assert obj.get(REGION, "key") is None
+
+    def test_get_invalid(self, tmp_path: Path) -> None:
+        """Test get invalid catalog."""
+        obj = AmiCatalog(tmp_path)
+        obj.set(REGION, "key", [])
+        next((tmp_path / REGION).glob("*.json")).write_text("{}")
+        assert obj.get(REGION, "key") is None
+
+    def test_get_set(self, tmp_path: Path) -> None:
+        """Test get and set."""
+        obj = AmiCatalog(tmp_path)
+        assert obj.get(REGION, "key") is None
+        images = obj.set(
+            REGION,
+            "key",
+            [
+                {"CreationDate": "2011-02-13", "ImageId": "ami-1", "Name": "a"},
+                {"CreationDate": "2011-02-14", "ImageId": "ami-2", "Name": "b"},
+                {"CreationDate": "2011-02-15", "ImageId": "ari-1"},
+                {"CreationDate": "2011-02-16"},
+            ],
+        )
+        assert images == [
+            ["2011-02-15", "", "ari-1"],
+            ["2011-02-14", "b", "ami-2"],
+            ["2011-02-13", "a", "ami-1"],
+        ]
+        assert AmiCatalog(tmp_path).get(REGION, "key") == images
+        assert obj.get("us-west-2", "key") is None
+        assert obj.get(REGION, "other") is None
+
+
 class TestAMILookup:
     """Tests for runway.cfngin.lookups.handlers.ami.AmiLookup."""
 
+    def test_catalog(
+        self,
+        cfngin_context: MockCfnginContext,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        """Test images are retrieved from the catalog."""
+        monkeypatch.setenv("CFNGIN_AMI_CACHE_TTL", "3600")
+        cfngin_context.work_dir = tmp_path
+        stubber = cfngin_context.add_stubber("ec2")
+        stubber.add_response(
+            "describe_images",
+            {
+                "Images": [
+                    {"CreationDate": "2011-02-13", "ImageId": "ami-1", "Name": "a-1"},
+                    {"CreationDate": "2011-02-14", "ImageId": "ami-2", "Name": "b-1"},
+                ]
+            },
+            {"Filters": [], "Owners": ["self"]},
+        )
+
+        with stubber:
+            assert AmiLookup.handle("owners:self name_regex:a-\\d", cfngin_context) == "ami-1"
+            assert AmiLookup.handle("owners:self name_regex:b-\\d", cfngin_context) == "ami-2"
+            with pytest.raises(ImageNotFound):
+                AmiLookup.handle("owners:self name_regex:c-\\d", cfngin_context)
+        stubber.assert_no_pending_responses()
+        assert len(list((tmp_path / "cache" / "ami" / REGION).glob("*.json"))) == 1
+
     def test_basic_lookup_single_image(self, cfngin_context: MockCfnginContext) -> None:
         """Test basic lookup single image."""
         executable_users = ["123456789012", "234567890123"]
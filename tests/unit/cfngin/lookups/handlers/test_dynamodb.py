@@ -9,8 +9,12 @@ import pytest
 from runway.cfngin.lookups.handlers.dynamodb import DynamodbLookup, QueryDataModel
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from ....factories import MockCfnginContext
 
+MODULE = "runway.cfngin.lookups.handlers.dynamodb"
+
 GET_ITEM_RESPONSE = {
     "Item": {
         "TestKey": {"S": "TestVal"},
@@ -26,6 +30,14 @@ GET_ITEM_RESPONSE = {
 }
 
 
+def projection(*names: str) -> dict[str, Any]:
+    """Build the projection of a batch_get_item request."""
+    return {
+        "ExpressionAttributeNames": {f"#p{i}": name for i, name in enumerate(names)},
+        "ProjectionExpression": ",".join(f"#p{i}" for i in range(len(names))),
+    }
+
+
 class TestDynamoDBHandler:
     """Test runway.cfngin.lookups.handlers.dynamodb.DynamodbLookup."""
 
@@ -254,3 +266,134 @@ class TestQueryDataModel:
             match="Partition key value '.*' doesn't match regex: .*",
         ):
             assert obj.item_key
+
+    def test_prefetch(self, cfngin_context: MockCfnginContext, mocker: MockerFixture) -> None:
+        """Test prefetch."""
+        mock_sleep = mocker.patch(f"{MODULE}.time.sleep")
+        stubber = cfngin_context.add_stubber("dynamodb")
+        values = [
+            "TestTable@TestKey:TestVal.TestString",
+            "TestTable@TestKey:TestVal.TestMap[M].String1",
+            "TestTable@TestKey:Other.TestString",
+            "TestTable@TestKey:Missing.TestString",
+            "OtherTable@Id:1[N].TestString",
+            "invalid",
+        ]
+        stubber.add_response(
+            "batch_get_item",
+            {
+                "Responses": {"TestTable": [GET_ITEM_RESPONSE["Item"]]},
+                "UnprocessedKeys": {
+                    "OtherTable": {
+                        "Keys": [{"Id": {"N": "1"}}],
+                        **projection("Id", "TestString"),
+                    }
+                },
+            },
+            {
+                "RequestItems": {
+                    "TestTable": {
+                        "Keys": [
+                            {"TestKey": {"S": "TestVal"}},
+                            {"TestKey": {"S": "Other"}},
+                            {"TestKey": {"S": "Missing"}},
+                        ],
+                        **projection("String1", "TestKey", "TestMap", "TestString"),
+                    },
+                    "OtherTable": {
+                        "Keys": [{"Id": {"N": "1"}}],
+                        **projection("Id", "TestString"),
+                    },
+                }
+            },
+        )
+        stubber.add_response(
+            "batch_get_item",
+            {"Responses": {"OtherTable": [{"Id": {"N": "1"}, "TestString": {"S": "OtherVal"}}]}},
+            {
+                "RequestItems": {
+                    "OtherTable": {
+                        "Keys": [{"Id": {"N": "1"}}],
+                        **projection("Id", "TestString"),
+                    }
+                }
+            },
+        )
+        stubber.add_response(
+            "get_item",
+            {"Item": {"TestKey": {"S": "Other"}, "TestString": {"S": "OtherString"}}},
+            {
+                "TableName": "TestTable",
+                "Key": {"TestKey": {"S": "Other"}},
+                "ProjectionExpression": "TestKey,TestString",
+            },
+        )
+
+        with stubber, DynamodbLookup.prefetch(values, cfngin_context):
+            assert [DynamodbLookup.handle(value, cfngin_context) for value in values[:3]] == [
+                "TestStringVal",
+                "StringVal1",
+                "OtherString",
+            ]
+            assert DynamodbLookup.handle(values[4], cfngin_context) == "OtherVal"
+        stubber.assert_no_pending_responses()
+        mock_sleep.assert_called_once()
+        assert not cfngin_context.lookup_prefetch["dynamodb"]
+
+    def test_prefetch_batches(
+        self, cfngin_context: MockCfnginContext, mocker: MockerFixture
+    ) -> None:
+        """Test prefetch splits items into batches."""
+        mocker.patch.object(DynamodbLookup, "BATCH_SIZE", 2)
+        stubber = cfngin_context.add_stubber("dynamodb")
+        values = [f"TestTable@TestKey:{i}.TestString" for i in range(3)]
+        for batch in [["0", "1"], ["2"]]:
+            stubber.add_response(
+                "batch_get_item",
+                {
+                    "Responses": {
+                        "TestTable": [
+                            {"TestKey": {"S": i}, "TestString": {"S": f"val{i}"}} for i in batch
+                        ]
+                    }
+                },
+                {
+                    "RequestItems": {
+                        "TestTable": {
+                            "Keys": [{"TestKey": {"S": i}} for i in batch],
+                            **projection("TestKey", "TestString"),
+                        }
+                    }
+                },
+            )
+
+        with stubber, DynamodbLookup.prefetch(values, cfngin_context):
+            assert [DynamodbLookup.handle(value, cfngin_context) for value in values] == [
+                "val0",
+                "val1",
+                "val2",
+            ]
+        stubber.assert_no_pending_responses()
+
+    def test_prefetch_client_error(self, cfngin_context: MockCfnginContext) -> None:
+        """Test prefetch falls back to get_item."""
+        stubber = cfngin_context.add_stubber("dynamodb")
+        values = [f"TestTable@TestKey:{i}.TestString" for i in range(2)]
+        stubber.add_client_error("batch_get_item", "AccessDeniedException")
+        for i in range(2):
+            stubber.add_response(
+                "get_item",
+                {"Item": {"TestKey": {"S": str(i)}, "TestString": {"S": f"val{i}"}}},
+                {
+                    "TableName": "TestTable",
+                    "Key": {"TestKey": {"S": str(i)}},
+                    "ProjectionExpression": "TestKey,TestString",
+                },
+            )
+
+        with stubber, DynamodbLookup.prefetch(values, cfngin_context):
+            assert [DynamodbLookup.handle(value, cfngin_context) for value in values] == [
+                "val0",
+                "val1",
+            ]
+        stubber.assert_no_pending_responses()
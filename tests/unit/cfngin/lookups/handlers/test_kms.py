@@ -49,6 +49,30 @@ class TestKMSHandler:
             assert KmsLookup.handle(query, context=cfngin_context) == SECRET
             stubber.assert_no_pending_responses()
 
+    def test_handle_cached(self, cfngin_context: MockCfnginContext) -> None:
+        """Test handle only decrypts each ciphertext once per region."""
+        stubber = cfngin_context.add_stubber("kms")
+        west_stubber = cfngin_context.add_stubber("kms", region="us-west-2")
+        stubber.add_response(
+            "decrypt",
+            {"Plaintext": SECRET.encode()},
+            {"CiphertextBlob": codecs.decode(SECRET.encode(), "base64")},
+        )
+        west_stubber.add_response(
+            "decrypt",
+            {"Plaintext": SECRET.encode()},
+            {"CiphertextBlob": codecs.decode(SECRET.encode(), "base64")},
+        )
+
+        with stubber, west_stubber:
+            assert KmsLookup.handle(SECRET, context=cfngin_context) == SECRET
+            assert KmsLookup.handle(SECRET, context=cfngin_context) == SECRET
+            assert KmsLookup.handle(f"{SECRET}::transform=str", context=cfngin_context) == SECRET
+            assert KmsLookup.handle(f"{SECRET}::region=us-west-2", context=cfngin_context) == SECRET
+            assert KmsLookup.handle(f"{SECRET}::region=us-west-2", context=cfngin_context) == SECRET
+            stubber.assert_no_pending_responses()
+            west_stubber.assert_no_pending_responses()
+
     def test_legacy_parse(self) -> None:
         """Test legacy_parse."""
         assert KmsLookup.legacy_parse("us-east-1@foo") == (
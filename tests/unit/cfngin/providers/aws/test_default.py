@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import copy
 import locale
 import random
 import string
 import threading
+import time
 import unittest
 from contextlib import suppress
 from datetime import datetime
@@ -26,6 +28,9 @@ from runway.cfngin.providers.aws.default import (
     DEFAULT_CAPABILITIES,
     MAX_TAIL_RETRIES,
     Provider,
+    ProviderBuilder,
+    StackDescriptionCache,
+    StackStatusPoller,
     ask_for_approval,
     create_change_set,
     generate_cloudformation_args,
@@ -43,6 +48,7 @@ if TYPE_CHECKING:
     from mypy_boto3_cloudformation.type_defs import (
         ChangeTypeDef,
         ResourceChangeTypeDef,
+        StackEventTypeDef,
         StackTypeDef,
     )
     from pytest_mock import MockerFixture
@@ -103,6 +109,16 @@ def generate_describe_stacks_stack(
     }
 
 
+def generate_stack_event(event_id: str, stack_name: str = "test") -> StackEventTypeDef:
+    """Generate describe stack events event."""
+    return {
+        "EventId": event_id,
+        "StackId": stack_name,
+        "StackName": stack_name,
+        "Timestamp": datetime(2015, 1, 1),
+    }
+
+
 def generate_get_template(
     file_name: str = "cfn_template.json", stages_available: list[str] | None = None
 ) -> dict[str, Any]:
@@ -497,6 +513,82 @@ class TestProvider:
         assert not obj.get_event_by_resource_status("test", "missing", chronological=False)
         mock_get_events.assert_called_with("test", chronological=False)
 
+    def test_get_outputs(self, mocker: MockerFixture) -> None:
+        """Test get_outputs shares concurrent calls and caches the result."""
+        stack = generate_describe_stacks_stack("test")
+        stack["Outputs"] = [{"OutputKey": "foo", "OutputValue": "bar"}]
+        mock_get_stack = mocker.patch.object(Provider, "get_stack", return_value=stack)
+        obj = Provider(MagicMock())
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(obj.get_outputs, ["test"] * 4))
+        assert results == [{"foo": "bar"}] * 4
+        mock_get_stack.assert_called_once_with("test")
+        assert obj.get_outputs("test") is results[0]
+        mock_get_stack.assert_called_once_with("test")
+
+    def test_get_new_events(self, mocker: MockerFixture) -> None:
+        """Test get_new_events."""
+        mocker.patch(f"{default.__name__}.GET_EVENTS_SLEEP", 0)
+        obj = Provider(get_session(region="us-east-1"))
+        stubber = Stubber(obj.cloudformation)
+        events = [generate_stack_event(f"event{i}") for i in range(6)]
+        stubber.add_response(
+            "describe_stack_events",
+            {"StackEvents": [events[5], events[4]], "NextToken": "token0"},
+            {"StackName": "test"},
+        )
+        stubber.add_response(
+            "describe_stack_events",
+            {"StackEvents": [events[3], events[2]], "NextToken": "token1"},
+            {"StackName": "test", "NextToken": "token0"},
+        )
+        with stubber:
+            assert obj.get_new_events("test", {"event2", "event1"}) == [
+                events[3],
+                events[4],
+                events[5],
+            ]
+        stubber.assert_no_pending_responses()
+
+    def test_get_new_events_none_seen(self) -> None:
+        """Test get_new_events with no events seen."""
+        obj = Provider(get_session(region="us-east-1"))
+        stubber = Stubber(obj.cloudformation)
+        events = [generate_stack_event(f"event{i}") for i in range(2)]
+        stubber.add_response(
+            "describe_stack_events", {"StackEvents": [events[1], events[0]]}, {"StackName": "test"}
+        )
+        with stubber:
+            assert obj.get_new_events("test", set()) == events
+        stubber.assert_no_pending_responses()
+
+    @pytest.mark.parametrize("include_initial", [False, True])
+    def test_tail(self, include_initial: bool, mocker: MockerFixture) -> None:
+        """Test tail."""
+        mocker.patch(f"{default.__name__}.TAIL_SEEN_EVENTS_LIMIT", 2)
+        obj = Provider(get_session(region="us-east-1"))
+        stubber = Stubber(obj.cloudformation)
+        events = [generate_stack_event(f"event{i}") for i in range(5)]
+        stubber.add_response(
+            "describe_stack_events", {"StackEvents": [events[1], events[0]]}, {"StackName": "test"}
+        )
+        stubber.add_response(
+            "describe_stack_events",
+            {"StackEvents": [events[3], events[2], events[1]]},
+            {"StackName": "test"},
+        )
+        stubber.add_response(
+            "describe_stack_events",
+            {"StackEvents": [events[4], events[3]], "NextToken": "token"},
+            {"StackName": "test"},
+        )
+        cancel = MagicMock(wait=MagicMock(side_effect=[False, True]))
+        logged: list[Any] = []
+        with stubber:
+            obj.tail("test", cancel, log_func=logged.append, include_initial=include_initial)
+        stubber.assert_no_pending_responses()
+        assert logged == (events if include_initial else events[2:])
+
     def test_get_rollback_status_reason(self, mocker: MockerFixture) -> None:
         """Test get_rollback_status_reason."""
         mock_get_event_by_resource_status = mocker.patch.object(
@@ -542,6 +634,133 @@ class TestProvider:
         )
 
 
+class TestStackDescriptionCache:
+    """Test StackDescriptionCache."""
+
+    def test_get(self, mocker: MockerFixture) -> None:
+        """Test get."""
+        mock_monotonic = mocker.patch("time.monotonic", return_value=100.0)
+        stack = generate_describe_stacks_stack("test")
+        obj = StackDescriptionCache(ttl=10)
+        assert obj.get("test") is None
+        obj.set("test", stack)
+        assert obj.get("test") == stack
+        mock_monotonic.return_value = 109.9
+        assert obj.get("test") == stack
+        mock_monotonic.return_value = 110.0
+        assert obj.get("test") is None
+        assert (obj.hits, obj.misses) == (2, 2)
+
+    def test_invalidate(self) -> None:
+        """Test invalidate."""
+        obj = StackDescriptionCache()
+        obj.set("test", generate_describe_stacks_stack("test"))
+        obj.invalidate("test")
+        obj.invalidate("missing")
+        assert obj.get("test") is None
+
+
+class TestStackStatusPoller:
+    """Test StackStatusPoller."""
+
+    def test_get_stack(self) -> None:
+        """Test get_stack."""
+        cfn = boto3.client("cloudformation", region_name="us-east-1")
+        stubber = Stubber(cfn)
+        stack = generate_describe_stacks_stack("test", stack_status="CREATE_IN_PROGRESS")
+        stubber.add_response("describe_stacks", {"Stacks": [stack]}, {"StackName": "test"})
+        stubber.add_response("describe_stacks", {"Stacks": [stack]}, {"StackName": "test"})
+        obj = StackStatusPoller(cfn)
+        since = time.time()
+        with stubber:
+            assert obj.get_stack("test", since) == stack
+            # retrieved after since so no additional API call
+            assert obj.get_stack("test", since) == stack
+            assert obj.get_stack("test", time.time()) == stack
+        stubber.assert_no_pending_responses()
+
+    def test_get_stack_batch(self, mocker: MockerFixture) -> None:
+        """Test get_stack listing all stacks."""
+        mocker.patch.object(StackStatusPoller, "BATCH_THRESHOLD", 2)
+        cfn = boto3.client("cloudformation", region_name="us-east-1")
+        stubber = Stubber(cfn)
+        stack0 = generate_describe_stacks_stack("test0")
+        stack1 = generate_describe_stacks_stack("test1")
+        stack2 = generate_describe_stacks_stack("test2")
+        stubber.add_response("describe_stacks", {"Stacks": [stack0]}, {"StackName": "test0"})
+        stubber.add_response("describe_stacks", {"Stacks": [stack2, stack0], "NextToken": "next"})
+        stubber.add_response("describe_stacks", {"Stacks": [stack1]}, {"NextToken": "next"})
+        obj = StackStatusPoller(cfn)
+        with stubber:
+            assert obj.get_stack("test0", time.time()) == stack0
+            since = time.time()
+            assert obj.get_stack("test1", since) == stack1
+            assert obj.get_stack("test0", since) == stack0
+            assert obj.get_stack("test2", since) == stack2
+        stubber.assert_no_pending_responses()
+
+    def test_get_stack_does_not_exist(self) -> None:
+        """Test get_stack stack does not exist."""
+        cfn = boto3.client("cloudformation", region_name="us-east-1")
+        stubber = Stubber(cfn)
+        stubber.add_client_error(
+            "describe_stacks",
+            service_message="Stack with id test does not exist",
+            expected_params={"StackName": "test"},
+        )
+        obj = StackStatusPoller(cfn)
+        since = time.time()
+        with stubber, pytest.raises(exceptions.StackDoesNotExist):
+            obj.get_stack("test", since)
+        with stubber, pytest.raises(exceptions.StackDoesNotExist):
+            obj.get_stack("test", since)
+        stubber.assert_no_pending_responses()
+
+    def test_get_stack_raise_client_error(self) -> None:
+        """Test get_stack raise ClientError."""
+        cfn = boto3.client("cloudformation", region_name="us-east-1")
+        stubber = Stubber(cfn)
+        stubber.add_client_error("describe_stacks", service_error_code="Throttling")
+        obj = StackStatusPoller(cfn)
+        with stubber, pytest.raises(ClientError):
+            obj.get_stack("test", time.time())
+        assert not obj._refreshing
+
+    def test_get_stack_watch_ttl(self, mocker: MockerFixture) -> None:
+        """Test get_stack only refreshes recently polled stacks."""
+        mocker.patch.object(StackStatusPoller, "BATCH_THRESHOLD", 2)
+        cfn = boto3.client("cloudformation", region_name="us-east-1")
+        stubber = Stubber(cfn)
+        stack0 = generate_describe_stacks_stack("test0")
+        stack1 = generate_describe_stacks_stack("test1")
+        stubber.add_response("describe_stacks", {"Stacks": [stack0]}, {"StackName": "test0"})
+        stubber.add_response("describe_stacks", {"Stacks": [stack1]}, {"StackName": "test1"})
+        obj = StackStatusPoller(cfn, watch_ttl=0)
+        with stubber:
+            assert obj.get_stack("test0", time.time()) == stack0
+            assert obj.get_stack("test1", time.time()) == stack1
+        stubber.assert_no_pending_responses()
+
+    def test_provider_poll_stack(self, mocker: MockerFixture) -> None:
+        """Test Provider.poll_stack."""
+        mock_get_stack = mocker.patch.object(StackStatusPoller, "get_stack", return_value="success")
+        provider = Provider(MagicMock())
+        assert provider.poll_stack("test", 1.0) == "success"
+        mock_get_stack.assert_called_once_with("test", 1.0)
+        assert provider.get_stack("test") == "success"
+
+    def test_provider_poll_stack_does_not_exist(self, mocker: MockerFixture) -> None:
+        """Test Provider.poll_stack stack does not exist."""
+        mocker.patch.object(
+            StackStatusPoller, "get_stack", side_effect=exceptions.StackDoesNotExist("test")
+        )
+        provider = Provider(MagicMock())
+        provider.stack_cache.set("test", generate_describe_stacks_stack("test"))
+        with pytest.raises(exceptions.StackDoesNotExist):
+            provider.poll_stack("test", 1.0)
+        assert provider.stack_cache.get("test") is None
+
+
 class TestProviderDefaultMode(unittest.TestCase):
     """Tests for runway.cfngin.providers.aws.default default mode."""
 
@@ -644,8 +863,46 @@ class TestProviderDefaultMode(unittest.TestCase):
 
         with self.stubber:
             response = self.provider.get_stack(stack_name)
+            assert self.provider.get_stack(stack_name) == response
+        self.stubber.assert_no_pending_responses()
 
         assert response["StackName"] == stack_name
+        assert (self.provider.stack_cache.hits, self.provider.stack_cache.misses) == (1, 1)
+
+    def test_get_stack_invalidated(self) -> None:
+        """Test get stack is retrieved again after the stack is destroyed."""
+        stack_name = "MockStack"
+        stack = generate_describe_stacks_stack(stack_name)
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [stack]}, expected_params={"StackName": stack_name}
+        )
+        self.stubber.add_response("delete_stack", {}, expected_params={"StackName": stack_name})
+        self.stubber.add_client_error(
+            "describe_stacks",
+            service_error_code="ValidationError",
+            service_message=f"Stack with id {stack_name} does not exist",
+            expected_params={"StackName": stack_name},
+        )
+
+        with self.stubber:
+            self.provider.destroy_stack(self.provider.get_stack(stack_name))
+            with pytest.raises(exceptions.StackDoesNotExist):
+                self.provider.get_stack(stack_name)
+        self.stubber.assert_no_pending_responses()
+
+    def test_log_stack_cache_stats(self) -> None:
+        """Test log_stack_cache_stats."""
+        builder = ProviderBuilder(region="us-east-1")
+        provider = builder.build()
+        provider.stack_cache.set("test", generate_describe_stacks_stack("test"))
+        provider.stack_cache.get("test")
+        provider.stack_cache.get("other")
+        with self.assertLogs("runway.cfngin.providers.aws.default", level="VERBOSE") as logs:
+            builder.log_stack_cache_stats()
+        assert logs.output == [
+            "VERBOSE:runway.cfngin.providers.aws.default:"
+            "us-east-1:stack description cache hits: 1; misses: 1"
+        ]
 
     def test_select_destroy_method(self) -> None:
         """Test select destroy method."""
@@ -870,14 +1127,6 @@ class TestProviderDefaultMode(unittest.TestCase):
                 ]
             },
         )
-        self.stubber.add_response(
-            "describe_stacks",
-            {
-                "Stacks": [
-                    generate_describe_stacks_stack(stack_name, stack_status="REVIEW_IN_PROGRESS")
-                ]
-            },
-        )
 
         self.stubber.add_response("delete_stack", {})
 
@@ -981,6 +1230,7 @@ class TestProviderDefaultMode(unittest.TestCase):
         ]
 
         for test in test_cases:
+            self.provider.stack_cache.invalidate(stack_name)
             self.stubber.add_response(
                 "describe_stacks",
                 {
@@ -1,17 +1,28 @@
 """Tests for runway.cfngin.dag."""
 
+from __future__ import annotations
+
+import random
 import threading
-from typing import Any
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 from runway.cfngin.dag import (
     DAG,
     DAGValidationError,
+    PooledWalker,
     ThreadedWalker,
     UnlimitedSemaphore,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pytest_mock import MockerFixture
+
 
 def test_add_node(empty_dag: DAG) -> None:
     """Test add node."""
@@ -39,6 +50,19 @@ def test_add_edge(empty_dag: DAG) -> None:
     assert dag.graph == {"a": set("b"), "b": set()}
 
 
+def test_add_edge_cycle(empty_dag: DAG, mocker: MockerFixture) -> None:
+    """Test add edge checks for cycles without sorting the graph."""
+    dag = empty_dag
+    mock_sort = mocker.spy(dag, "_topological_sort")
+    dag.from_dict({"a": ["b"], "b": ["c"], "c": [], "d": []})
+    for ind_node, dep_node in [("c", "a"), ("b", "a"), ("a", "a")]:
+        with pytest.raises(DAGValidationError, match="graph is not acyclic"):
+            dag.add_edge(ind_node, dep_node)
+    dag.add_edge("d", "a")
+    mock_sort.assert_not_called()
+    assert dag.graph == {"a": {"b"}, "b": {"c"}, "c": set(), "d": {"a"}}
+
+
 def test_from_dict(empty_dag: DAG) -> None:
     """Test from dict."""
     dag = empty_dag
@@ -135,6 +159,22 @@ def test_predecessors(basic_dag: DAG) -> None:
     assert set(dag.predecessors("d")) == {"b", "c"}
 
 
+def test_critical_path_lengths(empty_dag: DAG) -> None:
+    """Test critical_path_lengths."""
+    dag = empty_dag
+    dag.from_dict({"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": [], "e": ["d"], "f": ["e"]})
+    assert dag.critical_path_lengths() == {"a": 1, "b": 2, "c": 2, "d": 3, "e": 2, "f": 1}
+    weights = {"a": 10, "b": 1, "c": 2, "d": 1, "e": 1, "f": 1}
+    assert dag.critical_path_lengths(weights.__getitem__) == {
+        "a": 10,
+        "b": 11,
+        "c": 12,
+        "d": 13,
+        "e": 2,
+        "f": 1,
+    }
+
+
 def test_filter(basic_dag: DAG) -> None:
     """Test filter."""
     dag = basic_dag
@@ -143,6 +183,57 @@ def test_filter(basic_dag: DAG) -> None:
     assert dag2.graph == {"b": set("d"), "c": set("d"), "d": set()}
 
 
+def test_filter_copies_edges(basic_dag: DAG) -> None:
+    """Test filter does not share edges with the original DAG."""
+    dag = basic_dag
+    dag2 = dag.filter(["b"])
+    dag2.delete_edge("b", "d")
+    assert dag.graph["b"] == {"d"}
+    assert dag.all_downstreams("b") == ["d"]
+
+
+def test_filter_large_random(mocker: MockerFixture) -> None:
+    """Test filter against a large random DAG."""
+    rng = random.Random(0)  # noqa: S311
+    names = [f"node{i}" for i in range(3000)]
+    dag = DAG()
+    dag.graph = OrderedDict(
+        (name, set(rng.sample(names[i + 1 :], min(rng.randint(0, 3), len(names) - i - 1))))
+        for i, name in enumerate(names)
+    )
+    closure = _closure(dag.graph)
+    targets = rng.sample(names, 500)
+    mock_sort = mocker.spy(dag, "_topological_sort")
+
+    filtered = dag.filter(targets)
+
+    mock_sort.assert_called_once_with()  # reachability is reused for each target
+    assert set(filtered.graph) == set(targets).union(*(closure[i] for i in targets))
+
+
+def test_index_invalidated(empty_dag: DAG) -> None:
+    """Test cached reachability is recomputed when the graph is modified."""
+    dag = empty_dag
+    dag.from_dict({"a": ["b"], "b": [], "c": []})
+    assert dag.all_downstreams("a") == ["b"]
+    dag.add_edge("b", "c")
+    assert dag.all_downstreams("a") == ["b", "c"]
+    dag.delete_edge("b", "c")
+    assert dag.all_downstreams("a") == ["b"]
+    dag.add_node("d")
+    dag.add_edge("b", "d")
+    assert dag.all_downstreams("a") == ["b", "d"]
+    dag.rename_edges("d", "e")
+    assert dag.all_downstreams("a") == ["b", "e"]
+    dag.delete_node("b")
+    assert dag.all_downstreams("a") == []
+    assert dag.topological_sort() == ["a", "c", "e"]
+    dag.graph = OrderedDict([("x", {"y"}), ("y", set())])
+    assert dag.all_downstreams("x") == ["y"]
+    with pytest.raises(KeyError):
+        dag.all_downstreams("a")
+
+
 def test_all_leaves(basic_dag: DAG) -> None:
     """Test all leaves."""
     dag = basic_dag
@@ -193,6 +284,82 @@ def test_transitive_deep_reduction(empty_dag: DAG) -> None:
     assert dag.graph == {"a": set("b"), "b": set("c"), "c": set("d"), "d": set()}
 
 
+def _closure(graph: dict[str, set[str]]) -> dict[str, set[str]]:
+    """Naively compute every node reachable from each node.
+
+    Nodes of the graph must only have edges to nodes that come after them.
+
+    """
+    result: dict[str, set[str]] = {}
+    for node in reversed(graph):
+        result[node] = set(graph[node])
+        for edge in graph[node]:
+            result[node] |= result[edge]
+    return result
+
+
+@pytest.mark.parametrize("node_count, max_edges", [(200, 50), (1000, 20), (3000, 5)])
+def test_transitive_reduction_large_random(
+    max_edges: int, mocker: MockerFixture, node_count: int
+) -> None:
+    """Test transitive reduction against large random DAGs."""
+    rng = random.Random(node_count)  # noqa: S311
+    names = [f"node{i}" for i in range(node_count)]
+    dag = DAG()
+    # Only adding edges to later nodes guarantees the graph is acyclic.
+    # Edges are assigned directly to avoid the validation done by add_edge.
+    dag.graph = OrderedDict(
+        (
+            name,
+            set(rng.sample(names[i + 1 :], min(rng.randint(0, max_edges), node_count - i - 1))),
+        )
+        for i, name in enumerate(names)
+    )
+    expected_closure = _closure(dag.graph)
+    mock_sort = mocker.spy(dag, "_topological_sort")
+
+    dag.transitive_reduction()
+
+    mock_sort.assert_called_once_with()  # reachability is computed in a single pass
+    assert _closure(dag.graph) == expected_closure
+    for node, edges in dag.graph.items():
+        for edge in edges:  # no remaining edge is implied by another path
+            assert not any(edge in expected_closure[other] for other in edges - {edge}), node
+
+
+class _CountingSet(set[str]):
+    """Set counting how many times its items are visited."""
+
+    visits = 0
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the set, counting each item."""
+        for item in super().__iter__():
+            _CountingSet.visits += 1
+            yield item
+
+
+@pytest.mark.parametrize("node_count", [1000, 10000])
+def test_transitive_reduction_linear_edge_visits(node_count: int) -> None:
+    """Test transitive reduction visits each edge a constant number of times."""
+    rng = random.Random(node_count)  # noqa: S311
+    names = [f"node{i}" for i in range(node_count)]
+    dag = DAG()
+    dag.graph = OrderedDict(
+        (name, _CountingSet(rng.sample(names[i + 1 : i + 50], min(5, node_count - i - 1))))
+        for i, name in enumerate(names)
+    )
+    edge_count = sum(len(edges) for edges in dag.graph.values())
+    _CountingSet.visits = 0
+
+    dag.transitive_reduction()
+
+    # the topological sort visits each edge twice, indexing reachability once,
+    # and the reduction once; searching the graph for each edge would visit
+    # edges a number of times that grows with the size of the graph
+    assert _CountingSet.visits <= 4 * edge_count
+
+
 def test_threaded_walker(empty_dag: DAG) -> None:
     """Test threaded walker."""
     dag = empty_dag
@@ -212,3 +379,104 @@ def test_threaded_walker(empty_dag: DAG) -> None:
 
     walker.walk(dag, walk_func)
     assert nodes in [["d", "c", "b", "a"], ["d", "b", "c", "a"]]
+
+
+def test_pooled_walker(empty_dag: DAG) -> None:
+    """Test pooled walker."""
+    dag = empty_dag
+
+    walker = PooledWalker()
+
+    # b and c should be executed at the same time.
+    dag.from_dict({"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": []})
+
+    lock = threading.Lock()  # Protects nodes from concurrent access
+    nodes: list[Any] = []
+
+    def walk_func(node: Any) -> bool:
+        with lock:
+            nodes.append(node)
+        return True
+
+    walker.walk(dag, walk_func)
+    assert nodes in [["d", "c", "b", "a"], ["d", "b", "c", "a"]]
+
+
+def test_pooled_walker_empty(empty_dag: DAG) -> None:
+    """Test pooled walker with no nodes."""
+    nodes: list[str] = []
+    PooledWalker().walk(empty_dag, nodes.append)
+    assert not nodes
+
+
+def test_pooled_walker_exception(basic_dag: DAG) -> None:
+    """Test pooled walker continues when walk_func raises."""
+    lock = threading.Lock()
+    nodes: list[str] = []
+
+    def walk_func(node: str) -> bool:
+        with lock:
+            nodes.append(node)
+        if node == "d":
+            raise ValueError
+        return True
+
+    PooledWalker(2).walk(basic_dag, walk_func)
+    assert sorted(nodes) == ["a", "b", "c", "d"]
+    assert nodes[0] == "d"
+    assert nodes[-1] == "a"
+
+
+def test_pooled_walker_max_workers(empty_dag: DAG) -> None:
+    """Test pooled walker limits the number of nodes run in parallel."""
+    dag = empty_dag
+    dag.from_dict({name: [] for name in "abcdefgh"})
+
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+    thread_names: set[str] = set()
+
+    def walk_func(_node: str) -> bool:
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+            thread_names.add(threading.current_thread().name)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return True
+
+    PooledWalker(3).walk(dag, walk_func)
+    assert max_active <= 3
+    assert len(thread_names) <= 3
+
+
+def test_pooled_walker_max_workers_invalid() -> None:
+    """Test pooled walker with invalid max_workers."""
+    with pytest.raises(ValueError, match="max_workers"):
+        PooledWalker(-1)
+
+
+@pytest.mark.parametrize(
+    "critical_path, weight, expected",
+    [
+        (False, None, ["d", "x", "y", "c", "b", "z", "a"]),
+        (True, None, ["d", "x", "c", "b", "y", "z", "a"]),
+        (
+            True,
+            {"a": 1, "b": 1, "c": 1, "d": 1, "x": 10, "y": 1, "z": 1}.__getitem__,
+            ["x", "d", "c", "b", "y", "z", "a"],
+        ),
+    ],
+)
+def test_pooled_walker_critical_path(
+    critical_path: bool, weight: Any, expected: list[str], empty_dag: DAG
+) -> None:
+    """Test pooled walker starts nodes on the critical path first."""
+    dag = empty_dag
+    dag.from_dict({"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": [], "x": [], "y": [], "z": ["x"]})
+    nodes: list[str] = []
+    PooledWalker(1, critical_path=critical_path, weight=weight).walk(dag, nodes.append)
+    assert nodes == expected
@@ -0,0 +1,80 @@
+"""Tests for runway.cfngin.history."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from runway.cfngin.history import StepHistory, format_duration
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.parametrize(
+    "seconds, expected",
+    [(0, "0s"), (59.6, "1m 0s"), (61, "1m 1s"), (3600, "1h 0m 0s"), (3725, "1h 2m 5s")],
+)
+def test_format_duration(seconds: float, expected: str) -> None:
+    """Test format_duration."""
+    assert format_duration(seconds) == expected
+
+
+class TestStepHistory:
+    """Test StepHistory."""
+
+    def test_add(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test add."""
+        mocker.patch.object(StepHistory, "MAX_SAMPLES", 2)
+        obj = StepHistory(tmp_path / "history.json")
+        obj.add("_launch_stack", "test-stack", 1.0)
+        obj.add("_launch_stack", "test-stack", 2.0)
+        obj.add("_launch_stack", "test-stack", 3.0001)
+        obj.add("_destroy_stack", "test-stack", 4.0)
+        assert obj.data == {
+            "_destroy_stack": {"test-stack": [4.0]},
+            "_launch_stack": {"test-stack": [2.0, 3.0]},
+        }
+
+    def test_data(self, tmp_path: Path) -> None:
+        """Test data."""
+        path = tmp_path / "history.json"
+        path.write_text(json.dumps({"durations": {"_launch_stack": {"test-stack": [1.0]}}}))
+        assert StepHistory(path).data == {"_launch_stack": {"test-stack": [1.0]}}
+
+    def test_data_invalid(self, tmp_path: Path) -> None:
+        """Test data file is invalid."""
+        path = tmp_path / "history.json"
+        path.write_text("invalid")
+        assert StepHistory(path).data == {}
+
+    def test_data_not_file(self, tmp_path: Path) -> None:
+        """Test data file does not exist."""
+        assert StepHistory(tmp_path / "history.json").data == {}
+
+    def test_estimate(self, tmp_path: Path) -> None:
+        """Test estimate."""
+        obj = StepHistory(tmp_path / "history.json")
+        assert obj.estimate("_launch_stack", "test-stack") is None
+        for duration in [1.0, 10.0, 3.0]:
+            obj.add("_launch_stack", "test-stack", duration)
+        assert obj.estimate("_launch_stack", "test-stack") == 3.0  # noqa: PLR2004
+        assert obj.estimate("_destroy_stack", "test-stack") is None
+
+    def test_save(self, tmp_path: Path) -> None:
+        """Test save."""
+        path = tmp_path / "sub" / "history.json"
+        obj = StepHistory(path)
+        obj.save()
+        assert not path.exists()
+        obj.add("_launch_stack", "test-stack", 1.0)
+        obj.save()
+        assert json.loads(path.read_text()) == {
+            "durations": {"_launch_stack": {"test-stack": [1.0]}}
+        }
+        assert [i.name for i in path.parent.iterdir()] == ["history.json"]
+        assert StepHistory(path).estimate("_launch_stack", "test-stack") == 1.0
@@ -68,6 +68,23 @@ class TestStep(unittest.TestCase):
         assert self.step.status is not False
         assert self.step.status != "banana"
 
+    def test_duration(self) -> None:
+        """Test duration."""
+        assert self.step.duration is None
+        self.step.submit()
+        assert self.step.submitted_at
+        submitted_at = self.step.submitted_at
+        self.step.set_status(SUBMITTED.__class__("updating"))  # type: ignore
+        assert self.step.submitted_at == submitted_at
+        assert self.step.duration is None
+        self.step.complete()
+        assert self.step.duration == self.step.last_updated - submitted_at
+
+    def test_duration_not_submitted(self) -> None:
+        """Test duration when completed without being submitted."""
+        self.step.complete()
+        assert self.step.duration is None
+
     def test_from_stack_name(self) -> None:
         """Return step from step name."""
         context = mock_context()
@@ -162,10 +179,12 @@ class TestPlan(unittest.TestCase):
                 return "test"
 
         register_lookup_handler("noop", FakeLookup)
+        self.tmp_path = Path(tempfile.mkdtemp())
 
     def tearDown(self) -> None:
         """Run after tests."""
         unregister_lookup_handler("noop")
+        shutil.rmtree(self.tmp_path)
 
     def test_plan(self) -> None:
         """Test plan."""
@@ -255,6 +274,48 @@ class TestPlan(unittest.TestCase):
         assert {"vpc-1"} == result_graph_dict.get("bastion-1")
         assert result_graph_dict.get("namespace-removed-1") is None
 
+    def test_execute_plan_step_history(self) -> None:
+        """Test execute plan records the duration of steps."""
+        context = CfnginContext(config=self.config, work_dir=self.tmp_path)
+        vpc = Stack(definition=generate_definition("vpc", 1), context=context)
+        bastion = Stack(
+            definition=generate_definition("bastion", 1, requires=[vpc.name]),
+            context=context,
+        )
+
+        def _launch_stack(stack: Stack, status: Status | None = None) -> Status:
+            if stack.name == "vpc-1" and status != SUBMITTED:
+                return SUBMITTED
+            return COMPLETE
+
+        graph = Graph.from_steps([Step(vpc, fn=_launch_stack), Step(bastion, fn=_launch_stack)])
+        plan = Plan(description="Test", graph=graph, context=context)
+        assert plan.estimated_durations() == {}
+        assert plan.estimated_duration is None
+        plan.execute(walk)
+
+        history = json.loads((self.tmp_path / "cfngin_step_history.json").read_text())
+        assert list(history["durations"]["_launch_stack"]) == ["namespace-vpc-1"]
+
+        new_plan = Plan(
+            description="Test",
+            graph=Graph.from_steps([Step(vpc, fn=_launch_stack), Step(bastion, fn=_launch_stack)]),
+            context=CfnginContext(config=self.config, work_dir=self.tmp_path),
+        )
+        estimate = history["durations"]["_launch_stack"]["namespace-vpc-1"][0]
+        assert new_plan.estimated_durations() == {"vpc-1": estimate, "bastion-1": estimate}
+        assert new_plan.estimated_duration == estimate * 2
+
+    def test_outline_estimated_duration(self) -> None:
+        """Test outline includes the estimated duration."""
+        context = CfnginContext(config=self.config, work_dir=self.tmp_path)
+        context.step_history.add("None", "namespace-vpc-1", 90)
+        vpc = Stack(definition=generate_definition("vpc", 1), context=context)
+        plan = Plan(description="Test", graph=Graph.from_steps([Step(vpc)]), context=context)
+        with self.assertLogs("runway.cfngin.plan", level="INFO") as logs:
+            plan.outline()
+        assert logs.output[-1].endswith("estimated time to complete: 1m 30s")
+
     def test_execute_plan_no_persist(self) -> None:
         """Test execute plan with no persistent graph."""
         context = CfnginContext(config=self.config)
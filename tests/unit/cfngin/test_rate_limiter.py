@@ -0,0 +1,160 @@
+"""Tests for runway.cfngin.rate_limiter."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from runway.cfngin.rate_limiter import (
+    TokenBucket,
+    _needs_retry,
+    get_rate_limiter,
+    register_rate_limiter,
+)
+from runway.cfngin.session_cache import get_session
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.cfngin.rate_limiter"
+
+
+class FakeClock:
+    """Clock that only advances when told to."""
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Advance the clock."""
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Test TokenBucket."""
+
+    def test_acquire_disabled(self) -> None:
+        """Test acquire does not wait before a request is throttled."""
+        clock = FakeClock()
+        obj = TokenBucket(clock=clock, sleep=clock.sleep)
+        assert [obj.acquire() for _ in range(50)] == [0.0] * 50
+        assert clock.now == 100.0  # noqa: PLR2004
+        assert not obj.enabled
+
+    def test_acquire_enabled(self) -> None:
+        """Test acquire limits the rate of requests once throttled."""
+        clock = FakeClock()
+        obj = TokenBucket(clock=clock, sleep=clock.sleep)
+        for _ in range(8):
+            obj.acquire()
+        obj.on_throttle()
+        assert obj.enabled
+        assert obj.rate == 4
+        for _ in range(8):
+            obj.acquire()
+        assert clock.now == pytest.approx(102.0)
+
+    def test_on_success(self) -> None:
+        """Test on_success increases the rate additively."""
+        clock = FakeClock()
+        obj = TokenBucket(clock=clock, max_rate=4.5, sleep=clock.sleep)
+        obj.on_success()
+        assert obj.rate == 4.5  # noqa: PLR2004
+        for _ in range(8):
+            obj.acquire()
+        obj.on_throttle()
+        obj.on_success()
+        assert obj.rate == 4.25  # noqa: PLR2004
+        for _ in range(10):
+            obj.on_success()
+        assert obj.rate == 4.5  # noqa: PLR2004
+
+    def test_on_throttle(self) -> None:
+        """Test on_throttle decreases the rate multiplicatively."""
+        clock = FakeClock()
+        obj = TokenBucket(clock=clock, min_rate=1, sleep=clock.sleep)
+        for _ in range(8):
+            obj.acquire()
+        obj.on_throttle()
+        assert obj.rate == 4
+        obj.on_throttle()
+        assert obj.rate == 4  # within cooldown
+        clock.now += 1
+        obj.on_throttle()
+        assert obj.rate == 2
+        clock.now += 1
+        obj.on_throttle()
+        clock.now += 1
+        obj.on_throttle()
+        assert obj.rate == 1
+
+
+def test_get_rate_limiter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test get_rate_limiter."""
+    monkeypatch.setenv("CFNGIN_API_MAX_RATE", "10")
+    result = get_rate_limiter("cloudformation", "us-west-2", "test-get-rate-limiter")
+    assert result.max_rate == 10
+    assert get_rate_limiter("cloudformation", "us-west-2", "test-get-rate-limiter") is result
+    assert get_rate_limiter("cloudformation", "us-east-1", "test-get-rate-limiter") is not result
+    assert get_rate_limiter("s3", "us-west-2", "test-get-rate-limiter") is not result
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        (None, None),
+        ((MagicMock(status_code=200), {}), "on_success"),
+        ((MagicMock(status_code=400), {"Error": {"Code": "Throttling"}}), "on_throttle"),
+        ((MagicMock(status_code=400), {"Error": {"Code": "ValidationError"}}), None),
+    ],
+)
+def test_needs_retry(
+    expected: str | None, mocker: MockerFixture, response: tuple[MagicMock, dict[str, object]]
+) -> None:
+    """Test _needs_retry."""
+    limiter = MagicMock()
+    mock_get_rate_limiter = mocker.patch(f"{MODULE}.get_rate_limiter", return_value=limiter)
+    operation = MagicMock()
+    operation.service_model.service_name = "cloudformation"
+    assert not _needs_retry(
+        identity="test",
+        operation=operation,
+        request_dict={"context": {"client_region": "us-east-1"}},
+        response=response,
+    )
+    if response is None:
+        mock_get_rate_limiter.assert_not_called()
+    else:
+        mock_get_rate_limiter.assert_called_once_with("cloudformation", "us-east-1", "test")
+    assert [i[0] for i in limiter.method_calls] == (
+        ["on_throttle", "acquire"] if expected == "on_throttle" else [expected] if expected else []
+    )
+
+
+def test_register_rate_limiter(mocker: MockerFixture) -> None:
+    """Test register_rate_limiter."""
+    limiter = MagicMock()
+    mock_get_rate_limiter = mocker.patch(f"{MODULE}.get_rate_limiter", return_value=limiter)
+    session = get_session(region="us-west-2", access_key="foo", secret_key="bar")
+    client = session.client("cloudformation")
+    client.meta.events.register(
+        "before-call.*.*", lambda **_: (MagicMock(status_code=200), {"Stacks": []})
+    )
+    client.describe_stacks()
+    mock_get_rate_limiter.assert_called_once_with("cloudformation", "us-west-2", "foo")
+    limiter.acquire.assert_called_once_with()
+
+
+def test_register_rate_limiter_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test register_rate_limiter when disabled."""
+    monkeypatch.setenv("CFNGIN_API_MAX_RATE", "0")
+    session = MagicMock()
+    register_rate_limiter(session)
+    session.events.register.assert_not_called()
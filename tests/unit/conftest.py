@@ -13,6 +13,7 @@ import yaml
 
 from runway.config import RunwayConfig
 from runway.core.components import DeployEnvironment
+from runway.lookups.cache import RUN_LOOKUP_CACHE
 
 from .factories import (
     MockCfnginContext,
@@ -73,6 +74,25 @@ def aws_credentials() -> Iterator[None]:
     saved_env.clear()
 
 
+@pytest.fixture(autouse=True)
+def disable_ami_catalog(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Prevent images returned by EC2 from being cached in the working directory."""
+    monkeypatch.setenv("CFNGIN_AMI_CACHE_TTL", "0")
+
+
+@pytest.fixture(autouse=True)
+def disable_render_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Prevent rendered blueprints from being cached in the CFNgin cache directory."""
+    monkeypatch.setenv("CFNGIN_RENDER_CACHE_SIZE", "0")
+
+
+@pytest.fixture(autouse=True)
+def clear_run_lookup_cache() -> Iterator[None]:
+    """Prevent lookup results cached for the life of the process from leaking between tests."""
+    yield
+    RUN_LOOKUP_CACHE.clear()
+
+
 @pytest.fixture(scope="package")
 def fixture_dir() -> Path:
     """Path to the fixture directory."""
@@ -95,6 +95,36 @@ class TestBaseContext:
         mocker.patch.object(self.env, "ci", True)
         assert ctx.is_noninteractive
 
+    def test_get_client(self, mocker: MockerFixture) -> None:
+        """Test get_client."""
+        mock_get_session = mocker.patch.object(
+            BaseContext, "get_session", side_effect=lambda **_: MagicMock()
+        )
+        ctx = BaseContext(deploy_environment=self.env)
+        client = ctx.get_client("s3")
+        assert ctx.get_client("s3") is client
+        assert ctx.get_client("s3", region=self.env.aws_region) is client
+        mock_get_session.assert_called_once_with(
+            aws_access_key_id=None,
+            aws_secret_access_key=None,
+            aws_session_token=None,
+            profile=None,
+            region=None,
+        )
+        assert ctx.get_client("ssm") is not client
+        assert ctx.get_client("s3", region="us-west-2") is not client
+        assert ctx.get_client("s3", profile="foo") is not client
+        assert ctx.get_client("s3", aws_access_key_id="other") is not client
+        assert mock_get_session.call_count == 5
+
+    def test_get_client_env_creds(self, mocker: MockerFixture) -> None:
+        """Test get_client uses a new client when credentials change."""
+        mocker.patch.object(BaseContext, "get_session", side_effect=lambda **_: MagicMock())
+        ctx = BaseContext(deploy_environment=self.env)
+        client = ctx.get_client("sts")
+        ctx.env.vars["AWS_SESSION_TOKEN"] = "new"
+        assert ctx.get_client("sts") is not client
+
     def test_get_session(
         self, mock_boto3_session: MagicMock, mock_sso_botocore_session: MagicMock
     ) -> None:
@@ -553,7 +553,13 @@ class TestCFNginContext:
             CfnginContext, "get_session", return_value=mock_session
         )
         assert CfnginContext(deploy_environment=self.env).s3_client == mock_client
-        mock_get_session.assert_called_once_with(region=self.env.aws_region)
+        mock_get_session.assert_called_once_with(
+            aws_access_key_id=None,
+            aws_secret_access_key=None,
+            aws_session_token=None,
+            profile=None,
+            region=self.env.aws_region,
+        )
         mock_session.client.assert_called_once_with("s3")
 
     def test_set_hook_data_key_error(self) -> None:
@@ -593,6 +599,23 @@ class TestCFNginContext:
         assert isinstance(obj.stacks[1], Stack)
         assert obj.stacks[1].name == self.config.stacks[1].name
 
+    def test_render_cache(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test render_cache."""
+        monkeypatch.setenv("CFNGIN_RENDER_CACHE_SIZE", "100")
+        obj = CfnginContext(config=self.config, work_dir=tmp_path)
+        assert obj.render_cache
+        assert obj.render_cache.max_size == 100
+        assert obj.render_cache.path == obj.config.cfngin_cache_dir / "blueprints"
+
+    def test_render_cache_disabled(self) -> None:
+        """Test render_cache disabled."""
+        assert not CfnginContext(config=self.config).render_cache
+
+    def test_step_history(self, tmp_path: Path) -> None:
+        """Test step_history."""
+        obj = CfnginContext(config=self.config, work_dir=tmp_path)
+        assert obj.step_history.path == tmp_path / "cfngin_step_history.json"
+
     def test_tags_empty(self) -> None:
         """Test tags empty."""
         obj = CfnginContext(config=CfnginConfig.parse_obj({"namespace": "test", "tags": {}}))
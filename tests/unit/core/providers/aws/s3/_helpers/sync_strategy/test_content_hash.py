@@ -0,0 +1,143 @@
+"""Test runway.core.providers.aws.s3._helpers.sync_strategy.content_hash."""
+
+from __future__ import annotations
+
+import datetime
+import logging
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from runway.core.providers.aws.s3._helpers.file_generator import FileStats
+from runway.core.providers.aws.s3._helpers.hash_index import (
+    CONTENT_HASH_METADATA_KEY,
+    LocalHashIndex,
+)
+from runway.core.providers.aws.s3._helpers.parameters import ParametersDataModel
+from runway.core.providers.aws.s3._helpers.sync_strategy.content_hash import ContentHashSync
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.core.providers.aws.s3._helpers.sync_strategy.content_hash"
+
+FOO_MD5 = "acbd18db4cc2f85cedef654fccc4a4d8"
+
+
+class TestContentHashSync:
+    """Test ContentHashSync."""
+
+    @pytest.fixture()
+    def src_file(self, tmp_path: Path) -> FileStats:
+        """Local file being uploaded."""
+        src = tmp_path / "src.txt"
+        src.write_text("foo")
+        return FileStats(
+            src=src,
+            dest="s3://bucket/src.txt",
+            last_update=datetime.datetime.now(),
+            operation_name="upload",
+            size=3,
+        )
+
+    @staticmethod
+    def dest_file(etag: str, size: int = 3) -> FileStats:
+        """Object the local file is compared with."""
+        return FileStats(
+            src="bucket/src.txt",
+            last_update=datetime.datetime.now() - datetime.timedelta(days=1),
+            response_data={"ETag": f'"{etag}"'},  # type: ignore
+            size=size,
+        )
+
+    @staticmethod
+    def strategy(client: Any = None) -> ContentHashSync:
+        """Content hash sync strategy chosen for a sync."""
+        obj = ContentHashSync()
+        obj.use_sync_strategy(ParametersDataModel(content_hash=True, dest="", src=""), client)
+        return obj
+
+    def test_determine_should_sync_multipart(self, src_file: FileStats) -> None:
+        """Test determine_should_sync for a multipart object."""
+        client = Mock(
+            head_object=Mock(return_value={"Metadata": {CONTENT_HASH_METADATA_KEY: FOO_MD5}})
+        )
+        assert not self.strategy(client).determine_should_sync(src_file, self.dest_file("abc-2"))
+        client.head_object.assert_called_once_with(Bucket="bucket", Key="src.txt")
+        client.head_object.return_value = {"Metadata": {}}
+        assert self.strategy(client).determine_should_sync(src_file, self.dest_file("abc-2"))
+
+    def test_determine_should_sync_multipart_client_error(self, src_file: FileStats) -> None:
+        """Test determine_should_sync for a multipart object that can't be retrieved."""
+        client = Mock(head_object=Mock(side_effect=ClientError({}, "HeadObject")))
+        assert self.strategy(client).determine_should_sync(src_file, self.dest_file("abc-2"))
+
+    def test_determine_should_sync_not_upload(
+        self, mocker: MockerFixture, src_file: FileStats
+    ) -> None:
+        """Test determine_should_sync for operations other than upload."""
+        mock_super = mocker.patch(
+            f"{MODULE}.SizeAndLastModifiedSync.determine_should_sync", return_value=True
+        )
+        src_file.operation_name = "download"
+        dest_file = self.dest_file(FOO_MD5)
+        assert self.strategy().determine_should_sync(src_file, dest_file)
+        mock_super.assert_called_once_with(src_file, dest_file)
+
+    def test_determine_should_sync_raise_value_error(self) -> None:
+        """Test determine_should_sync."""
+        with pytest.raises(ValueError, match="src_file and dest_file must not be None"):
+            ContentHashSync().determine_should_sync(None, None)
+
+    def test_determine_should_sync_single_part(self, src_file: FileStats) -> None:
+        """Test determine_should_sync for a single part object."""
+        client = Mock(head_object=Mock(return_value={"Metadata": {}}))
+        assert not self.strategy(client).determine_should_sync(src_file, self.dest_file(FOO_MD5))
+        client.head_object.assert_not_called()
+        assert self.strategy(client).determine_should_sync(src_file, self.dest_file("abc"))
+        client.head_object.assert_called_once_with(Bucket="bucket", Key="src.txt")
+
+    def test_determine_should_sync_single_part_kms(self, src_file: FileStats) -> None:
+        """Test determine_should_sync for a single part object encrypted with SSE-KMS."""
+        client = Mock(
+            head_object=Mock(return_value={"Metadata": {CONTENT_HASH_METADATA_KEY: FOO_MD5}})
+        )
+        assert not self.strategy(client).determine_should_sync(src_file, self.dest_file("abc"))
+        client.head_object.assert_called_once_with(Bucket="bucket", Key="src.txt")
+
+    def test_determine_should_sync_size_changed(
+        self, caplog: pytest.LogCaptureFixture, mocker: MockerFixture, src_file: FileStats
+    ) -> None:
+        """Test determine_should_sync when the size changed."""
+        caplog.set_level(logging.DEBUG, logger="runway.core.providers.aws.s3")
+        mock_md5 = mocker.patch.object(LocalHashIndex, "md5")
+        assert self.strategy().determine_should_sync(src_file, self.dest_file(FOO_MD5, size=4))
+        mock_md5.assert_not_called()
+        assert "size_changed: True, content_changed: True" in caplog.text
+
+    def test_name(self) -> None:
+        """Test name."""
+        assert ContentHashSync().name == "content_hash"
+
+    def test_use_sync_strategy(self, tmp_path: Path) -> None:
+        """Test use_sync_strategy."""
+        client = Mock()
+        obj = ContentHashSync()
+        assert not obj.use_sync_strategy(ParametersDataModel(dest="", src=""), client)
+        assert obj._client is None
+        assert (
+            obj.use_sync_strategy(
+                ParametersDataModel(
+                    content_hash=True, content_hash_index=tmp_path / "index.json", dest="", src=""
+                ),
+                client,
+            )
+            is obj
+        )
+        assert obj._client is client
+        assert obj._index
+        assert obj._index.path == tmp_path / "index.json"
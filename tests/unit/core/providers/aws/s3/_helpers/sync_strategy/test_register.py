@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from unittest.mock import Mock, call
 
 from runway.core.providers.aws.s3._helpers.sync_strategy import (
+    ContentHashSync,
     DeleteSync,
     ExactTimestampsSync,
     SizeOnlySync,
@@ -30,6 +31,7 @@ def test_register_sync_strategies(mocker: MockerFixture) -> None:
         [
             call(session, SizeOnlySync),
             call(session, ExactTimestampsSync),
+            call(session, ContentHashSync),
             call(session, DeleteSync, "file_not_at_src"),
         ],
         any_order=False,
@@ -59,7 +59,7 @@ class TestActionArchitecture:
             "file_not_at_src_sync_strategy": mock_never.return_value,
         }
         self.botocore_session.emit.assert_called_once_with(
-            "choosing-s3-sync-strategy", params=self.parameters
+            "choosing-s3-sync-strategy", params=self.parameters, client=self.action.client
         )
 
     def test_choose_sync_strategies_add_another(self, mocker: MockerFixture) -> None:
@@ -0,0 +1,164 @@
+"""Test runway.core.providers.aws.s3._helpers.batch_delete."""
+
+from __future__ import annotations
+
+import threading
+import time
+from queue import Queue
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock, call
+
+from botocore.exceptions import ClientError
+
+from runway.core.providers.aws.s3._helpers.batch_delete import BatchDeleter
+from runway.core.providers.aws.s3._helpers.results import (
+    FailureResult,
+    QueuedResult,
+    SuccessResult,
+)
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.core.providers.aws.s3._helpers.batch_delete"
+
+
+class TestBatchDeleter:
+    """Test BatchDeleter."""
+
+    def test_add(self, mocker: MockerFixture) -> None:
+        """Test add."""
+        mocker.patch.object(BatchDeleter, "BATCH_SIZE", 2)
+        client = Mock(delete_objects=Mock(return_value={}))
+        result_queue: Queue[Any] = Queue()
+        with BatchDeleter(
+            client, extra_args={"RequestPayer": "requester"}, result_queue=result_queue
+        ) as deleter:
+            futures = [deleter.add("foo", f"key{i}") for i in range(3)]
+            futures[0].result(5)
+            assert futures[0] is futures[1]
+            assert not futures[2].done()
+            deleter.add("bar", "key", "version")
+        assert all(i.done() for i in futures)
+        client.delete_objects.assert_has_calls(
+            [
+                call(
+                    Bucket="foo",
+                    Delete={"Objects": [{"Key": "key0"}, {"Key": "key1"}], "Quiet": True},
+                    RequestPayer="requester",
+                ),
+                call(
+                    Bucket="foo",
+                    Delete={"Objects": [{"Key": "key2"}], "Quiet": True},
+                    RequestPayer="requester",
+                ),
+                call(
+                    Bucket="bar",
+                    Delete={"Objects": [{"Key": "key", "VersionId": "version"}], "Quiet": True},
+                    RequestPayer="requester",
+                ),
+            ],
+            any_order=True,
+        )
+        results = [result_queue.get_nowait() for _ in range(8)]
+        assert result_queue.empty()
+        assert sum(isinstance(i, QueuedResult) for i in results) == 4
+        assert {i.src for i in results if isinstance(i, SuccessResult)} == {
+            "s3://foo/key0",
+            "s3://foo/key1",
+            "s3://foo/key2",
+            "s3://bar/key",
+        }
+        assert not deleter.failures
+
+    def test_add_all_versions(self) -> None:
+        """Test add_all_versions."""
+        client = Mock(delete_objects=Mock(return_value={}))
+        client.get_paginator.return_value.paginate.return_value = [
+            {
+                "DeleteMarkers": [{"Key": "key0", "VersionId": "2"}],
+                "Versions": [{"Key": "key0", "VersionId": "1"}],
+            },
+            {"Versions": [{"Key": "key1", "VersionId": "null"}]},
+        ]
+        with BatchDeleter(client) as deleter:
+            deleter.add_all_versions("foo")
+        client.get_paginator.assert_called_once_with("list_object_versions")
+        client.get_paginator.return_value.paginate.assert_called_once_with(Bucket="foo")
+        client.delete_objects.assert_called_once_with(
+            Bucket="foo",
+            Delete={
+                "Objects": [
+                    {"Key": "key0", "VersionId": "1"},
+                    {"Key": "key0", "VersionId": "2"},
+                    {"Key": "key1", "VersionId": "null"},
+                ],
+                "Quiet": True,
+            },
+        )
+
+    def test_add_concurrent(self, mocker: MockerFixture) -> None:
+        """Test batches are deleted concurrently."""
+        mocker.patch.object(BatchDeleter, "BATCH_SIZE", 1)
+        lock = threading.Lock()
+        active: list[int] = [0, 0]
+
+        def delete_objects(**_: Any) -> dict[str, Any]:
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return {}
+
+        with BatchDeleter(Mock(delete_objects=delete_objects), max_workers=4) as deleter:
+            for i in range(8):
+                deleter.add("foo", f"key{i}")
+        assert active[1] > 1
+
+    def test_delete_objects_errors(self) -> None:
+        """Test failures are reported per object."""
+        client = Mock(
+            delete_objects=Mock(
+                return_value={
+                    "Errors": [{"Key": "key1", "Code": "AccessDenied", "Message": "Access Denied"}]
+                }
+            )
+        )
+        result_queue: Queue[Any] = Queue()
+        with BatchDeleter(client, result_queue=result_queue, transfer_type="move") as deleter:
+            deleter.add("foo", "key0")
+            deleter.add("foo", "key1")
+        assert len(deleter.failures) == 1
+        assert deleter.failures[0].src == "s3://foo/key1"
+        assert deleter.failures[0].transfer_type == "move"
+        assert isinstance(deleter.failures[0].exception, ClientError)
+        assert deleter.failures[0].exception.response["Error"]["Code"] == "AccessDenied"
+        results = [result_queue.get_nowait() for _ in range(4)]
+        assert [type(i) for i in results[2:]] == [SuccessResult, FailureResult]
+
+    def test_delete_objects_unexpected_error(self) -> None:
+        """Test an unexpected error is reported as a failure instead of hanging flush."""
+        exc = RuntimeError("unexpected")
+        client = Mock(delete_objects=Mock(side_effect=exc))
+        with BatchDeleter(client, max_workers=1) as deleter:
+            futures = [deleter.add("foo", "key0"), deleter.add("bar", "key1")]
+        assert all(i.done() for i in futures)
+        assert sorted((i.src, i.exception) for i in deleter.failures) == [
+            ("s3://bar/key1", exc),
+            ("s3://foo/key0", exc),
+        ]
+
+    def test_delete_objects_request_failed(self) -> None:
+        """Test every object in a batch fails when the request fails."""
+        exc = ClientError({"Error": {"Code": "AccessDenied"}}, "DeleteObjects")
+        client = Mock(delete_objects=Mock(side_effect=exc))
+        with BatchDeleter(client) as deleter:
+            future = deleter.add("foo", "key0")
+            deleter.add("foo", "key1")
+        assert future.result() is None
+        assert [(i.src, i.exception) for i in deleter.failures] == [
+            ("s3://foo/key0", exc),
+            ("s3://foo/key1", exc),
+        ]
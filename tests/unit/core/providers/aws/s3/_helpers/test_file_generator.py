@@ -6,6 +6,7 @@ import datetime
 import os
 import platform
 import stat
+from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import Mock
 
@@ -23,8 +24,6 @@ from runway.core.providers.aws.s3._helpers.format_path import FormatPath
 from runway.core.providers.aws.s3._helpers.utils import EPOCH_TIME
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from pytest_mock import MockerFixture
 
     from runway.core.providers.aws.s3._helpers.file_generator import (
@@ -191,6 +190,53 @@ class TestFileGenerator:
         assert (loc_files["files"][0], {"Size": 15, "LastModified": NOW}) in result
         assert (loc_files["files"][1], {"Size": 15, "LastModified": NOW}) in result
 
+    def test_list_files_directory_order(self, tmp_path: Path) -> None:
+        """Test list_files yields files in the order S3 lists keys."""
+        for key in ["a-b", "a.txt", "a/x", "a/b/c", "a0", "b/a", "ab"]:
+            (tmp_path / key).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / key).write_text(key)
+        obj = FileGenerator(self.client, "")
+        assert [i[0].relative_to(tmp_path).as_posix() for i in obj.list_files(tmp_path, True)] == [
+            "a-b",
+            "a.txt",
+            "a/b/c",
+            "a/x",
+            "a0",
+            "ab",
+            "b/a",
+        ]
+
+    def test_list_files_directory_ignored(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test list_files skips directories that should be ignored."""
+        for key in ["a/x", "b/y", "c"]:
+            (tmp_path / key).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / key).write_text(key)
+        mocker.patch.object(
+            FileGenerator, "should_ignore_file", side_effect=lambda path: path.name == "a"
+        )
+        obj = FileGenerator(self.client, "")
+        assert [i[0].relative_to(tmp_path).as_posix() for i in obj.list_files(tmp_path, True)] == [
+            "b/y",
+            "c",
+        ]
+
+    def test_list_files_directory_performance(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test list_files on a large tree only stats each file once."""
+        keys: list[str] = []
+        for i in range(20):
+            for j in range(5):
+                (tmp_path / f"dir{i}" / f"sub{j}").mkdir(parents=True)
+                for k in range(20):
+                    key = f"dir{i}/sub{j}/file{k}.txt"
+                    (tmp_path / key).write_text(key)
+                    keys.append(key)
+        spy_stat = mocker.spy(Path, "stat")
+        obj = FileGenerator(self.client, "")
+        result = [i[0].relative_to(tmp_path).as_posix() for i in obj.list_files(tmp_path, True)]
+        assert result == sorted(keys)
+        # only directories are stat'd through Path; files use their DirEntry
+        assert spy_stat.call_count < len(keys) / 2
+
     def test_list_files_file(self, loc_files: LocalFiles, mocker: MockerFixture) -> None:
         """Test list_files."""
         mocker.patch(f"{MODULE}.get_file_stat", return_value=(15, NOW))
@@ -219,6 +265,30 @@ class TestFileGenerator:
         )
         assert result == [mock_list_objects.return_value[0]]
 
+    def test_list_objects_list_concurrency(self, mocker: MockerFixture) -> None:
+        """Test list_objects with list_concurrency."""
+        mock_list_objects = Mock(return_value=[("bucket/key.txt", {"Size": 13})])
+        mock_class = mocker.patch(
+            f"{MODULE}.ShardedBucketLister", return_value=Mock(list_objects=mock_list_objects)
+        )
+        obj = FileGenerator(self.client, "", list_concurrency=4)
+        assert list(obj.list_objects("bucket/", dir_op=True)) == mock_list_objects.return_value
+        mock_class.assert_called_once_with(self.client, max_workers=4)
+        mock_list_objects.assert_called_once_with(
+            bucket="bucket", prefix="", page_size=None, extra_args={}
+        )
+
+    def test_list_objects_manifest(self, mocker: MockerFixture) -> None:
+        """Test list_objects with manifest."""
+        mock_class = mocker.patch(f"{MODULE}.BucketLister")
+        manifest = Mock(list_objects=Mock(return_value=[("bucket/key.txt", {"Size": 13})]))
+        obj = FileGenerator(self.client, "", manifest=manifest)
+        assert list(obj.list_objects("bucket/", dir_op=True)) == manifest.list_objects.return_value
+        manifest.list_objects.assert_called_once_with(
+            mock_class.return_value, bucket="bucket", prefix="", page_size=None, extra_args={}
+        )
+        mock_class.return_value.list_objects.assert_not_called()
+
     def test_list_objects_delete(self, mocker: MockerFixture) -> None:
         """Test list_objects."""
         mock_list_objects = Mock(
@@ -56,3 +56,11 @@ class TestFileInfoBuilder:
         assert result.size == file_stats.size
         assert result.operation_name == file_stats.operation_name
         assert result.client == client
+
+    def test_call_manifest(self) -> None:
+        """Test call records each file in the manifest."""
+        manifest = Mock()
+        builder = FileInfoBuilder(client=Mock(), manifest=manifest)
+        file_stats = FileStats(src="src", dest="bucket/key", operation_name="upload")
+        results = list(builder.call([file_stats]))
+        manifest.record.assert_called_once_with(results[0])
@@ -0,0 +1,94 @@
+"""Test runway.core.providers.aws.s3._helpers.hash_index."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from typing import TYPE_CHECKING
+
+from runway.core.providers.aws.s3._helpers.hash_index import LocalHashIndex, get_hash_index
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.core.providers.aws.s3._helpers.hash_index"
+
+FOO_MD5 = "acbd18db4cc2f85cedef654fccc4a4d8"
+
+
+class TestLocalHashIndex:
+    """Test LocalHashIndex."""
+
+    def test_md5(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test md5."""
+        mock_md5 = mocker.patch(f"{MODULE}.hashlib.md5", wraps=hashlib.md5)
+        src = tmp_path / "src.txt"
+        src.write_text("foo")
+        obj = LocalHashIndex()
+        assert obj.md5(src) == FOO_MD5
+        assert obj.md5(str(src), src.stat()) == FOO_MD5
+        mock_md5.assert_called_once_with()
+
+    def test_md5_changed(self, tmp_path: Path) -> None:
+        """Test md5 when the file changes."""
+        src = tmp_path / "src.txt"
+        src.write_text("foo")
+        obj = LocalHashIndex()
+        assert obj.md5(src) == FOO_MD5
+        src.write_text("barbaz")
+        os.utime(src, ns=(0, 0))
+        assert obj.md5(src) == "c3c23db5285662ef7172373df0003206"
+
+    def test_save(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test save."""
+        index_path = tmp_path / "cache" / "index.json"
+        src = tmp_path / "src.txt"
+        src.write_text("foo")
+        stale = tmp_path / "stale.txt"
+        stale.write_text("foo")
+        obj = LocalHashIndex(index_path)
+        obj.md5(stale)
+        obj.save()
+        assert str(stale) in json.loads(index_path.read_text())
+
+        obj = LocalHashIndex(index_path)
+        obj.md5(src)
+        obj.save()
+        assert list(json.loads(index_path.read_text())) == [str(src)]
+        assert not list(index_path.parent.glob("*.tmp"))
+
+        mock_md5 = mocker.patch(f"{MODULE}.hashlib.md5")
+        assert LocalHashIndex(index_path).md5(src) == FOO_MD5
+        mock_md5.assert_not_called()
+
+    def test_save_no_path(self, tmp_path: Path) -> None:
+        """Test save when the index is only stored in memory."""
+        src = tmp_path / "src.txt"
+        src.write_text("foo")
+        obj = LocalHashIndex()
+        obj.md5(src)
+        assert not obj.save()
+        assert [i.name for i in tmp_path.iterdir()] == ["src.txt"]
+
+    def test_load_invalid(self, caplog: pytest.LogCaptureFixture, tmp_path: Path) -> None:
+        """Test an invalid index is ignored."""
+        caplog.set_level(logging.DEBUG, logger=MODULE.replace("._", "."))
+        index_path = tmp_path / "index.json"
+        index_path.write_text("invalid")
+        src = tmp_path / "src.txt"
+        src.write_text("foo")
+        assert LocalHashIndex(index_path).md5(src) == FOO_MD5
+        assert f"ignoring invalid hash index: {index_path}" in caplog.messages
+
+
+def test_get_hash_index(tmp_path: Path) -> None:
+    """Test get_hash_index."""
+    result = get_hash_index(tmp_path / "index.json")
+    assert result.path == tmp_path / "index.json"
+    assert get_hash_index(tmp_path / "index.json") is result
+    assert get_hash_index(tmp_path / "other.json") is not result
@@ -0,0 +1,260 @@
+"""Test runway.core.providers.aws.s3._helpers.manifest."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from runway.core.providers.aws.s3._helpers.file_info import FileInfo
+from runway.core.providers.aws.s3._helpers.manifest import (
+    MANIFEST_GENERATION_TAG_KEY,
+    SyncManifest,
+    SyncManifestStore,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MODULE = "runway.core.providers.aws.s3._helpers.manifest"
+
+LAST_MODIFIED = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def build_manifest(**kwargs: object) -> SyncManifest:
+    """Build a complete manifest."""
+    return SyncManifest(
+        "bucket",
+        "prefix/",
+        objects={
+            "prefix/a.txt": {
+                "ETag": '"abc"',
+                "Key": "prefix/a.txt",
+                "LastModified": LAST_MODIFIED,
+                "Size": 13,
+            }
+        },
+        **kwargs,  # type: ignore
+    )
+
+
+class TestSyncManifest:
+    """Test SyncManifest."""
+
+    def test_to_dict_from_dict(self) -> None:
+        """Test to_dict and from_dict."""
+        manifest = build_manifest()
+        result = SyncManifest.from_dict(
+            json.loads(json.dumps(manifest.to_dict())), "bucket", "prefix/", generation="gen"
+        )
+        assert result
+        assert result.complete
+        assert result.generation == "gen"
+        assert result.to_dict() == manifest.to_dict()
+        assert list(result.list_objects(Mock(), bucket="bucket", prefix="prefix/")) == list(
+            manifest.list_objects(Mock(), bucket="bucket", prefix="prefix/")
+        )
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {},
+            {"objects": [], "version": 0},
+            {"objects": [["key"]], "version": 1},
+            {"objects": [["key", 1, "", "invalid"]], "version": 1},
+            {"objects": None, "version": 1},
+            {"version": 1},
+        ],
+    )
+    def test_from_dict_invalid(self, data: dict[str, Any]) -> None:
+        """Test from_dict invalid data."""
+        assert not SyncManifest.from_dict(data, "bucket")
+
+    def test_key(self) -> None:
+        """Test key."""
+        assert SyncManifest("bucket").key == SyncManifest.MARKER_NAME
+        assert SyncManifest("bucket", "prefix/").key == f"prefix/{SyncManifest.MARKER_NAME}"
+
+    def test_list_objects_complete(self) -> None:
+        """Test list_objects when the manifest is complete."""
+        lister = Mock()
+        assert list(build_manifest().list_objects(lister, bucket="bucket", prefix="prefix/")) == [
+            (
+                "bucket/prefix/a.txt",
+                {"ETag": '"abc"', "Key": "prefix/a.txt", "LastModified": LAST_MODIFIED, "Size": 13},
+            )
+        ]
+        lister.list_objects.assert_not_called()
+
+    def test_list_objects_incomplete(self) -> None:
+        """Test list_objects when the manifest is incomplete."""
+        objects = [
+            ("bucket/prefix/.runway-sync-manifest", {"Key": "prefix/.runway-sync-manifest"}),
+            ("bucket/prefix/b.txt", {"Key": "prefix/b.txt", "LastModified": LAST_MODIFIED}),
+        ]
+        lister = Mock(list_objects=Mock(return_value=objects))
+        manifest = SyncManifest("bucket", "prefix/")
+        assert not manifest.complete
+        assert list(
+            manifest.list_objects(lister, bucket="bucket", prefix="prefix/", page_size=5)
+        ) == [objects[1]]
+        lister.list_objects.assert_called_once_with(
+            bucket="bucket", prefix="prefix/", page_size=5, extra_args=None
+        )
+        assert manifest.complete
+        assert [i[0] for i in manifest.to_dict()["objects"]] == ["prefix/b.txt"]
+
+    def test_list_objects_other_prefix(self) -> None:
+        """Test list_objects of a prefix the manifest is not for."""
+        lister = Mock(list_objects=Mock(return_value=[]))
+        manifest = build_manifest()
+        assert not list(manifest.list_objects(lister, bucket="bucket", prefix="other/"))
+        lister.list_objects.assert_called_once()
+        assert not manifest.complete
+
+    def test_record(self, tmp_path: Path) -> None:
+        """Test record."""
+        src = tmp_path / "b.txt"
+        src.write_text("hello")
+        hash_index = Mock(md5=Mock(return_value="md5"))
+        manifest = build_manifest(hash_index=hash_index)
+        manifest.record(
+            FileInfo(src=src, dest="bucket/prefix/b.txt", operation_name="upload", size=5)
+        )
+        manifest.record(
+            FileInfo(
+                src="bucket/prefix/a.txt",
+                dest=tmp_path / "a.txt",
+                operation_name="delete",
+                src_type="s3",
+            )
+        )
+        hash_index.md5.assert_called_once_with(src)
+        assert manifest.to_dict()["objects"] == [
+            ["prefix/b.txt", 5, '"md5"', manifest._started.isoformat()]
+        ]
+
+    def test_record_no_hash_index(self) -> None:
+        """Test record without a hash index."""
+        manifest = SyncManifest("bucket", objects={})
+        manifest.record(FileInfo(src="a.txt", dest="bucket/a.txt", operation_name="upload"))
+        assert manifest.to_dict()["objects"] == [["a.txt", 0, "", manifest._started.isoformat()]]
+
+
+class TestSyncManifestStore:
+    """Test SyncManifestStore."""
+
+    def test_cache_path(self, tmp_path: Path) -> None:
+        """Test cache_path."""
+        assert SyncManifestStore(Mock(), "bucket", "", tmp_path).cache_path != (
+            SyncManifestStore(Mock(), "bucket", "prefix/", tmp_path).cache_path
+        )
+
+    def test_invalidate(self, tmp_path: Path) -> None:
+        """Test invalidate."""
+        client = Mock()
+        store = SyncManifestStore(client, "bucket", "prefix/", tmp_path)
+        store.invalidate(SyncManifest("bucket", "prefix/"))
+        client.delete_object.assert_not_called()
+        store.invalidate(build_manifest(generation="gen"))
+        client.delete_object.assert_called_once_with(
+            Bucket="bucket", Key="prefix/.runway-sync-manifest"
+        )
+
+    def test_load(self, tmp_path: Path) -> None:
+        """Test load."""
+        client = Mock(
+            get_object_tagging=Mock(
+                return_value={"TagSet": [{"Key": MANIFEST_GENERATION_TAG_KEY, "Value": "gen"}]}
+            )
+        )
+        store = SyncManifestStore(client, "bucket", "prefix/", tmp_path)
+        store._write_cache(build_manifest(generation="gen"))
+        result = store.load()
+        assert result.complete
+        assert result.generation == "gen"
+        assert result.to_dict() == build_manifest().to_dict()
+        client.get_object_tagging.assert_called_once_with(
+            Bucket="bucket", Key="prefix/.runway-sync-manifest"
+        )
+
+    def test_load_generation_mismatch(self, tmp_path: Path) -> None:
+        """Test load when the bucket was synced by something else."""
+        client = Mock(
+            get_object_tagging=Mock(
+                return_value={"TagSet": [{"Key": MANIFEST_GENERATION_TAG_KEY, "Value": "new"}]}
+            )
+        )
+        store = SyncManifestStore(client, "bucket", "prefix/", tmp_path)
+        store._write_cache(build_manifest(generation="old"))
+        result = store.load()
+        assert not result.complete
+        assert not result.generation
+
+    def test_load_invalid_cache(self, tmp_path: Path) -> None:
+        """Test load when the local cache is invalid."""
+        client = Mock(
+            get_object_tagging=Mock(
+                return_value={"TagSet": [{"Key": MANIFEST_GENERATION_TAG_KEY, "Value": "gen"}]}
+            )
+        )
+        store = SyncManifestStore(client, "bucket", "prefix/", tmp_path)
+        store.cache_path.write_text("invalid")
+        assert not store.load().complete
+
+    def test_load_no_generation(self, tmp_path: Path) -> None:
+        """Test load when the marker object is not tagged with a generation."""
+        client = Mock(get_object_tagging=Mock(return_value={"TagSet": []}))
+        store = SyncManifestStore(client, "bucket", "prefix/", tmp_path)
+        store._write_cache(build_manifest())
+        assert not store.load().complete
+
+    def test_load_not_found(self, tmp_path: Path) -> None:
+        """Test load when there is no marker object."""
+        client = Mock(
+            get_object_tagging=Mock(
+                side_effect=ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObjectTagging")
+            )
+        )
+        store = SyncManifestStore(client, "bucket", "prefix/", tmp_path)
+        store._write_cache(build_manifest(generation="gen"))
+        result = store.load()
+        assert not result.complete
+        assert not result.generation
+
+    def test_save(self, tmp_path: Path) -> None:
+        """Test save."""
+        client = Mock()
+        store = SyncManifestStore(client, "bucket", "prefix/", tmp_path / "cache")
+        manifest = build_manifest(generation="old")
+        store.save(manifest)
+        assert manifest.generation
+        assert manifest.generation != "old"
+        client.put_object.assert_called_once_with(
+            Body=b"",
+            Bucket="bucket",
+            Key="prefix/.runway-sync-manifest",
+            Tagging=f"{MANIFEST_GENERATION_TAG_KEY}={manifest.generation}",
+        )
+        assert json.loads(store.cache_path.read_text()) == {
+            "generation": manifest.generation,
+            **manifest.to_dict(),
+        }
+
+    def test_save_client_error(self, caplog: pytest.LogCaptureFixture, tmp_path: Path) -> None:
+        """Test save when the marker object can't be written."""
+        caplog.set_level(logging.WARNING, logger=MODULE.replace("._", "."))
+        client = Mock(
+            put_object=Mock(
+                side_effect=ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject")
+            )
+        )
+        store = SyncManifestStore(client, "bucket", "prefix/", tmp_path)
+        store.save(build_manifest())
+        assert store.cache_path.exists()
+        assert "unable to write sync manifest marker s3://bucket/prefix/" in caplog.text
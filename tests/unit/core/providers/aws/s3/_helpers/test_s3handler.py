@@ -11,6 +11,7 @@ import pytest
 from s3transfer.manager import TransferManager
 
 from runway.core.providers.aws.s3._helpers.file_info import FileInfo
+from runway.core.providers.aws.s3._helpers.hash_index import CONTENT_HASH_METADATA_KEY
 from runway.core.providers.aws.s3._helpers.parameters import ParametersDataModel
 from runway.core.providers.aws.s3._helpers.results import (
     CommandResultRecorder,
@@ -30,6 +31,7 @@ from runway.core.providers.aws.s3._helpers.results import (
 )
 from runway.core.providers.aws.s3._helpers.s3handler import (
     BaseTransferRequestSubmitter,
+    BatchDeleteRequestSubmitter,
     CopyRequestSubmitter,
     DeleteRequestSubmitter,
     DownloadRequestSubmitter,
@@ -77,6 +79,7 @@ class MockSubmitters(NamedTuple):
 def mock_submitters(mocker: MockerFixture) -> MockSubmitters:
     """Mock handler submitters."""
     classes = {
+        "batch_delete": mocker.patch(f"{MODULE}.BatchDeleteRequestSubmitter", Mock()),
         "copy": mocker.patch(f"{MODULE}.CopyRequestSubmitter", Mock()),
         "delete": mocker.patch(f"{MODULE}.DeleteRequestSubmitter", Mock()),
         "download": mocker.patch(f"{MODULE}.DownloadRequestSubmitter", Mock()),
@@ -669,6 +672,41 @@ class TestDownloadStreamRequestSubmitter(BaseTransferRequestSubmitterTest):
         assert result.dest == "-"
 
 
+class TestBatchDeleteRequestSubmitter(BaseTransferRequestSubmitterTest):
+    """Test BatchDeleteRequestSubmitter."""
+
+    def test_submit(self) -> None:
+        """Test submit."""
+        self.transfer_manager.client.delete_objects.return_value = {
+            "Errors": [{"Key": "key1", "Code": "AccessDenied", "Message": "Access Denied"}]
+        }
+        self.transfer_manager.config.max_request_concurrency = 2
+        submitter = BatchDeleteRequestSubmitter(
+            self.transfer_manager, self.result_queue, self.config_params
+        )
+        for key in ["key0", "key1"]:
+            assert submitter.submit(
+                FileInfo(src=f"{self.bucket}/{key}", dest=None, operation_name="delete")
+            )
+        self.transfer_manager.client.delete_objects.assert_not_called()
+        submitter.flush()
+        self.transfer_manager.delete.assert_not_called()
+        self.transfer_manager.client.delete_objects.assert_called_once_with(
+            Bucket=self.bucket,
+            Delete={"Objects": [{"Key": "key0"}, {"Key": "key1"}], "Quiet": True},
+        )
+        results = [self.result_queue.get() for _ in range(4)]
+        assert [type(i) for i in results] == [
+            QueuedResult,
+            QueuedResult,
+            SuccessResult,
+            FailureResult,
+        ]
+        assert [i.src for i in results] == [f"s3://{self.bucket}/key{i}" for i in [0, 1, 0, 1]]
+        assert all(i.transfer_type == "delete" for i in results)
+        assert "AccessDenied" in str(results[3].exception)
+
+
 class TestLocalDeleteRequestSubmitter(BaseTransferRequestSubmitterTest):
     """Test LocalDeleteRequestSubmitter."""
 
@@ -780,6 +818,7 @@ class TestS3TransferHandler:
         assert handler.call(fileinfos) == "success"  # type: ignore
         mock_submitters.instances["copy"].can_submit.assert_called_once_with(fileinfos[0])
         mock_submitters.instances["copy"].submit.assert_called_once_with(fileinfos[0])
+        mock_submitters.instances["batch_delete"].flush.assert_called_once_with()
         self.result_command_recorder.notify_total_submissions.assert_called_once_with(1)  # type: ignore
         self.result_command_recorder.get_command_result.assert_called_once_with()  # type: ignore
 
@@ -898,6 +937,38 @@ class TestUploadRequestSubmitter(BaseTransferRequestSubmitterTest):
         for i, actual_subscriber in enumerate(actual_subscribers):
             assert isinstance(actual_subscriber, ref_subscribers[i])
 
+    def test_submit_content_hash(self, tmp_path: Path) -> None:
+        """Test submit."""
+        src = tmp_path / self.filename
+        src.write_text("foo")
+        fileinfo = FileInfo(src=src, dest=self.bucket + "/" + self.key)
+        self.config_params["content_hash"] = True
+        self.transfer_request_submitter.submit(fileinfo)
+
+        call_kwargs = cast(dict[str, Any], self.transfer_manager.upload.call_args[1])
+        assert call_kwargs["extra_args"] == {
+            "Metadata": {CONTENT_HASH_METADATA_KEY: "acbd18db4cc2f85cedef654fccc4a4d8"}
+        }
+
+    def test_submit_content_hash_metadata(self, tmp_path: Path) -> None:
+        """Test _submit_transfer_request keeps the metadata of the request."""
+        src = tmp_path / self.filename
+        src.write_text("foo")
+        self.config_params["content_hash"] = True
+        self.transfer_request_submitter._submit_transfer_request(
+            FileInfo(src=src, dest=self.bucket + "/" + self.key),
+            {"Metadata": {"foo": "bar"}},
+            [],
+        )
+
+        call_kwargs = cast(dict[str, Any], self.transfer_manager.upload.call_args[1])
+        assert call_kwargs["extra_args"] == {
+            "Metadata": {
+                CONTENT_HASH_METADATA_KEY: "acbd18db4cc2f85cedef654fccc4a4d8",
+                "foo": "bar",
+            }
+        }
+
     def test_submit_content_type_specified(self) -> None:
         """Test submit."""
         fileinfo = FileInfo(src=self.filename, dest=self.bucket + "/" + self.key)
@@ -8,6 +8,7 @@ import ntpath
 import os
 import platform
 import posixpath
+import threading
 import time
 from io import BytesIO
 from pathlib import Path
@@ -46,6 +47,7 @@ from runway.core.providers.aws.s3._helpers.utils import (
     ProvideUploadContentTypeSubscriber,
     RequestParamsMapper,
     SetFileUtimeError,
+    ShardedBucketLister,
     StdoutBytesWriter,
     _date_parser,
     block_s3_object_lambda,
@@ -68,6 +70,8 @@ from .factories import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from pytest_mock import MockerFixture
 
 MODULE = "runway.core.providers.aws.s3._helpers.utils"
@@ -165,6 +169,142 @@ class TestBucketLister:
         )
 
 
+class FakeListClient:
+    """S3 client that lists a fixed set of keys like ListObjectsV2."""
+
+    def __init__(self, keys: list[str], delay: float = 0.0) -> None:
+        """Instantiate class."""
+        self.active = 0
+        self.calls: list[dict[str, Any]] = []
+        self.delay = delay
+        self.keys = sorted(keys)
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get_paginator(self, _name: str) -> Mock:
+        """Get a paginator for list_objects_v2."""
+
+        def paginate(**kwargs: Any) -> Generator[dict[str, Any], None, None]:
+            page = self.list_objects_v2(**kwargs)
+            yield page
+            while page["IsTruncated"]:
+                page = self.list_objects_v2(
+                    **kwargs, ContinuationToken=page["NextContinuationToken"]
+                )
+                yield page
+
+        return Mock(paginate=paginate)
+
+    def list_objects_v2(
+        self,
+        *,
+        ContinuationToken: str = "",  # noqa: N803
+        Delimiter: str = "",  # noqa: N803
+        MaxKeys: int = 1000,  # noqa: N803
+        Prefix: str = "",  # noqa: N803
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """List objects."""
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append({"Delimiter": Delimiter, "Prefix": Prefix, **kwargs})
+        time.sleep(self.delay)
+        # common prefixes count towards MaxKeys like they do in S3
+        entries: dict[str, dict[str, Any]] = {}
+        for key in self.keys:
+            if not key.startswith(Prefix):
+                continue
+            if Delimiter and Delimiter in key[len(Prefix) :]:
+                common_prefix = key[: key.index(Delimiter, len(Prefix)) + 1]
+                entries[common_prefix] = {"Prefix": common_prefix}
+            else:
+                entries[key] = {"Key": key, "LastModified": "2014-02-27T04:20:38.000Z", "Size": 1}
+        page = sorted(i for i in entries if i > ContinuationToken)[:MaxKeys]
+        with self._lock:
+            self.active -= 1
+        return {
+            "CommonPrefixes": [entries[i] for i in page if "Prefix" in entries[i]],
+            "Contents": [entries[i] for i in page if "Key" in entries[i]],
+            "IsTruncated": bool(page) and page[-1] != max(entries),
+            "NextContinuationToken": page[-1] if page else "",
+        }
+
+
+class TestShardedBucketLister:
+    """Test ShardedBucketLister."""
+
+    keys: ClassVar[list[str]] = [
+        "a.txt",
+        "a/b.txt",
+        "a/c/d.txt",
+        "a/c/e.txt",
+        "a0",
+        "b/a.txt",
+        "b/b.txt",
+        "b/c.txt",
+        "b/d/e.txt",
+        "b/d0",
+        "c.txt",
+        "\u00e9/a.txt",
+        "\u00e9a",
+    ]
+
+    @pytest.mark.parametrize("max_workers", [2, 3, 10])
+    @pytest.mark.parametrize("page_size", [None, 1, 2])
+    def test_list_objects(self, max_workers: int, page_size: int | None) -> None:
+        """Test list_objects."""
+        client = FakeListClient(self.keys)
+        result = list(
+            ShardedBucketLister(
+                client, Mock(return_value=sentinel.now), max_workers=max_workers  # type: ignore
+            ).list_objects(bucket="foo", page_size=page_size)
+        )
+        assert [i[0] for i in result] == [f"foo/{i}" for i in sorted(self.keys)]
+        assert all(i[1]["LastModified"] is sentinel.now for i in result)
+        assert result == list(
+            BucketLister(
+                FakeListClient(self.keys), Mock(return_value=sentinel.now)  # type: ignore
+            ).list_objects(bucket="foo", page_size=page_size)
+        )
+
+    def test_list_objects_concurrent(self) -> None:
+        """Test list_objects lists shards concurrently."""
+        client = FakeListClient([f"{i}/{j}.txt" for i in range(8) for j in range(4)], delay=0.05)
+        result = list(
+            ShardedBucketLister(client, max_workers=8).list_objects(  # type: ignore
+                bucket="foo", page_size=2
+            )
+        )
+        assert len(result) == 32
+        assert client.max_active > 1
+
+    def test_list_objects_many_prefixes(self, mocker: MockerFixture) -> None:
+        """Test list_objects only lists a limited number of prefixes ahead."""
+        keys = [f"{i:03d}/{j}.txt" for i in range(50) for j in range(3)]
+        spy_list_shard = mocker.spy(ShardedBucketLister, "_list_shard")
+        result = ShardedBucketLister(FakeListClient(keys), max_workers=4).list_objects(  # type: ignore
+            bucket="foo", page_size=2
+        )
+        assert next(result) == ("foo/000/0.txt", mocker.ANY)
+        # the prefix listed with a delimiter, the prefix being consumed, and the window
+        assert spy_list_shard.call_count == 6
+        assert [i[0] for i in result] == [f"foo/{i}" for i in keys[1:]]
+        assert spy_list_shard.call_count == 51
+
+    def test_list_objects_pass_extra_args_prefix(self) -> None:
+        """Test list_objects."""
+        client = FakeListClient(self.keys)
+        result = list(
+            ShardedBucketLister(client, max_workers=4).list_objects(  # type: ignore
+                bucket="foo", prefix="b/", extra_args={"RequestPayer": "requester"}
+            )
+        )
+        assert [i[0] for i in result] == [f"foo/{i}" for i in self.keys if i.startswith("b/")]
+        assert all(i["RequestPayer"] == "requester" for i in client.calls)
+        assert all(i["Prefix"].startswith("b/") for i in client.calls)
+
+
 class TestDeleteCopySourceObjectSubscriber:
     """Test DeleteCopySourceObjectSubscriber."""
 
@@ -323,11 +323,13 @@ class TestBucket:
         )
         mock_handler_class.assert_called_once_with(
             context=runway_context,
+            content_hash=False,
             delete=True,
             dest="s3://test-bucket/prefix",
             exclude=["something"],
             follow_symlinks=False,
             include=None,
+            manifest=False,
             session=obj.session,
             src=src_directory,
         )
@@ -5,9 +5,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest.mock import Mock
 
+import pytest
+
 from runway.core.providers.aws.s3._sync_handler import S3SyncHandler
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest_mock import MockerFixture
 
     from .....factories import MockRunwayContext
@@ -39,9 +43,74 @@ class TestS3SyncHandler:
             action="sync",
             parameters=obj.parameters.data,
             runtime_config=transfer_config,
+            manifest=None,
         )
         mock_action().run.assert_called_once_with()
 
+    def test_run_content_hash(
+        self, mocker: MockerFixture, runway_context: MockRunwayContext
+    ) -> None:
+        """Test run with content_hash."""
+        mocker.patch(f"{MODULE}.register_sync_strategies")
+        mock_action = mocker.patch(f"{MODULE}.ActionArchitecture")
+        mock_action.return_value.run.side_effect = RuntimeError
+        mock_get_hash_index = mocker.patch(f"{MODULE}.get_hash_index")
+        obj = S3SyncHandler(runway_context, content_hash=True, dest="", src="")
+        assert obj.parameters.data.content_hash
+        assert (
+            obj.parameters.data.content_hash_index
+            == runway_context.work_dir / "cache" / "s3_sync" / "content_hash_index.json"
+        )
+        with pytest.raises(RuntimeError):
+            obj.run()
+        mock_get_hash_index.assert_called_once_with(obj.parameters.data.content_hash_index)
+        mock_get_hash_index.return_value.save.assert_called_once_with()
+
+    @pytest.mark.parametrize("return_code", [0, 1])
+    def test_run_manifest(
+        self,
+        mocker: MockerFixture,
+        return_code: int,
+        runway_context: MockRunwayContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test run with manifest."""
+        mocker.patch(f"{MODULE}.register_sync_strategies")
+        mock_action = mocker.patch(f"{MODULE}.ActionArchitecture")
+        mock_action.return_value.run.return_value = return_code
+        runway_context.add_stubber("s3")
+        mock_store_class = mocker.patch(f"{MODULE}.SyncManifestStore")
+        store = mock_store_class.return_value
+        store.load.return_value.complete = True
+        obj = S3SyncHandler(
+            runway_context, dest="s3://bucket/prefix", manifest=True, src=str(tmp_path)
+        )
+        assert not obj.run()
+        mock_store_class.assert_called_once_with(
+            obj.client,
+            "bucket",
+            "prefix/",
+            runway_context.work_dir / "cache" / "s3_sync" / "manifests",
+            hash_index=None,
+        )
+        store.invalidate.assert_called_once_with(store.load.return_value)
+        assert mock_action.call_args.kwargs["manifest"] == store.load.return_value
+        if return_code:
+            store.save.assert_not_called()
+        else:
+            store.save.assert_called_once_with(store.load.return_value)
+
+    def test_manifest_store_not_upload(
+        self, runway_context: MockRunwayContext, tmp_path: Path
+    ) -> None:
+        """Test manifest_store is not used when not uploading."""
+        assert not S3SyncHandler(
+            runway_context, dest=str(tmp_path), manifest=True, src="s3://bucket/prefix"
+        ).manifest_store
+        assert not S3SyncHandler(
+            runway_context, dest="s3://bucket/prefix", src=str(tmp_path)
+        ).manifest_store
+
     def test_transfer_config(
         self, mocker: MockerFixture, runway_context: MockRunwayContext
     ) -> None:
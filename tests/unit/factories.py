@@ -229,6 +229,37 @@ class MockCfnginContext(CfnginContext):
             )
         return self._boto3_sessions[region]
 
+    def get_client(
+        self,
+        service_name: str,
+        *,
+        aws_access_key_id: str | None = None,
+        aws_secret_access_key: str | None = None,
+        aws_session_token: str | None = None,
+        profile: str | None = None,
+        region: str | None = None,
+    ) -> Any:
+        """Wrap get_client to return the stubbed client without pooling it.
+
+        A stubber must exist before ``get_client`` is called or an error will be raised.
+
+        Args:
+            service_name: The name of the service.
+            aws_access_key_id: AWS Access Key ID.
+            aws_secret_access_key: AWS secret Access Key.
+            aws_session_token: AWS session token.
+            profile: The profile for the session.
+            region: The region for the session.
+
+        """
+        return self.get_session(
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            aws_session_token=aws_session_token,
+            profile=profile,
+            region=region,
+        ).client(service_name)
+
     def get_session(
         self,
         *,
@@ -393,6 +424,37 @@ class MockRunwayContext(RunwayContext):
             )
         return self._boto3_sessions[region]
 
+    def get_client(
+        self,
+        service_name: str,
+        *,
+        aws_access_key_id: str | None = None,
+        aws_secret_access_key: str | None = None,
+        aws_session_token: str | None = None,
+        profile: str | None = None,
+        region: str | None = None,
+    ) -> Any:
+        """Wrap get_client to return the stubbed client without pooling it.
+
+        A stubber must exist before ``get_client`` is called or an error will be raised.
+
+        Args:
+            service_name: The name of the service.
+            aws_access_key_id: AWS Access Key ID.
+            aws_secret_access_key: AWS secret Access Key.
+            aws_session_token: AWS session token.
+            profile: The profile for the session.
+            region: The region for the session.
+
+        """
+        return self.get_session(
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            aws_session_token=aws_session_token,
+            profile=profile,
+            region=region,
+        ).client(service_name)
+
     def get_session(
         self,
         *,
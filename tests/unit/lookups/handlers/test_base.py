@@ -3,15 +3,44 @@
 from __future__ import annotations
 
 import json
+from typing import TYPE_CHECKING, Any, ClassVar
 from unittest.mock import MagicMock
 
 import pytest
 import yaml
 
+from runway.lookups.cache import LOOKUP_CACHE_STATS, LookupCachePolicy
 from runway.lookups.handlers.base import LookupHandler
 from runway.utils import MutableMap
 from runway.variables import VariableValue
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+    from ...factories import MockRunwayContext
+
+
+class CachedLookup(LookupHandler[Any]):
+    """Lookup with cached results."""
+
+    CACHE_POLICY: ClassVar[LookupCachePolicy | None] = LookupCachePolicy()
+    TYPE_NAME: ClassVar[str] = "test.cached"
+    calls: ClassVar[int] = 0
+
+    @classmethod
+    def handle(cls, value: str, *_args: Any, **_kwargs: Any) -> Any:
+        """Perform the lookup."""
+        cls.calls += 1
+        return f"{value}-{cls.calls}"
+
+
+@pytest.fixture(autouse=True)
+def reset_cached_lookup(mocker: MockerFixture) -> None:
+    """Reset the number of times CachedLookup was called."""
+    mocker.patch.object(CachedLookup, "calls", 0)
+
 
 class TestLookupHandler:
     """Tests for LookupHandler."""
@@ -82,6 +111,60 @@ class TestLookupHandler:
         else:  # value should be returned "as is"
             assert LookupHandler.format_results(value, transform="str") == value
 
+    def test_prefetch(self) -> None:
+        """Test prefetch."""
+        with LookupHandler.prefetch(["something"], MagicMock()) as result:
+            assert result is None
+
+    def test_cache_invalidation_key(self, runway_context: MockRunwayContext) -> None:
+        """Test cache_invalidation_key."""
+        runway_context.env.vars["AWS_ACCESS_KEY_ID"] = "foo"
+        assert LookupHandler.cache_invalidation_key("something", runway_context) == (
+            runway_context.env.aws_region,
+            runway_context.env.aws_profile,
+            "foo",
+        )
+
+    @pytest.mark.parametrize("scope", ["context", "disk", "run"])
+    def test_handle_cached(
+        self,
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+        scope: str,
+        tmp_path: Path,
+    ) -> None:
+        """Test handle_cached."""
+        mocker.patch.object(CachedLookup, "CACHE_POLICY", LookupCachePolicy(scope=scope))
+        runway_context.work_dir = tmp_path
+        hits, misses = LOOKUP_CACHE_STATS.get(CachedLookup.TYPE_NAME)
+        assert CachedLookup.handle_cached("foo", runway_context) == "foo-1"
+        assert CachedLookup.handle_cached("foo", runway_context) == "foo-1"
+        assert CachedLookup.handle_cached("bar", runway_context) == "bar-2"
+        assert LOOKUP_CACHE_STATS.get(CachedLookup.TYPE_NAME) == (hits + 1, misses + 2)
+        assert bool(list(tmp_path.glob("cache/lookups/*.json"))) is (scope == "disk")
+
+    def test_handle_cached_invalidated(self, runway_context: MockRunwayContext) -> None:
+        """Test handle_cached when the cache invalidation key changes."""
+        assert CachedLookup.handle_cached("foo", runway_context) == "foo-1"
+        runway_context.env.aws_region = "us-west-2"
+        assert CachedLookup.handle_cached("foo", runway_context) == "foo-2"
+
+    def test_handle_cached_no_policy(
+        self, mocker: MockerFixture, runway_context: MockRunwayContext
+    ) -> None:
+        """Test handle_cached without a cache policy."""
+        mocker.patch.object(CachedLookup, "CACHE_POLICY", None)
+        assert CachedLookup.handle_cached("foo", runway_context) == "foo-1"
+        assert CachedLookup.handle_cached("foo", runway_context) == "foo-2"
+
+    def test_handle_cached_ttl(
+        self, mocker: MockerFixture, runway_context: MockRunwayContext
+    ) -> None:
+        """Test handle_cached with a ttl."""
+        mocker.patch.object(CachedLookup, "CACHE_POLICY", LookupCachePolicy(ttl=0))
+        assert CachedLookup.handle_cached("foo", runway_context) == "foo-1"
+        assert CachedLookup.handle_cached("foo", runway_context) == "foo-2"
+
     def test_load_no_parser(self) -> None:
         """Test load with no parser."""
         assert LookupHandler.load("something") == "something"
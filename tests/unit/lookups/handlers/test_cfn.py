@@ -79,9 +79,8 @@ class TestCfnLookup:
             CfnLookup, "should_use_provider", side_effect=[True, False]
         )
         mock_context = MagicMock(name="context")
-        mock_session = MagicMock(name="session")
-        mock_context.get_session.return_value = mock_session
-        mock_session.client.return_value = mock_session
+        mock_client = MagicMock(name="client")
+        mock_context.get_client.return_value = mock_client
         mock_provider = MagicMock(name="provider")
         mock_provider.get_output.return_value = "provider.success"
 
@@ -100,15 +99,14 @@ class TestCfnLookup:
         mock_provider.get_output.assert_called_once_with(*query)
         mock_should_use.assert_called_once_with({"region": region}, mock_provider)
         mock_format_results.assert_called_once_with("provider.success", region=region)
-        mock_context.get_session.assert_not_called()
+        mock_context.get_client.assert_not_called()
         mock_get_stack_output.assert_not_called()
 
         # test happy path when use from runway (no provider)
         assert CfnLookup.handle(value, context=mock_context) == "success"
         mock_should_use.assert_called_with({"region": region}, None)
-        mock_context.get_session.assert_called_once_with(region=region)
-        mock_session.client.assert_called_once_with("cloudformation")
-        mock_get_stack_output.assert_called_once_with(mock_session, query)
+        mock_context.get_client.assert_called_once_with("cloudformation", region=region)
+        mock_get_stack_output.assert_called_once_with(mock_client, query)
         mock_format_results.assert_called_with("cls.success", region=region)
 
     @pytest.mark.parametrize(
@@ -134,9 +132,8 @@ class TestCfnLookup:
         caplog.set_level(logging.DEBUG, logger="runway.lookups.handlers.cfn")
         mock_should_use = mocker.patch.object(CfnLookup, "should_use_provider", return_value=False)
         mock_context = MagicMock(name="context")
-        mock_session = MagicMock(name="session")
-        mock_context.get_session.return_value = mock_session
-        mock_session.client.return_value = mock_session
+        mock_client = MagicMock(name="client")
+        mock_context.get_client.return_value = mock_client
         mocker.patch.object(CfnLookup, "get_stack_output", MagicMock())
         CfnLookup.get_stack_output.side_effect = exception
 
@@ -161,9 +158,8 @@ class TestCfnLookup:
                 assert excinfo.value.output == "output1"
             mock_should_use.assert_called_once_with({}, None)
 
-        mock_context.get_session.assert_called_once()
-        mock_session.client.assert_called_once_with("cloudformation")
-        CfnLookup.get_stack_output.assert_called_once_with(mock_session, query)
+        mock_context.get_client.assert_called_once_with("cloudformation", region=None)
+        CfnLookup.get_stack_output.assert_called_once_with(mock_client, query)
 
     @pytest.mark.parametrize(
         "exception, default",
@@ -10,6 +10,7 @@ import pytest
 import yaml
 
 from runway.exceptions import FailedVariableLookup
+from runway.lookups.handlers.ssm import SsmLookup
 from runway.variables import Variable
 
 if TYPE_CHECKING:
@@ -220,3 +221,78 @@ class TestSsmLookup:
             var.resolve(context=runway_context)
             assert var.value == value
         stubber.assert_no_pending_responses()
+
+    def test_prefetch(self, runway_context: MockRunwayContext) -> None:
+        """Test prefetch."""
+        stubber = runway_context.add_stubber("ssm")
+        variables = [
+            Variable("a", "${ssm /test/a}", variable_type="runway"),
+            Variable("b", "${ssm /test/b::default=default}", variable_type="runway"),
+            Variable("c", "${ssm /test/c:2}", variable_type="runway"),
+        ]
+        stubber.add_response(
+            "get_parameters",
+            {
+                "Parameters": [
+                    {"Name": "/test/a", "Type": "String", "Value": "a"},
+                    {"Name": "/test/c", "Selector": ":2", "Type": "StringList", "Value": "c,d"},
+                ],
+                "InvalidParameters": ["/test/b"],
+            },
+            {"Names": ["/test/a", "/test/b", "/test/c:2"], "WithDecryption": True},
+        )
+        stubber.add_client_error(
+            "get_parameter",
+            "ParameterNotFound",
+            expected_params=get_parameter_request("/test/b"),
+        )
+
+        with (
+            stubber,
+            SsmLookup.prefetch(
+                ["/test/a", "/test/b::default=default", "/test/c:2"], runway_context
+            ),
+        ):
+            for variable in variables:
+                variable.resolve(runway_context)
+        stubber.assert_no_pending_responses()
+        assert [v.value for v in variables] == ["a", "default", ["c", "d"]]
+        assert not runway_context.lookup_prefetch["ssm"]
+
+    def test_prefetch_client_error(self, runway_context: MockRunwayContext) -> None:
+        """Test prefetch falls back to get_parameter."""
+        stubber = runway_context.add_stubber("ssm")
+        names = ["/test/a", "/test/b"]
+        stubber.add_client_error("get_parameters", "AccessDeniedException")
+        for name in names:
+            stubber.add_response(
+                "get_parameter", get_parameter_response(name, name), get_parameter_request(name)
+            )
+
+        with stubber, SsmLookup.prefetch(names, runway_context):
+            assert [SsmLookup.handle(name, runway_context) for name in names] == names
+        stubber.assert_no_pending_responses()
+
+    def test_prefetch_regions(self, runway_context: MockRunwayContext) -> None:
+        """Test prefetch groups parameters by region in batches."""
+        names = [f"/test/{i:02d}" for i in range(12)]
+        stubber = runway_context.add_stubber("ssm", region="us-west-2")
+        for batch in [names[:10], names[10:]]:
+            stubber.add_response(
+                "get_parameters",
+                {"Parameters": [{"Name": name, "Value": name} for name in batch]},
+                {"Names": batch, "WithDecryption": True},
+            )
+
+        with stubber:
+            with SsmLookup.prefetch(
+                [f"{name}::region=us-west-2" for name in names] + ["/test/single"],
+                runway_context,
+            ):
+                assert runway_context.lookup_prefetch["ssm"][("us-west-2", "/test/11")] == {
+                    "Name": "/test/11",
+                    "Value": "/test/11",
+                }
+                assert len(runway_context.lookup_prefetch["ssm"]) == len(names)
+            assert not runway_context.lookup_prefetch["ssm"]
+        stubber.assert_no_pending_responses()
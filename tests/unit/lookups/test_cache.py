@@ -0,0 +1,158 @@
+"""Test runway.lookups.cache."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+from pydantic import ValidationError
+
+from runway.lookups.cache import LookupCache, LookupCachePolicy, LookupCacheStats, SingleFlight
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.lookups.cache"
+
+
+class TestLookupCache:
+    """Test LookupCache."""
+
+    def test_clear(self) -> None:
+        """Test clear."""
+        obj = LookupCache()
+        obj.set(("foo",), "bar")
+        obj.clear()
+        assert obj.get(("foo",)) == (False, None)
+
+    def test_disk(self, tmp_path: Path) -> None:
+        """Test results stored on disk."""
+        LookupCache(tmp_path).set(("foo", 1), {"bar": ["baz"]})
+        assert len(list(tmp_path.glob("*.json"))) == 1
+        assert LookupCache(tmp_path).get(("foo", 1)) == (True, {"bar": ["baz"]})
+        assert LookupCache(tmp_path).get(("foo", 2)) == (False, None)
+
+    def test_disk_invalid(self, caplog: pytest.LogCaptureFixture, tmp_path: Path) -> None:
+        """Test invalid results stored on disk are ignored."""
+        caplog.set_level(logging.DEBUG, logger=MODULE)
+        obj = LookupCache(tmp_path)
+        obj.set(("foo",), "bar")
+        next(tmp_path.glob("*.json")).write_text("invalid")
+        assert LookupCache(tmp_path).get(("foo",)) == (False, None)
+        assert "ignoring invalid lookup cache entry" in caplog.text
+
+    def test_disk_not_serializable(self, tmp_path: Path) -> None:
+        """Test results that can't be serialized are only stored in memory."""
+        obj = LookupCache(tmp_path)
+        value = object()
+        obj.set(("foo",), value)
+        assert obj.get(("foo",)) == (True, value)
+        assert not list(tmp_path.iterdir())
+
+    def test_get_set(self) -> None:
+        """Test get and set."""
+        obj = LookupCache()
+        assert obj.get(("foo",)) == (False, None)
+        obj.set(("foo",), None)
+        assert obj.get(("foo",)) == (True, None)
+
+    def test_ttl(self, mocker: MockerFixture) -> None:
+        """Test results expire."""
+        mock_time = mocker.patch(f"{MODULE}.time.time", return_value=100.0)
+        obj = LookupCache()
+        obj.set(("foo",), "bar", ttl=10)
+        mock_time.return_value = 109.0
+        assert obj.get(("foo",)) == (True, "bar")
+        mock_time.return_value = 110.0
+        assert obj.get(("foo",)) == (False, None)
+
+
+class TestLookupCachePolicy:
+    """Test LookupCachePolicy."""
+
+    def test_defaults(self) -> None:
+        """Test default values."""
+        obj = LookupCachePolicy()
+        assert obj.scope == "context"
+        assert obj.ttl is None
+
+    def test_invalid_scope(self) -> None:
+        """Test invalid scope."""
+        with pytest.raises(ValidationError):
+            LookupCachePolicy(scope="invalid")  # type: ignore
+
+
+class TestLookupCacheStats:
+    """Test LookupCacheStats."""
+
+    def test_log(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test log."""
+        caplog.set_level(logging.DEBUG, logger=MODULE)
+        obj = LookupCacheStats()
+        obj.record("foo", hit=False)
+        obj.record("foo", hit=True)
+        obj.record("foo", hit=True)
+        obj.record("foo", hit=True)
+        obj.log()
+        assert obj.get("foo") == (3, 1)
+        assert obj.get("bar") == (0, 0)
+        assert caplog.messages == ["foo lookup cache: 3 hits, 1 misses (75% hit ratio)"]
+
+
+class TestSingleFlight:
+    """Test SingleFlight."""
+
+    def test_do(self) -> None:
+        """Test do."""
+        obj = SingleFlight()
+        assert obj.do("foo", lambda: "bar") == "bar"
+        assert obj.do("foo", lambda: "baz") == "baz"
+
+    def test_do_concurrent(self) -> None:
+        """Test do with concurrent calls sharing a key."""
+        obj = SingleFlight()
+        calls: list[str] = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def func() -> str:
+            calls.append("foo")
+            started.set()
+            release.wait(5)
+            return "bar"
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(obj.do, "foo", func)
+            assert started.wait(5)
+            # count the followers waiting on the call in flight before releasing it
+            in_flight = obj._calls["foo"]
+            waiting = threading.Semaphore(0)
+            wait_for_result = in_flight.result
+
+            def result(timeout: float | None = None) -> str:
+                waiting.release()
+                return wait_for_result(timeout)
+
+            in_flight.result = result  # type: ignore
+            followers = [executor.submit(obj.do, "foo", func) for _ in range(3)]
+            assert all(waiting.acquire(timeout=5) for _ in followers)
+            release.set()
+            assert leader.result() == "bar"
+            assert [i.result() for i in followers] == ["bar"] * 3
+        assert calls == ["foo"]
+
+    def test_do_raise(self) -> None:
+        """Test do when the call raises an exception."""
+        obj = SingleFlight()
+
+        def func() -> str:
+            raise ValueError("foo")
+
+        with pytest.raises(ValueError, match="foo"):
+            obj.do("foo", func)
+        assert obj.do("foo", lambda: "bar") == "bar"
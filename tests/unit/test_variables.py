@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+import threading
 from typing import TYPE_CHECKING, Any, ClassVar
 from unittest.mock import MagicMock, call
 
@@ -29,6 +31,9 @@ from runway.variables import (
     VariableValueLiteral,
     VariableValueLookup,
     VariableValuePydanticModel,
+    _parse_str,
+    prefetch_lookups,
+    resolve_lookups,
     resolve_variables,
 )
 
@@ -78,11 +83,119 @@ def patch_lookups(mocker: MockerFixture) -> None:
         mocker.patch.dict(registry, {"test": MockLookupHandler})
 
 
-def test_resolve_variables(cfngin_context: MockCfnginContext) -> None:
+def test_resolve_lookups(cfngin_context: MockCfnginContext, mocker: MockerFixture) -> None:
+    """Test resolve_lookups."""
+    mock_handle = mocker.patch.object(
+        MockLookupHandler, "handle", side_effect=lambda value, **_: f"{value}-resolved"
+    )
+    variables = [
+        Variable("a", "${test a}"),
+        Variable("b", {"key": ["${test a}", "${test ${test b}}"]}),
+        Variable("c", "literal"),
+    ]
+    assert not resolve_lookups(variables, cfngin_context)
+    assert [v.value for v in variables] == [
+        "a-resolved",
+        {"key": ["a-resolved", "b-resolved-resolved"]},
+        "literal",
+    ]
+    assert mock_handle.call_count == 3
+    mock_handle.assert_has_calls(
+        [
+            call("a", context=cfngin_context, provider=None),
+            call("b", context=cfngin_context, provider=None),
+            call("b-resolved", context=cfngin_context, provider=None),
+        ],
+        any_order=True,
+    )
+
+
+def test_resolve_lookups_concurrent(
+    cfngin_context: MockCfnginContext, mocker: MockerFixture
+) -> None:
+    """Test resolve_lookups resolves lookups concurrently."""
+    barrier = threading.Barrier(3, timeout=5)
+    mocker.patch.object(MockLookupHandler, "handle", side_effect=lambda *_, **__: barrier.wait())
+    variables = [Variable(str(i), f"${{test {i}}}") for i in range(3)]
+    resolve_lookups(variables, cfngin_context, max_workers=3)
+    assert sorted(v.value for v in variables) == [0, 1, 2]
+
+
+def test_resolve_lookups_failed(cfngin_context: MockCfnginContext, mocker: MockerFixture) -> None:
+    """Test resolve_lookups raises FailedVariableLookup for the first variable."""
+    errors = {"b": ValueError("b"), "c": ValueError("c")}
+
+    def handle(value: str, **_: Any) -> str:
+        if value in errors:
+            raise errors[value]
+        return value
+
+    mocker.patch.object(MockLookupHandler, "handle", side_effect=handle)
+    variables = [Variable(name, f"${{test {name}}}") for name in ["a", "c", "b"]]
+    with pytest.raises(FailedVariableLookup) as excinfo:
+        resolve_lookups(variables, cfngin_context)
+    assert excinfo.value.variable is variables[1]
+    assert excinfo.value.cause.cause is errors["c"]
+    assert excinfo.value.__cause__ is errors["c"]
+
+
+def test_resolve_lookups_not_idempotent(
+    cfngin_context: MockCfnginContext, mocker: MockerFixture
+) -> None:
+    """Test resolve_lookups does not deduplicate lookups that are not idempotent."""
+    mocker.patch.object(MockLookupHandler, "IDEMPOTENT", False)
+    mock_handle = mocker.patch.object(MockLookupHandler, "handle", side_effect=["foo", "bar"])
+    variables = [Variable("a", "${test a}"), Variable("b", "${test a}")]
+    resolve_lookups(variables, cfngin_context)
+    assert sorted(v.value for v in variables) == ["bar", "foo"]
+    assert mock_handle.call_count == 2
+
+
+def test_resolve_lookups_repeated(cfngin_context: MockCfnginContext, mocker: MockerFixture) -> None:
+    """Test resolve_lookups resolves lookups again when called more than once."""
+    mocker.patch.object(MockLookupHandler, "handle", side_effect=["foo", "bar"])
+    variable = Variable("a", "${test a}")
+    resolve_lookups([variable], cfngin_context)
+    assert variable.value == "foo"
+    resolve_lookups([variable], cfngin_context)
+    assert variable.value == "bar"
+
+
+def test_resolve_variables(cfngin_context: MockCfnginContext, mocker: MockerFixture) -> None:
     """Test resolve_variables."""
-    variable = MagicMock()
-    assert not resolve_variables([variable], cfngin_context)
-    variable.resolve.assert_called_once_with(context=cfngin_context, provider=None)
+    mock_prefetch = mocker.patch("runway.variables.prefetch_lookups")
+    mock_resolve_lookups = mocker.patch("runway.variables.resolve_lookups")
+    variables = [Variable("a", "${test a}")]
+    assert not resolve_variables(variables, cfngin_context)
+    mock_prefetch.assert_called_once_with(variables, cfngin_context)
+    mock_resolve_lookups.assert_called_once_with(variables, cfngin_context, provider=None)
+
+
+def test_prefetch_lookups(cfngin_context: MockCfnginContext, mocker: MockerFixture) -> None:
+    """Test prefetch_lookups."""
+    prefetch = mocker.patch.object(MockLookupHandler, "prefetch")
+    variables = [
+        Variable("a", "${test a}"),
+        Variable("b", {"key": ["prefix-${test b}", "${test ${test c}}"]}),
+        Variable("c", ExampleModel(test="${test d}")),
+        Variable("d", "literal"),
+    ]
+    with prefetch_lookups(variables, cfngin_context):
+        prefetch.assert_called_once_with(["a", "b", "c", "d"], cfngin_context)
+        prefetch.return_value.__enter__.assert_called_once()
+        prefetch.return_value.__exit__.assert_not_called()
+    prefetch.return_value.__exit__.assert_called_once()
+
+
+def test_prefetch_lookups_resolved(
+    cfngin_context: MockCfnginContext, mocker: MockerFixture
+) -> None:
+    """Test prefetch_lookups skips lookups that have already been resolved."""
+    prefetch = mocker.patch.object(MockLookupHandler, "prefetch")
+    variable = Variable("a", "${test a}")
+    variable.resolve(cfngin_context)
+    with prefetch_lookups([variable], cfngin_context):
+        prefetch.assert_not_called()
 
 
 class TestVariables:
@@ -266,6 +379,39 @@ class TestVariableValue:
         obj = VariableValue()
         assert obj.dependencies == set()
 
+    def test_parse_obj_cached(self, cfngin_context: MockCfnginContext) -> None:
+        """Test parse_obj returns an independent copy of a cached syntax tree."""
+        _parse_str.cache_clear()
+        first = VariableValue.parse_obj("foo ${env AWS_REGION} ${env AWS_REGION}")
+        second = VariableValue.parse_obj("foo ${env AWS_REGION} ${env AWS_REGION}")
+        assert _parse_str.cache_info().hits == 1
+        assert repr(first) == repr(second)
+        assert first is not second
+        first.resolve(cfngin_context)
+        assert first.resolved
+        assert not second.resolved
+        assert all(i is not j for i, j in zip(first, second) if isinstance(i, VariableValueLookup))
+
+    def test_parse_obj_cached_handler_changed(self, mocker: MockerFixture) -> None:
+        """Test parse_obj uses the current handler of cached lookups."""
+        other_handler = type("OtherLookupHandler", (MockLookupHandler,), {})
+        mocker.patch.dict(RUNWAY_LOOKUP_HANDLERS, {"test": MockLookupHandler})
+        assert VariableValue.parse_obj("${test query}", "runway").handler is MockLookupHandler
+        RUNWAY_LOOKUP_HANDLERS["test"] = other_handler
+        assert VariableValue.parse_obj("${test query}", "runway").handler is other_handler
+        del RUNWAY_LOOKUP_HANDLERS["test"]
+        with pytest.raises(UnknownLookupType):
+            VariableValue.parse_obj("${test query}", "runway")
+
+    def test_parse_obj_cached_tokenized_once(self, mocker: MockerFixture) -> None:
+        """Test parsing a string again does not tokenize it again."""
+        value = "prefix-${env AWS_REGION}-${ssm /${env AWS_REGION}/name::region=us-east-1} suffix"
+        _parse_str.cache_clear()
+        mock_split = mocker.spy(re, "split")
+        results = [VariableValue.parse_obj(value) for _ in range(100)]
+        mock_split.assert_called_once()
+        assert len({repr(i) for i in results}) == 1
+
     def test_parse_obj_dict_empty(self) -> None:
         """Test parse_obj dict empty."""
         assert isinstance(VariableValue.parse_obj({}), VariableValueDict)